@@ -13,6 +13,7 @@ from app.database import Base
 # Import all models to ensure they are registered with Base.metadata
 from app.models import (  # noqa: F401
     ComplianceRule,
+    DashboardSummary,
     DatabaseConnection,
     MonitoringConfig,
     Policy,
@@ -28,7 +29,8 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when migrations are run from inside the application.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Get database URL from application settings
@@ -76,6 +78,8 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Fail fast instead of queueing behind long-running transactions
+        connect_args={"options": f"-c lock_timeout={settings.migration_lock_timeout}"},
     )
 
     with connectable.connect() as connection:
@@ -31,7 +31,6 @@ def upgrade() -> None:
         sa.Column('status', sa.String(length=50), nullable=False, default='pending'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_policies_filename', 'policies', ['filename'], unique=False)
     
     # Create compliance_rules table
     op.create_table(
@@ -49,8 +48,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['policy_id'], ['policies.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_compliance_rules_policy_id', 'compliance_rules', ['policy_id'], unique=False)
-    op.create_index('ix_compliance_rules_rule_code', 'compliance_rules', ['rule_code'], unique=False)
     
     # Create violations table
     op.create_table(
@@ -68,9 +65,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['rule_id'], ['compliance_rules.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_violations_rule_id', 'violations', ['rule_id'], unique=False)
-    op.create_index('ix_violations_record_identifier', 'violations', ['record_identifier'], unique=False)
-    op.create_index('ix_violations_status', 'violations', ['status'], unique=False)
     
     # Create review_actions table
     op.create_table(
@@ -84,7 +78,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['violation_id'], ['violations.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_review_actions_violation_id', 'review_actions', ['violation_id'], unique=False)
     
     # Create database_connections table
     op.create_table(
@@ -124,20 +117,33 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
+    # Build secondary indexes outside the migration transaction so that
+    # writes to already-populated tables are not blocked while they build.
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_policies_filename ON policies (filename)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_compliance_rules_policy_id ON compliance_rules (policy_id)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_compliance_rules_rule_code ON compliance_rules (rule_code)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_rule_id ON violations (rule_id)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_record_identifier ON violations (record_identifier)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_status ON violations (status)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_review_actions_violation_id ON review_actions (violation_id)')
+
 
 def downgrade() -> None:
     """Drop all tables in reverse order."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_review_actions_violation_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_violations_status')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_violations_record_identifier')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_violations_rule_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_compliance_rules_rule_code')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_compliance_rules_policy_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_policies_filename')
+
     op.drop_table('monitoring_config')
     op.drop_table('scan_history')
     op.drop_table('database_connections')
-    op.drop_index('ix_review_actions_violation_id', table_name='review_actions')
     op.drop_table('review_actions')
-    op.drop_index('ix_violations_status', table_name='violations')
-    op.drop_index('ix_violations_record_identifier', table_name='violations')
-    op.drop_index('ix_violations_rule_id', table_name='violations')
     op.drop_table('violations')
-    op.drop_index('ix_compliance_rules_rule_code', table_name='compliance_rules')
-    op.drop_index('ix_compliance_rules_policy_id', table_name='compliance_rules')
     op.drop_table('compliance_rules')
-    op.drop_index('ix_policies_filename', table_name='policies')
     op.drop_table('policies')
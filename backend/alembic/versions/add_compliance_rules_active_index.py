@@ -0,0 +1,29 @@
+"""Add partial index on active compliance rules
+
+Revision ID: add_compliance_rules_active_index
+Revises: add_daily_violation_counts
+Create Date: 2026-03-20
+
+Scans load the active rules, optionally restricted to a list of rule IDs
+passed as a single uuid[] parameter (id = ANY($1)). A partial index over
+the active rows serves both forms without touching deactivated rules.
+"""
+from alembic import op
+
+revision = "add_compliance_rules_active_index"
+down_revision = "add_daily_violation_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_compliance_rules_active_id "
+            "ON compliance_rules (is_active, id) WHERE is_active"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_compliance_rules_active_id")
@@ -0,0 +1,36 @@
+"""Add indexes for paging the compliance rules list
+
+Revision ID: add_compliance_rules_list_indexes
+Revises: add_compliance_rules_active_index
+Create Date: 2026-03-21
+
+GET /api/rules pages rules newest first (created_at DESC, id DESC; rules
+extracted from one policy share a created_at) with optional is_active and
+severity filters. (created_at, id) serves the unfiltered list and the
+composite index serves the filtered ones; both are read backwards for the
+DESC order. policy_id filters use the existing foreign key index.
+"""
+from alembic import op
+
+revision = "add_compliance_rules_list_indexes"
+down_revision = "add_compliance_rules_active_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_compliance_rules_created_at "
+            "ON compliance_rules (created_at, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_compliance_rules_active_severity_created_at "
+            "ON compliance_rules (is_active, severity, created_at, id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_compliance_rules_active_severity_created_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_compliance_rules_created_at")
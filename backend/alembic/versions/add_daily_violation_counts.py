@@ -0,0 +1,102 @@
+"""Add trigger-maintained daily_violation_counts rollup
+
+Revision ID: add_daily_violation_counts
+Revises: violations_autovacuum_tuning
+Create Date: 2026-03-14
+
+The dashboard trends re-aggregated raw violations on every request; a 90-day
+window scanned every violation detected or resolved in it. The rollup keeps
+one row per UTC day with the number of violations detected and resolved
+that day, so the trends read at most a few hundred rows.
+
+Like dashboard_summary, it is maintained by statement-level triggers with
+transition tables, so a bulk COPY of violations costs one upsert per
+distinct day. Updates are netted out, so only updates that move
+detected_at or resolved_at write.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "add_daily_violation_counts"
+down_revision = "violations_autovacuum_tuning"
+branch_labels = None
+depends_on = None
+
+
+def _apply_deltas(rows: str) -> str:
+    """Upsert the per-day deltas of ``rows`` (detected_at, resolved_at, n)."""
+    return f"""
+                INSERT INTO daily_violation_counts (day, new_count, resolved_count)
+                SELECT day, sum(new_n), sum(resolved_n)
+                  FROM (SELECT (detected_at AT TIME ZONE 'UTC')::date AS day, n AS new_n, 0 AS resolved_n
+                          FROM ({rows}) r
+                        UNION ALL
+                        SELECT (resolved_at AT TIME ZONE 'UTC')::date, 0, n
+                          FROM ({rows}) r
+                         WHERE resolved_at IS NOT NULL) d
+                 GROUP BY day
+                HAVING sum(new_n) <> 0 OR sum(resolved_n) <> 0
+                ON CONFLICT (day) DO UPDATE
+                   SET new_count = daily_violation_counts.new_count + EXCLUDED.new_count,
+                       resolved_count = daily_violation_counts.resolved_count + EXCLUDED.resolved_count;"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_violation_counts",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("new_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("resolved_count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    new_rows = "SELECT detected_at, resolved_at, 1 AS n FROM new_rows"
+    old_rows = "SELECT detected_at, resolved_at, -1 AS n FROM old_rows"
+
+    # Each branch only touches the transition tables its trigger declares;
+    # PL/pgSQL plans statements lazily, so the others are never resolved.
+    op.execute(f"""
+        CREATE FUNCTION update_daily_violation_counts() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{_apply_deltas(new_rows)}
+            ELSIF TG_OP = 'DELETE' THEN{_apply_deltas(old_rows)}
+            ELSE{_apply_deltas(f"{old_rows} UNION ALL {new_rows}")}
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    # Block writes until the seed below has been taken, so no violation is
+    # counted both by the seed and by a trigger, or by neither
+    op.execute("LOCK TABLE violations IN SHARE ROW EXCLUSIVE MODE")
+
+    op.execute("""
+        CREATE TRIGGER trg_violations_daily_counts_insert
+        AFTER INSERT ON violations
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_daily_violation_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_daily_counts_delete
+        AFTER DELETE ON violations
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_daily_violation_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_daily_counts_update
+        AFTER UPDATE ON violations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_daily_violation_counts()
+    """)
+
+    # Seed from existing violations; the triggers keep it current from here on
+    op.execute(_apply_deltas("SELECT detected_at, resolved_at, 1 AS n FROM violations"))
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_daily_counts_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_daily_counts_delete ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_daily_counts_insert ON violations")
+    op.execute("DROP FUNCTION IF EXISTS update_daily_violation_counts()")
+    op.drop_table("daily_violation_counts")
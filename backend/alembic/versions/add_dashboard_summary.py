@@ -0,0 +1,72 @@
+"""Add trigger-maintained dashboard_summary table
+
+Revision ID: add_dashboard_summary
+Revises: partition_transactions_by_month
+Create Date: 2026-02-26
+
+dashboard_summary keeps one violation count per (status, severity). Triggers
+on violations adjust the counts on insert, delete and status/severity
+changes, so the dashboard reads at most 16 rows instead of aggregating the
+whole violations table on every request.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "add_dashboard_summary"
+down_revision = "partition_transactions_by_month"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_summary",
+        sa.Column("status", sa.String(20), primary_key=True),
+        sa.Column("severity", sa.String(20), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    op.execute("""
+        CREATE FUNCTION update_dashboard_summary() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE dashboard_summary
+                   SET count = count - 1
+                 WHERE status = OLD.status AND severity = OLD.severity;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO dashboard_summary (status, severity, count)
+                VALUES (NEW.status, NEW.severity, 1)
+                ON CONFLICT (status, severity)
+                DO UPDATE SET count = dashboard_summary.count + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_insert_delete
+        AFTER INSERT OR DELETE ON violations
+        FOR EACH ROW EXECUTE FUNCTION update_dashboard_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_update
+        AFTER UPDATE OF status, severity ON violations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.severity IS DISTINCT FROM NEW.severity)
+        EXECUTE FUNCTION update_dashboard_summary()
+    """)
+
+    # Seed from existing violations; the triggers keep it current from here on
+    op.execute("""
+        INSERT INTO dashboard_summary (status, severity, count)
+        SELECT status, severity, count(*) FROM violations GROUP BY status, severity
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_insert_delete ON violations")
+    op.execute("DROP FUNCTION IF EXISTS update_dashboard_summary()")
+    op.drop_table("dashboard_summary")
@@ -0,0 +1,29 @@
+"""Add partial index on scan_history.completed_at
+
+Revision ID: add_scan_history_completed_at_index
+Revises: violations_record_data_server_default
+Create Date: 2026-03-10
+
+The dashboard's last scan time is max(completed_at) over finished scans;
+a partial index on completed_at WHERE completed_at IS NOT NULL turns that
+into a single index probe instead of a scan of scan_history.
+"""
+from alembic import op
+
+revision = "add_scan_history_completed_at_index"
+down_revision = "violations_record_data_server_default"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_history_completed_at "
+            "ON scan_history (completed_at) WHERE completed_at IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_history_completed_at")
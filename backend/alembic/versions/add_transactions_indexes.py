@@ -0,0 +1,33 @@
+"""Add secondary indexes on transactions
+
+Revision ID: add_transactions_indexes
+Revises: add_users_table
+Create Date: 2026-02-22
+
+Kept separate from the table-creation revision so the IBM AML dataset can be
+bulk-loaded in between (see sample_data/load_transactions.py). Building the
+indexes once after the load is a single sort per index instead of a B-tree
+insertion per loaded row.
+"""
+from alembic import op
+
+revision = "add_transactions_indexes"
+down_revision = "add_users_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_from_account ON transactions (from_account)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_to_account ON transactions (to_account)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_timestamp ON transactions (timestamp)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_is_laundering ON transactions (is_laundering)")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_is_laundering")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_timestamp")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_to_account")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_from_account")
@@ -29,10 +29,8 @@ def upgrade() -> None:
         sa.Column("payment_format", sa.String(100), nullable=False),
         sa.Column("is_laundering", sa.Integer(), nullable=False, server_default="0"),
     )
-    op.create_index("ix_transactions_from_account", "transactions", ["from_account"])
-    op.create_index("ix_transactions_to_account", "transactions", ["to_account"])
-    op.create_index("ix_transactions_timestamp", "transactions", ["timestamp"])
-    op.create_index("ix_transactions_is_laundering", "transactions", ["is_laundering"])
+    # Secondary indexes are created by the add_transactions_indexes revision so
+    # the dataset can be bulk-loaded before they exist.
 
 
 def downgrade() -> None:
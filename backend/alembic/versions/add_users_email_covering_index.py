@@ -0,0 +1,26 @@
+"""Add covering index for login lookups
+
+Revision ID: add_users_email_covering_index
+Revises: add_transactions_indexes
+Create Date: 2026-02-23
+
+Login only needs id and password_hash for a given email. Including them in
+the index leaf pages lets PostgreSQL answer the lookup with an index-only
+scan instead of visiting the users heap.
+"""
+from alembic import op
+
+revision = "add_users_email_covering_index"
+down_revision = "add_transactions_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_covering ON users (email) INCLUDE (password_hash, id)")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_covering")
@@ -0,0 +1,37 @@
+"""Add covering and partial indexes on violations
+
+Revision ID: add_violations_covering_indexes
+Revises: add_dashboard_summary
+Create Date: 2026-03-02
+
+Status and severity counts and filters only need the indexed column and
+the id, so INCLUDE (id) lets PostgreSQL answer them with index-only scans.
+The status covering index replaces the plain ix_violations_status. A
+partial index over pending violations backs the default review queue.
+
+VACUUM ANALYZE refreshes the visibility map and statistics so the planner
+can pick index-only scans straight away.
+"""
+from alembic import op
+
+revision = "add_violations_covering_indexes"
+down_revision = "add_dashboard_summary"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_status_covering ON violations (status) INCLUDE (id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_severity_covering ON violations (severity) INCLUDE (id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_pending_partial ON violations (detected_at) WHERE status = 'pending'")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_status")
+        op.execute("VACUUM ANALYZE violations")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_status ON violations (status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_pending_partial")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_severity_covering")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_status_covering")
@@ -0,0 +1,32 @@
+"""Add detected_at and resolved_at indexes on violations
+
+Revision ID: add_violations_trend_indexes
+Revises: add_dashboard_summary_mv
+Create Date: 2026-03-12
+
+The dashboard trends filter violations with bare range predicates on
+detected_at and resolved_at and only bucket them with date_trunc in the
+SELECT/GROUP BY, so plain btree indexes serve the windows. Most violations
+are never resolved, hence the partial index on resolved_at.
+"""
+from alembic import op
+
+revision = "add_violations_trend_indexes"
+down_revision = "add_dashboard_summary_mv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_detected_at ON violations (detected_at)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_violations_resolved_at "
+            "ON violations (resolved_at) WHERE resolved_at IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_resolved_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_violations_detected_at")
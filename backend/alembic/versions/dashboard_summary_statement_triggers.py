@@ -0,0 +1,115 @@
+"""Maintain dashboard_summary with statement-level triggers
+
+Revision ID: dashboard_summary_statement_triggers
+Revises: native_enum_status_severity
+Create Date: 2026-03-05
+
+Scans write violations in bulk with COPY, and the row-level triggers ran
+one upsert per violation. The same row was rewritten thousands of times in
+a single transaction. Statement-level triggers with transition tables
+aggregate each statement's rows by (status, severity) first. The result is
+at most one write per counter per statement, whatever the batch size.
+
+Updates are netted out: updates that leave status and severity unchanged
+produce no writes.
+"""
+from alembic import op
+
+revision = "dashboard_summary_statement_triggers"
+down_revision = "native_enum_status_severity"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_insert_delete ON violations")
+
+    # Each branch only touches the transition tables its trigger declares;
+    # PL/pgSQL plans statements lazily, so the others are never resolved.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_dashboard_summary() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO dashboard_summary (status, severity, count)
+                SELECT status, severity, count(*) FROM new_rows GROUP BY status, severity
+                ON CONFLICT (status, severity)
+                DO UPDATE SET count = dashboard_summary.count + EXCLUDED.count;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE dashboard_summary s
+                   SET count = s.count - d.n
+                  FROM (SELECT status, severity, count(*) AS n
+                          FROM old_rows GROUP BY status, severity) d
+                 WHERE s.status = d.status AND s.severity = d.severity;
+            ELSE
+                INSERT INTO dashboard_summary (status, severity, count)
+                SELECT status, severity, sum(n)
+                  FROM (SELECT status, severity, -1 AS n FROM old_rows
+                        UNION ALL
+                        SELECT status, severity, 1 AS n FROM new_rows) c
+                 GROUP BY status, severity
+                HAVING sum(n) <> 0
+                ON CONFLICT (status, severity)
+                DO UPDATE SET count = dashboard_summary.count + EXCLUDED.count;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_insert
+        AFTER INSERT ON violations
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_dashboard_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_delete
+        AFTER DELETE ON violations
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_dashboard_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_update
+        AFTER UPDATE ON violations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION update_dashboard_summary()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_delete ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_insert ON violations")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_dashboard_summary() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE dashboard_summary
+                   SET count = count - 1
+                 WHERE status = OLD.status AND severity = OLD.severity;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO dashboard_summary (status, severity, count)
+                VALUES (NEW.status, NEW.severity, 1)
+                ON CONFLICT (status, severity)
+                DO UPDATE SET count = dashboard_summary.count + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_insert_delete
+        AFTER INSERT OR DELETE ON violations
+        FOR EACH ROW EXECUTE FUNCTION update_dashboard_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_update
+        AFTER UPDATE OF status, severity ON violations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.severity IS DISTINCT FROM NEW.severity)
+        EXECUTE FUNCTION update_dashboard_summary()
+    """)
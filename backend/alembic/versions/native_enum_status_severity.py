@@ -0,0 +1,90 @@
+"""Store status and severity columns as native enums
+
+Revision ID: native_enum_status_severity
+Revises: add_violations_covering_indexes
+Create Date: 2026-03-04
+
+Status and severity columns hold 3-4 distinct values each. As native
+PostgreSQL enums they take 4 bytes per row instead of a VARCHAR, which
+shrinks the heap and the status/severity indexes and makes comparisons
+integer-cheap.
+
+Changing a column type is not allowed while a trigger definition or an
+index predicate references it, so the dashboard_summary triggers and the
+pending partial index are dropped first and recreated afterwards.
+review_actions.action_type is left as a string because it also records
+the "mark_false_positive" alias.
+"""
+from alembic import op
+
+revision = "native_enum_status_severity"
+down_revision = "add_violations_covering_indexes"
+branch_labels = None
+depends_on = None
+
+ENUM_TYPES = {
+    "violation_status": ("pending", "confirmed", "false_positive", "resolved"),
+    "severity": ("low", "medium", "high", "critical"),
+    "policy_status": ("pending", "processing", "completed", "failed"),
+    "scan_status": ("running", "completed", "failed"),
+}
+
+# (table, column, enum type, original VARCHAR length)
+ENUM_COLUMNS = [
+    ("violations", "status", "violation_status", 20),
+    ("violations", "severity", "severity", 20),
+    ("dashboard_summary", "status", "violation_status", 20),
+    ("dashboard_summary", "severity", "severity", 20),
+    ("compliance_rules", "severity", "severity", 20),
+    ("policies", "status", "policy_status", 50),
+    ("scan_history", "status", "scan_status", 20),
+]
+
+
+def _drop_column_dependents() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS trg_violations_summary_insert_delete ON violations")
+    op.execute("DROP INDEX IF EXISTS ix_violations_pending_partial")
+
+
+def _create_column_dependents() -> None:
+    op.execute("CREATE INDEX ix_violations_pending_partial ON violations (detected_at) WHERE status = 'pending'")
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_insert_delete
+        AFTER INSERT OR DELETE ON violations
+        FOR EACH ROW EXECUTE FUNCTION update_dashboard_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_violations_summary_update
+        AFTER UPDATE OF status, severity ON violations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.severity IS DISTINCT FROM NEW.severity)
+        EXECUTE FUNCTION update_dashboard_summary()
+    """)
+
+
+def upgrade() -> None:
+    for name, values in ENUM_TYPES.items():
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({labels})")
+
+    _drop_column_dependents()
+    for table, column, enum_type, _ in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_type} USING {column}::{enum_type}"
+        )
+    _create_column_dependents()
+
+
+def downgrade() -> None:
+    _drop_column_dependents()
+    for table, column, _, length in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR({length}) USING {column}::text"
+        )
+    _create_column_dependents()
+
+    for name in ENUM_TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {name}")
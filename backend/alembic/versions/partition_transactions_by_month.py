@@ -0,0 +1,109 @@
+"""Partition transactions by month
+
+Revision ID: partition_transactions_by_month
+Revises: transactions_bigint_id_brin_timestamp
+Create Date: 2026-02-25
+
+transactions is rebuilt as a RANGE-partitioned table on timestamp with one
+partition per calendar month (UTC) of the data already loaded, plus a
+DEFAULT partition for anything outside that range. Time-window queries only
+touch the matching months, each partition gets its own small BRIN and
+B-tree indexes, and old months can be detached instead of deleted.
+
+Load the dataset before running this revision (see
+sample_data/load_transactions.py) so the monthly partitions match it.
+Rows landing in the DEFAULT partition must be moved out before a partition
+covering their range can be attached.
+
+violations is intentionally not partitioned: review_actions.violation_id
+references violations.id, and a partitioned table's primary key must
+include the partition column, which that foreign key cannot target.
+"""
+from alembic import op
+
+revision = "partition_transactions_by_month"
+down_revision = "transactions_bigint_id_brin_timestamp"
+branch_labels = None
+depends_on = None
+
+COLUMNS = """
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+    from_bank VARCHAR(255) NOT NULL,
+    from_account VARCHAR(255) NOT NULL,
+    to_bank VARCHAR(255) NOT NULL,
+    to_account VARCHAR(255) NOT NULL,
+    amount_paid NUMERIC(18, 2) NOT NULL,
+    payment_currency VARCHAR(50) NOT NULL,
+    amount_received NUMERIC(18, 2) NOT NULL,
+    receiving_currency VARCHAR(50) NOT NULL,
+    payment_format VARCHAR(100) NOT NULL,
+    is_laundering INTEGER NOT NULL DEFAULT 0
+"""
+
+COLUMN_NAMES = (
+    "id, timestamp, from_bank, from_account, to_bank, to_account, amount_paid, "
+    "payment_currency, amount_received, receiving_currency, payment_format, is_laundering"
+)
+
+
+def _create_indexes() -> None:
+    op.execute("CREATE INDEX ix_transactions_from_account ON transactions (from_account)")
+    op.execute("CREATE INDEX ix_transactions_to_account ON transactions (to_account)")
+    op.execute("CREATE INDEX ix_transactions_is_laundering ON transactions (is_laundering)")
+    op.execute("CREATE INDEX ix_transactions_timestamp_brin ON transactions USING BRIN (timestamp) WITH (pages_per_range = 32)")
+
+
+def _sync_identity() -> None:
+    op.execute("ALTER SEQUENCE transactions_new_id_seq RENAME TO transactions_id_seq")
+    op.execute(
+        "SELECT setval('transactions_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM transactions"
+    )
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE TABLE transactions_new ({COLUMNS}, PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)")
+
+    # One partition per month present in the existing data
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+            last_month TIMESTAMP;
+        BEGIN
+            SELECT date_trunc('month', MIN(timestamp) AT TIME ZONE 'UTC'),
+                   date_trunc('month', MAX(timestamp) AT TIME ZONE 'UTC')
+              INTO month_start, last_month
+              FROM transactions;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF transactions_new FOR VALUES FROM (%L) TO (%L)',
+                    'transactions_' || to_char(month_start, 'YYYY_MM'),
+                    month_start AT TIME ZONE 'UTC',
+                    (month_start + INTERVAL '1 month') AT TIME ZONE 'UTC'
+                );
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions_new DEFAULT")
+
+    op.execute(f"INSERT INTO transactions_new ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM transactions")
+    op.execute("DROP TABLE transactions")
+    op.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    op.execute("ALTER TABLE transactions RENAME CONSTRAINT transactions_new_pkey TO transactions_pkey")
+    _sync_identity()
+
+    # Indexes on the partitioned parent cascade to one index per partition
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(f"CREATE TABLE transactions_new ({COLUMNS}, PRIMARY KEY (id))")
+    op.execute(f"INSERT INTO transactions_new ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM transactions")
+    op.execute("DROP TABLE transactions CASCADE")
+    op.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    op.execute("ALTER TABLE transactions RENAME CONSTRAINT transactions_new_pkey TO transactions_pkey")
+    _sync_identity()
+    _create_indexes()
@@ -0,0 +1,52 @@
+"""Generate ids and counter defaults in the database
+
+Revision ID: server_side_defaults
+Revises: dashboard_summary_statement_triggers
+Create Date: 2026-03-06
+
+Primary keys were generated with uuid.uuid4() in Python and sent with every
+INSERT. Defaulting them to gen_random_uuid() lets bulk writes omit the
+column entirely. is_active flags and scan counters get matching server
+defaults. gen_random_uuid() is built in from PostgreSQL 13; pgcrypto
+provides it on older servers.
+"""
+from alembic import op
+
+revision = "server_side_defaults"
+down_revision = "dashboard_summary_statement_triggers"
+branch_labels = None
+depends_on = None
+
+UUID_PK_TABLES = [
+    "compliance_rules",
+    "database_connections",
+    "monitoring_config",
+    "policies",
+    "review_actions",
+    "scan_history",
+    "users",
+    "violations",
+]
+
+# (table, column, default)
+COLUMN_DEFAULTS = [
+    ("compliance_rules", "is_active", "true"),
+    ("database_connections", "is_active", "true"),
+    ("scan_history", "violations_found", "0"),
+    ("scan_history", "new_violations", "0"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in UUID_PK_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    for table, column, default in COLUMN_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
+
+
+def downgrade() -> None:
+    for table, column, _ in COLUMN_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+    for table in UUID_PK_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
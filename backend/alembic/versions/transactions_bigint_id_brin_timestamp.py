@@ -0,0 +1,50 @@
+"""Use a BIGINT identity key and a BRIN timestamp index on transactions
+
+Revision ID: transactions_bigint_id_brin_timestamp
+Revises: add_users_email_covering_index
+Create Date: 2026-02-24
+
+The larger IBM AML datasets approach the 2^31 limit of a serial INTEGER key,
+so the id becomes BIGINT GENERATED BY DEFAULT AS IDENTITY. Changing the column
+type rewrites the table under an exclusive lock; run this during a
+maintenance window on populated databases.
+
+Transactions are loaded in timestamp order, so a BRIN index on timestamp is a
+few pages instead of a full B-tree and costs almost nothing to maintain
+during bulk loads. The selective account B-trees are kept.
+"""
+from alembic import op
+
+revision = "transactions_bigint_id_brin_timestamp"
+down_revision = "add_users_email_covering_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE transactions ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP SEQUENCE IF EXISTS transactions_id_seq")
+    op.execute("ALTER TABLE transactions ALTER COLUMN id TYPE BIGINT")
+    op.execute("ALTER TABLE transactions ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('transactions', 'id'), "
+        "COALESCE(MAX(id), 0) + 1, false) FROM transactions"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_timestamp_brin ON transactions USING BRIN (timestamp) WITH (pages_per_range = 32)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_timestamp")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_timestamp ON transactions (timestamp)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_timestamp_brin")
+
+    op.execute("ALTER TABLE transactions ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    op.execute("ALTER TABLE transactions ALTER COLUMN id TYPE INTEGER")
+    op.execute("CREATE SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.execute("ALTER TABLE transactions ALTER COLUMN id SET DEFAULT nextval('transactions_id_seq')")
+    op.execute(
+        "SELECT setval('transactions_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM transactions"
+    )
@@ -0,0 +1,42 @@
+"""Vacuum violations often enough for index-only scans
+
+Revision ID: violations_autovacuum_tuning
+Revises: add_violations_trend_indexes
+Create Date: 2026-03-13
+
+Index-only scans only skip the heap for pages marked all-visible, and only
+VACUUM sets that bit. Violations are append-mostly: scans insert them and
+reviews update a small share. With the default scale factors, autovacuum
+rarely runs on a large violations table, so the trend and summary counts
+over ix_violations_detected_at and ix_violations_resolved_at keep
+visiting the heap. Lower the insert and update thresholds for this table,
+and vacuum once now so the visibility map starts out populated.
+"""
+from alembic import op
+
+revision = "violations_autovacuum_tuning"
+down_revision = "add_violations_trend_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE violations SET (
+            autovacuum_vacuum_scale_factor = 0.02,
+            autovacuum_vacuum_insert_scale_factor = 0.02,
+            autovacuum_analyze_scale_factor = 0.02
+        )
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM ANALYZE violations")
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE violations RESET (
+            autovacuum_vacuum_scale_factor,
+            autovacuum_vacuum_insert_scale_factor,
+            autovacuum_analyze_scale_factor
+        )
+    """)
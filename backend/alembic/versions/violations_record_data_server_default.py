@@ -0,0 +1,24 @@
+"""Default violations.record_data in the database
+
+Revision ID: violations_record_data_server_default
+Revises: server_side_defaults
+Create Date: 2026-03-09
+
+record_data defaulted to a Python-side dict() allocated and JSON-encoded
+for every insert that left it unset; the empty object now comes from a
+server default instead.
+"""
+from alembic import op
+
+revision = "violations_record_data_server_default"
+down_revision = "server_side_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE violations ALTER COLUMN record_data SET DEFAULT '{}'::jsonb")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE violations ALTER COLUMN record_data DROP DEFAULT")
@@ -1,7 +1,11 @@
 """Database session management for the Data Policy Agent."""
 
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, List, Optional, Tuple
+from uuid import UUID
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -10,19 +14,96 @@ from app.config import get_settings
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
 
+    # Attributes shown by __repr__ after the id; keep these to cheap columns
+    __repr_attrs__: Tuple[str, ...] = ()
 
-# Create async engine
+    def __repr__(self) -> str:
+        """Build a short repr from already-loaded attributes only.
+        
+        Unloaded or expired attributes are skipped instead of triggering a
+        lazy load, and UUIDs are printed from their integer value in hex,
+        which is formatted in C rather than by UUID.__str__.
+        """
+        loaded = self.__dict__
+        parts = [type(self).__name__]
+        for name in ("id", *self.__repr_attrs__):
+            if name in loaded:
+                value = loaded[name]
+                if isinstance(value, UUID):
+                    value = f"{value.int:032x}"
+                parts.append(f"{name}={value}")
+        return f"<{' '.join(parts)}>"
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson."""
+    return orjson.dumps(value).decode()
+
+
+# Create async engine.
+# asyncpg encodes and decodes uuid columns in its C protocol layer, and with
+# UUID(as_uuid=True) SQLAlchemy passes those values through untouched, so no
+# UUID adapter needs registering here; as_uuid=False would add a str() per value.
 settings = get_settings()
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    # Pooled connections keep the statements they have prepared, so a
+    # repeated query is sent as Bind/Execute without another Parse
+    connect_args={
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+    },
+    # JSONB columns (e.g. violation record_data) are encoded and decoded
+    # with orjson instead of the stdlib json module
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
+
+# Statements executed by the current request, or None outside of one.
+# Bound per request by app.middleware.QueryAuditMiddleware.
+request_queries: ContextVar[Optional[List[str]]] = ContextVar(
+    "request_queries", default=None
 )
 
+
+def record_query(statement: str) -> None:
+    """Count a statement against the current request, if it is audited.
+    
+    Called for every SQLAlchemy cursor execution; code that queries the
+    driver connection directly should call it as well.
+    """
+    queries = request_queries.get()
+    if queries is not None:
+        queries.append(statement)
+
+
+# Session.info key listing the models a session has written through the
+# driver connection (e.g. with COPY), which no ORM event sees. Read by
+# commit-time listeners such as the dashboard cache invalidation.
+BULK_WRITTEN_MODELS_INFO_KEY = "bulk_written_models"
+
+
+def record_bulk_write(session: AsyncSession, model: type) -> None:
+    """Note that rows of a model were written outside the ORM in this session.
+    
+    Code that writes through the driver connection directly should call it
+    so that listeners relying on ORM events still see the write.
+    """
+    session.info.setdefault(BULK_WRITTEN_MODELS_INFO_KEY, set()).add(model)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _record_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    record_query(statement)
+
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -50,6 +131,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Dependency for endpoints that open several sessions of their own.
+    
+    An AsyncSession must not be used by concurrent tasks, so endpoints that
+    run independent queries concurrently give each one its own session.
+    
+    Returns:
+        async_sessionmaker: The application's session factory.
+    """
+    return async_session_maker
+
+
 async def init_db() -> None:
     """Initialize the database by creating all tables.
     
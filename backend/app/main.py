@@ -1,36 +1,72 @@
 """FastAPI application initialization for the Data Policy Agent."""
 
+import asyncio
+import hashlib
+import threading
+import time
 import bcrypt
+from cachetools import TTLCache
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Any, Dict, Optional, Tuple
 from pydantic import BaseModel
-from jose import jwt
-from datetime import datetime, timedelta
+import jwt
 
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from starlette.types import Receive, Scope, Send
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, exists, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import close_db, get_db
+from app.database import close_db, engine, get_db
+from app.middleware import QueryAuditMiddleware
 from app.models.user import User
 from app.routers import dashboard, database, monitoring, policies, rules, violations
+from app.services.migration_runner import MigrationStatus, get_migration_runner
 from app.services.scheduler import get_monitoring_scheduler, reset_monitoring_scheduler
 
 FRONTEND_DIR = Path(__file__).parent.parent.parent / "frontend" / "dist"
 
-SECRET_KEY = "hackathon-secret-key"
+SECRET_KEY = get_settings().jwt_secret
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE_SECONDS = 60 * 60
+
+# Encoded once so each sign/verify skips the str -> bytes conversion
+_SIGNING_KEY = SECRET_KEY.encode("utf-8")
+
+CORS_ALLOW_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+CORS_ALLOW_HEADERS = ["Authorization", "Content-Type"]
 
 security = HTTPBearer()
 
+# Auth lookups are built once; per request only the email parameter changes
+_EMAIL_EXISTS = lambda_stmt(
+    lambda: select(exists().where(User.email == bindparam("email")))
+)
+# Only the columns in ix_users_email_covering, so this is index-only
+_LOGIN_BY_EMAIL = lambda_stmt(
+    lambda: select(User.id, User.password_hash)
+    .where(User.email == bindparam("email"))
+    .limit(1)
+)
+
+# Validated tokens -> (payload, exp). Entries also expire with the token itself.
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: "TTLCache[str, Tuple[Dict[str, Any], int]]" = TTLCache(
+    maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS
+)
+_token_cache_lock = threading.Lock()
+
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
 
 class LoginRequest(BaseModel):
     email: str
@@ -42,32 +78,111 @@ class RegisterRequest(BaseModel):
     password: str
 
 
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
+
+async def _resolve_summary_view_after_migrations() -> None:
+    await get_migration_runner().wait()
+    await dashboard.resolve_summary_view()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     print(f"Starting {settings.app_name} v{settings.app_version}")
     print(f"Debug mode: {settings.debug}")
+    print(f"Database pool: {engine.pool.status()}")
+    await get_migration_runner().start(settings.migration_mode)
+    print(f"Migration mode: {settings.migration_mode}")
+    await dashboard.resolve_summary_view()
+    resolve_task: Optional[asyncio.Task] = None
+    if settings.migration_mode == "async":
+        # Background migrations may still create dashboard_summary_mv
+        resolve_task = asyncio.create_task(_resolve_summary_view_after_migrations())
+    dashboard.register_summary_cache_invalidation()
+    dashboard.register_trends_cache_invalidation()
+    database.register_rules_cache_invalidation()
     scheduler = get_monitoring_scheduler()
     scheduler.start()
     print("Monitoring scheduler started")
     yield
     print("Shutting down application...")
+    if resolve_task is not None:
+        resolve_task.cancel()
     reset_monitoring_scheduler()
     print("Monitoring scheduler stopped")
+    await database.close_scanner_service()
     await close_db()
 
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+def is_legacy_hash(hashed: str) -> bool:
+    return hashed.startswith("$2")
+
+
+def needs_rehash(hashed: str) -> bool:
+    return is_legacy_hash(hashed) or password_hasher.check_needs_rehash(hashed)
 
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+def _verify_password_sync(password: str, hashed: str) -> bool:
+    # Accounts created before the switch to Argon2 still carry bcrypt hashes
+    if is_legacy_hash(hashed):
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    try:
+        return password_hasher.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def hash_password(password: str) -> str:
+    # KDFs are CPU-bound; keep them off the event loop
+    return await asyncio.to_thread(password_hasher.hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await asyncio.to_thread(_verify_password_sync, password, hashed)
 
 
 def create_token(email: str) -> str:
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    return jwt.encode({"sub": email, "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
+    # exp is whole seconds since the epoch; PyJWT accepts ints directly
+    expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_SECONDS
+    return jwt.encode({"sub": email, "exp": expire}, _SIGNING_KEY, algorithm=ALGORITHM)
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """Decode and validate a token, reusing recent validation results.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired.
+    """
+    now = int(time.time())
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        payload, exp = cached
+        if exp > now:
+            return payload
+
+    payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
+    exp = int(payload.get("exp", now + TOKEN_CACHE_TTL_SECONDS))
+    with _token_cache_lock:
+        _token_cache[token] = (payload, exp)
+    return payload
+
+
+def load_index_html(frontend_dir: Path) -> Optional[Tuple[bytes, str]]:
+    """Read the built SPA entry point and compute its ETag.
+
+    index.html is small and fixed for a deployment, so it is read once and
+    served from memory.
+    """
+    index_path = frontend_dir / "index.html"
+    if not index_path.exists():
+        return None
+    content = index_path.read_bytes()
+    etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+    return content, etag
 
 
 def create_app() -> FastAPI:
@@ -87,9 +202,12 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let Starlette precompute the preflight headers
+        # instead of echoing back whatever each request asks for.
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
     )
+    app.add_middleware(QueryAuditMiddleware, raise_on_exceeded=settings.debug)
 
     @app.get("/health", tags=["Health"])
     async def health_check() -> dict:
@@ -99,37 +217,56 @@ def create_app() -> FastAPI:
             "version": settings.app_version,
         }
 
+    @app.get("/health/migrations", tags=["Health"], response_model=MigrationStatus)
+    async def migration_status() -> MigrationStatus:
+        return get_migration_runner().get_status()
+
     @app.post("/api/auth/register", tags=["Auth"])
-    async def register(data: RegisterRequest, db: AsyncSession = Depends(get_db)):
+    async def register(data: RegisterRequest, db: AsyncSession = Depends(get_db)) -> TokenResponse:
         # Check if user already exists
-        result = await db.execute(select(User).where(User.email == data.email))
-        if result.scalar_one_or_none():
+        result = await db.execute(_EMAIL_EXISTS, {"email": data.email})
+        if result.scalar():
             raise HTTPException(status_code=400, detail="Email already registered")
 
-        user = User(email=data.email, password_hash=hash_password(data.password))
+        user = User(email=data.email, password_hash=await hash_password(data.password))
         db.add(user)
-        await db.flush()
+        # Single round-trip: the INSERT is sent as part of the commit. The
+        # session does not expire on commit, so nothing is re-selected.
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent registration for the same email
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Email already registered")
 
         token = create_token(user.email)
-        return {"access_token": token, "token_type": "bearer"}
+        return TokenResponse(access_token=token)
 
     @app.post("/api/auth/login", tags=["Auth"])
-    async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
-        result = await db.execute(select(User).where(User.email == data.email))
-        user = result.scalar_one_or_none()
+    async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)) -> TokenResponse:
+        result = await db.execute(_LOGIN_BY_EMAIL, {"email": data.email})
+        user = result.one_or_none()
 
-        if not user or not verify_password(data.password, user.password_hash):
+        if not user or not await verify_password(data.password, user.password_hash):
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
-        token = create_token(user.email)
-        return {"access_token": token, "token_type": "bearer"}
+        # Upgrade legacy bcrypt (or outdated Argon2) hashes on successful login
+        if needs_rehash(user.password_hash):
+            await db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(password_hash=await hash_password(data.password))
+            )
+
+        token = create_token(data.email)
+        return TokenResponse(access_token=token)
 
     @app.get("/api/protected")
-    def protected_route(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    def protected_route(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
         try:
-            jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+            decode_token(credentials.credentials)
             return {"message": "You are authenticated"}
-        except Exception:
+        except jwt.PyJWTError:
             raise HTTPException(status_code=401, detail="Invalid token")
 
     @app.get("/api", tags=["Root"])
@@ -141,25 +278,41 @@ def create_app() -> FastAPI:
         }
 
     # Register routers
-    app.include_router(policies.router)
-    app.include_router(rules.router)
-    app.include_router(database.router)
-    app.include_router(violations.router)
-    app.include_router(monitoring.router)
-    app.include_router(dashboard.router)
+    api_router = APIRouter(prefix="/api")
+    api_router.include_router(policies.router)
+    api_router.include_router(rules.router)
+    api_router.include_router(database.router)
+    api_router.include_router(violations.router)
+    api_router.include_router(monitoring.router)
+    api_router.include_router(dashboard.router)
+    app.include_router(api_router)
 
     # Serve frontend
     if FRONTEND_DIR.exists():
         app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="assets")
-
-        @app.get("/{full_path:path}")
-        async def serve_frontend(request: Request, full_path: str):
-            if full_path.startswith("api/") or full_path == "health":
-                return {"detail": "Not Found"}
-            index_path = FRONTEND_DIR / "index.html"
-            if index_path.exists():
-                return FileResponse(index_path)
-            return {"detail": "Frontend not built"}
+        index_html = load_index_html(FRONTEND_DIR)
+        not_found = app.router.default
+
+        # Installed as the router's fallback rather than a /{full_path:path}
+        # route, so it only runs once no registered route has matched.
+        async def serve_frontend(scope: Scope, receive: Receive, send: Send) -> None:
+            if (
+                index_html is None
+                or scope["type"] != "http"
+                or scope["method"] not in ("GET", "HEAD")
+                or scope["path"].startswith("/api/")
+            ):
+                await not_found(scope, receive, send)
+                return
+            content, etag = index_html
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if Request(scope).headers.get("if-none-match") == etag:
+                response = Response(status_code=304, headers=headers)
+            else:
+                response = Response(content=content, media_type="text/html", headers=headers)
+            await response(scope, receive, send)
+
+        app.router.default = serve_frontend
 
     return app
 
@@ -0,0 +1,66 @@
+"""ASGI middleware for the Data Policy Agent."""
+
+import logging
+from typing import Dict, List, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import request_queries
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of SQL statements a request to each path may run. Exceeding
+# one usually means an N+1 or an eager load that went missing.
+QUERY_BUDGETS: Dict[str, int] = {
+    "/api/dashboard/summary": 1,
+}
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a request runs more queries than its path's budget."""
+    pass
+
+
+class QueryAuditMiddleware:
+    """Count the SQL statements each HTTP request executes.
+    
+    The statements are collected through app.database.request_queries.
+    Requests to paths in QUERY_BUDGETS that go over budget are logged as
+    warnings, or fail with QueryBudgetExceeded when raise_on_exceeded is set
+    (debug mode), so the regression surfaces before the response is sent.
+    """
+
+    def __init__(self, app: ASGIApp, raise_on_exceeded: bool = False):
+        self.app = app
+        self.raise_on_exceeded = raise_on_exceeded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        budget = QUERY_BUDGETS.get(path)
+        queries: List[str] = []
+        token = request_queries.set(queries)
+
+        async def send_checked(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._check_budget(path, queries, budget)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            request_queries.reset(token)
+            logger.debug("%s %s ran %d queries", scope["method"], path, len(queries))
+
+    def _check_budget(self, path: str, queries: List[str], budget: Optional[int]) -> None:
+        """Report a request that ran more queries than its budget allows."""
+        if budget is None or len(queries) <= budget:
+            return
+
+        message = f"{path} ran {len(queries)} queries (budget {budget})"
+        if self.raise_on_exceeded:
+            raise QueryBudgetExceeded(f"{message}: {queries}")
+        logger.warning(message)
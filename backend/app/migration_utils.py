@@ -0,0 +1,71 @@
+"""Helpers for data migrations in Alembic revisions.
+
+Data migrations that rewrite existing rows must not load a whole table into
+memory or hold one long transaction over it. ``paginate`` walks a query in
+small keyset-ordered pages so each page can be processed and committed on
+its own:
+
+    import sqlalchemy as sa
+    from alembic import op
+    from sqlalchemy import select, update
+
+    from app.migration_utils import paginate
+
+    def upgrade() -> None:
+        rules = sa.table("compliance_rules", sa.column("id"), sa.column("generated_sql"))
+        query = select(rules.c.id).where(rules.c.generated_sql.is_(None))
+        for page in paginate(op.get_bind(), query, rules.c.id):
+            with op.get_context().autocommit_block():
+                for row in page:
+                    op.execute(update(rules).where(rules.c.id == row.id).values(...))
+"""
+
+from typing import Any, Iterator, List
+
+from sqlalchemy import Row, Select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import ColumnElement
+
+# Small pages keep each transaction short and the working set bounded
+DEFAULT_PAGE_SIZE = 50
+
+
+def paginate(
+    connection: Connection,
+    query: Select,
+    key_column: ColumnElement[Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[List[Row]]:
+    """Yield the rows of ``query`` in pages ordered by ``key_column``.
+
+    Keyset pagination (``WHERE key > last_key``) is used rather than OFFSET,
+    so every page is an index range scan and rows updated by earlier pages
+    are not skipped or repeated.
+
+    Args:
+        connection: A synchronous connection, e.g. ``op.get_bind()``.
+        query: The select to page through. It must include ``key_column``.
+        key_column: A unique, sortable column such as the primary key.
+        page_size: Maximum number of rows per page.
+
+    Yields:
+        Lists of at most ``page_size`` rows.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    last_key = None
+    while True:
+        page_query = query.order_by(key_column).limit(page_size)
+        if last_key is not None:
+            page_query = page_query.where(key_column > last_key)
+
+        rows = connection.execute(page_query).all()
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+        last_key = rows[-1]._mapping[key_column]
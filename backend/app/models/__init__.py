@@ -4,6 +4,8 @@ This module exports all SQLAlchemy models and enums used by the Data Policy Agen
 """
 
 from app.models.compliance_rule import ComplianceRule
+from app.models.daily_violation_count import DailyViolationCount
+from app.models.dashboard_summary import DashboardSummary
 from app.models.database_connection import DatabaseConnection
 from app.models.enums import (
     PolicyStatus,
@@ -29,6 +31,8 @@ __all__ = [
     "ScanHistory",
     "MonitoringConfig",
     "User",
+    "DashboardSummary",
+    "DailyViolationCount",
     # Enums
     "ViolationStatus",
     "Severity",
@@ -4,12 +4,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.enums import Severity
+from app.models.enums import SEVERITY_ENUM, Severity
 
 if TYPE_CHECKING:
     from app.models.policy import Policy
@@ -23,11 +23,31 @@ class ComplianceRule(Base):
     Each rule defines evaluation criteria and can trigger violations.
     """
     __tablename__ = "compliance_rules"
+    __repr_attrs__ = ("rule_code", "severity")
+    __table_args__ = (
+        # Scans only ever load active rules, optionally narrowed by id
+        Index(
+            "ix_compliance_rules_active_id",
+            "is_active",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        # The rules list pages newest first, optionally filtered by status
+        # and severity; btree indexes serve the DESC order by scanning back
+        Index("ix_compliance_rules_created_at", "created_at", "id"),
+        Index(
+            "ix_compliance_rules_active_severity_created_at",
+            "is_active",
+            "severity",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     policy_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -57,13 +77,13 @@ class ComplianceRule(Base):
         nullable=True,
     )
     severity: Mapped[str] = mapped_column(
-        String(20),
+        SEVERITY_ENUM,
         default=Severity.MEDIUM.value,
         nullable=False,
     )
     is_active: Mapped[bool] = mapped_column(
         Boolean,
-        default=True,
+        server_default=text("true"),
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -76,13 +96,11 @@ class ComplianceRule(Base):
     policy: Mapped["Policy"] = relationship(
         "Policy",
         back_populates="rules",
+        lazy="raise_on_sql",
     )
     violations: Mapped[List["Violation"]] = relationship(
         "Violation",
         back_populates="rule",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
-
-    def __repr__(self) -> str:
-        return f"<ComplianceRule(id={self.id}, rule_code='{self.rule_code}', severity='{self.severity}')>"
@@ -0,0 +1,35 @@
+"""DailyViolationCount model for the per-day violation rollup."""
+
+from datetime import date
+
+from sqlalchemy import BigInteger, Date
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DailyViolationCount(Base):
+    """SQLAlchemy model for the daily violation counts rollup.
+    
+    Holds the number of violations detected and resolved on each UTC day.
+    Rows are maintained by statement-level triggers on the violations table
+    (see the add_daily_violation_counts migration) and are read-only for
+    the application.
+    """
+    __tablename__ = "daily_violation_counts"
+    __repr_attrs__ = ("day", "new_count", "resolved_count")
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    new_count: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        nullable=False,
+    )
+    resolved_count: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        nullable=False,
+    )
@@ -0,0 +1,50 @@
+"""DashboardSummary model for pre-aggregated violation counts."""
+
+from sqlalchemy import BigInteger, DateTime, column, table
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.enums import SEVERITY_ENUM, VIOLATION_STATUS_ENUM
+
+
+class DashboardSummary(Base):
+    """SQLAlchemy model for the dashboard summary table.
+    
+    Holds the number of violations for each (status, severity) pair. Rows are
+    maintained by statement-level triggers on the violations table (see the
+    dashboard_summary_statement_triggers migration) and are read-only for
+    the application.
+    """
+    __tablename__ = "dashboard_summary"
+    __repr_attrs__ = ("status", "severity", "count")
+
+    status: Mapped[str] = mapped_column(
+        VIOLATION_STATUS_ENUM,
+        primary_key=True,
+    )
+    severity: Mapped[str] = mapped_column(
+        SEVERITY_ENUM,
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        nullable=False,
+    )
+
+
+# Single-row materialized view of totals that are too costly to count per
+# request (see the add_dashboard_summary_mv migration). It is refreshed by
+# the transactions loader after each load and by the monitoring scheduler
+# after each scan; nothing else refreshes it, so without either its total
+# can be arbitrarily stale. Declared as a lightweight table() so that it
+# stays out of Base.metadata and create_all().
+dashboard_summary_mv = table(
+    "dashboard_summary_mv",
+    column("total_transactions", BigInteger),
+    column("refreshed_at", DateTime(timezone=True)),
+)
+
+REFRESH_DASHBOARD_SUMMARY_MV_SQL = (
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_summary_mv"
+)
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,11 +17,12 @@ class DatabaseConnection(Base):
     that will be scanned for compliance violations.
     """
     __tablename__ = "database_connections"
+    __repr_attrs__ = ("host", "database_name")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     host: Mapped[str] = mapped_column(
         String(255),
@@ -46,7 +47,7 @@ class DatabaseConnection(Base):
     )
     is_active: Mapped[bool] = mapped_column(
         Boolean,
-        default=True,
+        server_default=text("true"),
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -54,6 +55,3 @@ class DatabaseConnection(Base):
         server_default=func.now(),
         nullable=False,
     )
-
-    def __repr__(self) -> str:
-        return f"<DatabaseConnection(id={self.id}, host='{self.host}', database='{self.database_name}')>"
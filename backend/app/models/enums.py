@@ -1,6 +1,9 @@
 """Enum definitions for the Data Policy Agent models."""
 
 from enum import Enum
+from typing import Type
+
+from sqlalchemy.dialects.postgresql import ENUM
 
 
 class ViolationStatus(str, Enum):
@@ -39,3 +42,20 @@ class ReviewActionType(str, Enum):
     CONFIRM = "confirm"
     FALSE_POSITIVE = "false_positive"
     RESOLVE = "resolve"
+
+
+def _pg_enum(enum_class: Type[Enum], name: str) -> ENUM:
+    """Build a native PostgreSQL ENUM type holding an Enum's values.
+    
+    Columns using these types still read and write plain strings, so the
+    ``.value`` of each Enum member can be used as before.
+    """
+    return ENUM(*(member.value for member in enum_class), name=name)
+
+
+# Native column types: 4 bytes per value instead of a VARCHAR, and cheaper
+# comparisons for the status/severity filters and indexes.
+VIOLATION_STATUS_ENUM = _pg_enum(ViolationStatus, "violation_status")
+SEVERITY_ENUM = _pg_enum(Severity, "severity")
+POLICY_STATUS_ENUM = _pg_enum(PolicyStatus, "policy_status")
+SCAN_STATUS_ENUM = _pg_enum(ScanStatus, "scan_status")
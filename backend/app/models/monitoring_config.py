@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer
+from sqlalchemy import Boolean, DateTime, Integer, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -18,11 +18,12 @@ class MonitoringConfig(Base):
     including interval, enabled status, and timing information.
     """
     __tablename__ = "monitoring_config"
+    __repr_attrs__ = ("interval_minutes", "is_enabled")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     interval_minutes: Mapped[int] = mapped_column(
         Integer,
@@ -42,6 +43,3 @@ class MonitoringConfig(Base):
         DateTime(timezone=True),
         nullable=True,
     )
-
-    def __repr__(self) -> str:
-        return f"<MonitoringConfig(id={self.id}, interval_minutes={self.interval_minutes}, is_enabled={self.is_enabled})>"
@@ -9,7 +9,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.enums import PolicyStatus
+from app.models.enums import POLICY_STATUS_ENUM, PolicyStatus
 
 if TYPE_CHECKING:
     from app.models.compliance_rule import ComplianceRule
@@ -22,11 +22,12 @@ class Policy(Base):
     Each policy can have multiple associated compliance rules.
     """
     __tablename__ = "policies"
+    __repr_attrs__ = ("filename", "status")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     filename: Mapped[str] = mapped_column(
         String(255),
@@ -43,7 +44,7 @@ class Policy(Base):
         nullable=False,
     )
     status: Mapped[str] = mapped_column(
-        String(50),
+        POLICY_STATUS_ENUM,
         default=PolicyStatus.PENDING.value,
         nullable=False,
     )
@@ -53,8 +54,6 @@ class Policy(Base):
         "ComplianceRule",
         back_populates="policy",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
-
-    def __repr__(self) -> str:
-        return f"<Policy(id={self.id}, filename='{self.filename}', status='{self.status}')>"
@@ -21,11 +21,12 @@ class ReviewAction(Base):
     Each action records the reviewer, action type, and optional notes.
     """
     __tablename__ = "review_actions"
+    __repr_attrs__ = ("action_type", "reviewer_id")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     violation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -56,6 +57,3 @@ class ReviewAction(Base):
         "Violation",
         back_populates="review_actions",
     )
-
-    def __repr__(self) -> str:
-        return f"<ReviewAction(id={self.id}, action_type='{self.action_type}', reviewer_id='{self.reviewer_id}')>"
@@ -4,12 +4,12 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
-from app.models.enums import ScanStatus
+from app.models.enums import SCAN_STATUS_ENUM, ScanStatus
 
 
 class ScanHistory(Base):
@@ -19,11 +19,20 @@ class ScanHistory(Base):
     timing, results, and any error messages.
     """
     __tablename__ = "scan_history"
+    __table_args__ = (
+        # Backs max(completed_at) for the dashboard's last scan time
+        Index(
+            "ix_scan_history_completed_at",
+            "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL"),
+        ),
+    )
+    __repr_attrs__ = ("status", "violations_found")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     started_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -35,24 +44,21 @@ class ScanHistory(Base):
         nullable=True,
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        SCAN_STATUS_ENUM,
         default=ScanStatus.RUNNING.value,
         nullable=False,
     )
     violations_found: Mapped[int] = mapped_column(
         Integer,
-        default=0,
+        server_default=text("0"),
         nullable=False,
     )
     new_violations: Mapped[int] = mapped_column(
         Integer,
-        default=0,
+        server_default=text("0"),
         nullable=False,
     )
     error_message: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
     )
-
-    def __repr__(self) -> str:
-        return f"<ScanHistory(id={self.id}, status='{self.status}', violations_found={self.violations_found})>"
@@ -15,7 +15,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid(),
     )
     email: Mapped[str] = mapped_column(
         String(255), nullable=False, unique=True, index=True,
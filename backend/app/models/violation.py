@@ -4,12 +4,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.enums import Severity, ViolationStatus
+from app.models.enums import SEVERITY_ENUM, VIOLATION_STATUS_ENUM, Severity, ViolationStatus
 
 if TYPE_CHECKING:
     from app.models.compliance_rule import ComplianceRule
@@ -23,11 +23,31 @@ class Violation(Base):
     Each violation is linked to a compliance rule and can have review actions.
     """
     __tablename__ = "violations"
+    __table_args__ = (
+        # Covering indexes let status/severity counts and filters run as
+        # index-only scans without visiting the heap
+        Index("ix_violations_status_covering", "status", postgresql_include=["id"]),
+        Index("ix_violations_severity_covering", "severity", postgresql_include=["id"]),
+        # Pending violations are the default review queue, listed newest first
+        Index(
+            "ix_violations_pending_partial",
+            "detected_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Range scans for the dashboard trends windows
+        Index("ix_violations_detected_at", "detected_at"),
+        Index(
+            "ix_violations_resolved_at",
+            "resolved_at",
+            postgresql_where=text("resolved_at IS NOT NULL"),
+        ),
+    )
+    __repr_attrs__ = ("record_identifier", "status")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     rule_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -43,7 +63,7 @@ class Violation(Base):
     record_data: Mapped[Dict[str, Any]] = mapped_column(
         JSONB,
         nullable=False,
-        default=dict,
+        server_default=text("'{}'::jsonb"),
     )
     justification: Mapped[str] = mapped_column(
         Text,
@@ -54,15 +74,14 @@ class Violation(Base):
         nullable=True,
     )
     severity: Mapped[str] = mapped_column(
-        String(20),
+        SEVERITY_ENUM,
         default=Severity.MEDIUM.value,
         nullable=False,
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        VIOLATION_STATUS_ENUM,
         default=ViolationStatus.PENDING.value,
         nullable=False,
-        index=True,
     )
     detected_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -83,8 +102,5 @@ class Violation(Base):
         "ReviewAction",
         back_populates="violation",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
-
-    def __repr__(self) -> str:
-        return f"<Violation(id={self.id}, record_identifier='{self.record_identifier}', status='{self.status}')>"
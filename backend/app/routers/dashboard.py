@@ -6,29 +6,40 @@ This module provides FastAPI endpoints for the compliance dashboard:
 - Get violation trends over time with improvement/degradation indicators
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, cast, func, select, Date
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.database import get_db
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, TypeVar
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import and_, cast, event, func, literal, literal_column, select, text, BigInteger, Date, DateTime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.database import (
+    BULK_WRITTEN_MODELS_INFO_KEY,
+    engine,
+    get_db,
+    get_session_maker,
+    record_query,
+)
 from app.models.compliance_rule import ComplianceRule
+from app.models.daily_violation_count import DailyViolationCount
+from app.models.dashboard_summary import DashboardSummary, dashboard_summary_mv
 from app.models.enums import Severity, ViolationStatus
 from app.models.monitoring_config import MonitoringConfig
 from app.models.policy import Policy
 from app.models.scan_history import ScanHistory
 from app.models.violation import Violation
-from app.services.scheduler import get_monitoring_scheduler
 
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 # Pydantic Models
@@ -116,6 +127,234 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+# Summary Query
+
+# Enum values resolved once at import. They double as the column labels of
+# the summary row and the keys of the response's by_severity mapping.
+_PENDING = ViolationStatus.PENDING.value
+_CONFIRMED = ViolationStatus.CONFIRMED.value
+_FALSE_POSITIVE = ViolationStatus.FALSE_POSITIVE.value
+_RESOLVED = ViolationStatus.RESOLVED.value
+_LOW = Severity.LOW.value
+_MEDIUM = Severity.MEDIUM.value
+_HIGH = Severity.HIGH.value
+_CRITICAL = Severity.CRITICAL.value
+
+_STATUS_KEYS = (_PENDING, _CONFIRMED, _FALSE_POSITIVE, _RESOLVED)
+_SEVERITY_KEYS = (_LOW, _MEDIUM, _HIGH, _CRITICAL)
+
+
+def _rollup_sum(column, condition=None):
+    """Sum a rollup count column, optionally restricted by a FILTER clause."""
+    total = func.sum(column)
+    if condition is not None:
+        total = total.filter(condition)
+    # sum() over BIGINT yields NUMERIC; cast back so counts decode as int
+    return cast(func.coalesce(total, 0), BigInteger)
+
+
+def _summary_count(condition=None):
+    """Sum dashboard_summary counts, optionally restricted by a FILTER clause."""
+    return _rollup_sum(DashboardSummary.count, condition)
+
+
+def _build_summary_query(with_summary_view: bool):
+    """Build the combined summary query.
+    
+    One round-trip for every dashboard counter. Violation counts are summed
+    from the trigger-maintained dashboard_summary rows with FILTER aggregates;
+    the remaining values are scalar subqueries evaluated in the same statement.
+    
+    Args:
+        with_summary_view: Whether dashboard_summary_mv exists to read the
+            transactions total from; otherwise total_transactions is 0
+    """
+    if with_summary_view:
+        total_transactions = (
+            select(dashboard_summary_mv.c.total_transactions).limit(1).scalar_subquery()
+        )
+    else:
+        total_transactions = literal(0, BigInteger)
+    
+    return select(
+        _summary_count().label("total_violations"),
+        *(_summary_count(DashboardSummary.status == key).label(key) for key in _STATUS_KEYS),
+        *(_summary_count(DashboardSummary.severity == key).label(key) for key in _SEVERITY_KEYS),
+        select(func.count(Policy.id)).scalar_subquery().label("total_policies"),
+        select(func.count(ComplianceRule.id)).scalar_subquery().label("total_rules"),
+        total_transactions.label("total_transactions"),
+        select(func.max(ScanHistory.completed_at))
+        .where(ScanHistory.completed_at.isnot(None))
+        .scalar_subquery()
+        .label("last_scan_at"),
+        # The scheduler writes next_run_at whenever it reschedules; a past
+        # value is left over from a schedule that is no longer running
+        select(MonitoringConfig.next_run_at)
+        .where(
+            MonitoringConfig.is_enabled.is_(True),
+            MonitoringConfig.next_run_at > func.now(),
+        )
+        .limit(1)
+        .scalar_subquery()
+        .label("next_scan_at"),
+    ).select_from(DashboardSummary)
+
+
+# Keyed by whether dashboard_summary_mv exists
+_SUMMARY_QUERIES = {
+    with_summary_view: _build_summary_query(with_summary_view)
+    for with_summary_view in (False, True)
+}
+
+# Pre-rendered for the driver-level fetch; every bound value is a constant
+_SUMMARY_SQLS = {
+    with_summary_view: str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    for with_summary_view, query in _SUMMARY_QUERIES.items()
+}
+
+# dashboard_summary_mv (and the transactions table it counts) is created by
+# migrations that may not have run yet. Its presence is resolved once (see
+# resolve_summary_view) rather than probed, and rolled back on failure, on
+# every request.
+_SUMMARY_VIEW_EXISTS_SQL = "SELECT to_regclass('dashboard_summary_mv') IS NOT NULL"
+_has_summary_view = False
+
+
+async def resolve_summary_view() -> bool:
+    """Check once whether dashboard_summary_mv exists.
+    
+    Called at startup, and again once background migrations finish, since
+    they may create the view.
+    
+    Returns:
+        Whether the summary will read totals from the view
+    """
+    global _has_summary_view
+    try:
+        async with engine.connect() as conn:
+            exists = await conn.scalar(text(_SUMMARY_VIEW_EXISTS_SQL))
+    except Exception as e:
+        logger.warning(f"Could not check for dashboard_summary_mv: {e}")
+        exists = False
+    
+    _has_summary_view = bool(exists)
+    invalidate_summary_cache()
+    return _has_summary_view
+
+
+# Summary Cache
+
+SUMMARY_CACHE_TTL_SECONDS = 30
+
+# The summary holds global counters, so a single entry is cached, as the
+# serialized JSON body so cache hits skip serialization too. Committed
+# writes to the models it aggregates drop the entry early (see
+# register_summary_cache_invalidation); the TTL bounds staleness otherwise,
+# e.g. for scheduler next-run times or rows written outside the ORM.
+_SUMMARY_CACHE_KEY = "summary"
+_summary_cache: TTLCache = TTLCache(maxsize=1, ttl=SUMMARY_CACHE_TTL_SECONDS)
+_summary_cache_lock = asyncio.Lock()
+_summary_adapter = TypeAdapter(DashboardSummaryResponse)
+
+_SUMMARY_SOURCE_MODELS = (Violation, Policy, ComplianceRule, ScanHistory, MonitoringConfig)
+_TRENDS_SOURCE_MODELS = (Violation,)
+
+# Session.info key holding the invalidate functions of the caches that a
+# session's uncommitted writes make stale. Clearing a cache at flush time
+# would let a concurrent request re-cache the old snapshot before COMMIT,
+# so the caches are only cleared once the session commits.
+_STALE_CACHES_INFO_KEY = "dashboard_stale_caches"
+
+
+def invalidate_summary_cache() -> None:
+    """Drop the cached dashboard summary."""
+    _summary_cache.pop(_SUMMARY_CACHE_KEY, None)
+
+
+def _mark_stale_caches(session: Session, models: Iterable[type]) -> None:
+    """Record the caches that writes to the given models make stale."""
+    stale = session.info.setdefault(_STALE_CACHES_INFO_KEY, set())
+    for model in models:
+        if issubclass(model, _SUMMARY_SOURCE_MODELS):
+            stale.add(invalidate_summary_cache)
+        if issubclass(model, _TRENDS_SOURCE_MODELS):
+            stale.add(invalidate_trends_cache)
+
+
+def _mark_stale_caches_on_flush(session: Session, _flush_context: Any) -> None:
+    """Record the caches made stale by the objects being flushed.
+    
+    The new, dirty and deleted collections still hold the flushed objects
+    while after_flush runs.
+    """
+    _mark_stale_caches(
+        session,
+        {type(obj) for obj in (*session.new, *session.dirty, *session.deleted)},
+    )
+
+
+def _mark_stale_caches_on_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    """Record the caches made stale by an ORM INSERT, UPDATE or DELETE statement.
+    
+    Such statements bypass the unit of work, so no flush sees them.
+    """
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        _mark_stale_caches(orm_execute_state.session, (mapper.class_,))
+
+
+def _invalidate_stale_caches_on_commit(session: Session) -> None:
+    """Drop the caches made stale by the writes that were just committed.
+    
+    Includes models written outside the ORM, such as violations a scan
+    copies in (see app.database.record_bulk_write).
+    """
+    _mark_stale_caches(session, session.info.pop(BULK_WRITTEN_MODELS_INFO_KEY, ()))
+    for invalidate in session.info.pop(_STALE_CACHES_INFO_KEY, ()):
+        invalidate()
+
+
+def _forget_stale_caches_on_rollback(session: Session) -> None:
+    """Discard the stale-cache record of rolled back writes."""
+    session.info.pop(BULK_WRITTEN_MODELS_INFO_KEY, None)
+    session.info.pop(_STALE_CACHES_INFO_KEY, None)
+
+
+_CACHE_INVALIDATION_LISTENERS = (
+    ("after_flush", _mark_stale_caches_on_flush),
+    ("do_orm_execute", _mark_stale_caches_on_bulk_write),
+    ("after_commit", _invalidate_stale_caches_on_commit),
+    ("after_rollback", _forget_stale_caches_on_rollback),
+)
+
+
+def _register_cache_invalidation_listeners() -> None:
+    """Register the Session listeners shared by the summary and trends caches."""
+    for event_name, listener in _CACHE_INVALIDATION_LISTENERS:
+        if not event.contains(Session, event_name, listener):
+            event.listen(Session, event_name, listener)
+
+
+def register_summary_cache_invalidation() -> None:
+    """Invalidate the summary cache whenever a write to a summarized model commits.
+    
+    Covers both flushed objects and ORM INSERT/UPDATE/DELETE statements.
+    Safe to call more than once.
+    """
+    _register_cache_invalidation_listeners()
+
+
 # API Endpoints
 
 @router.get(
@@ -130,7 +369,7 @@ class ErrorResponse(BaseModel):
 )
 async def get_dashboard_summary(
     db: AsyncSession = Depends(get_db),
-) -> DashboardSummaryResponse:
+) -> Response:
     """Get compliance overview statistics for the dashboard.
     
     This endpoint provides:
@@ -144,73 +383,24 @@ async def get_dashboard_summary(
         db: Database session (injected)
         
     Returns:
-        DashboardSummaryResponse with compliance overview statistics
+        DashboardSummaryResponse, serialized to JSON
         
     Raises:
         HTTPException: 500 if there's an error retrieving statistics
     """
     try:
-        # Get total violations count
-        total_result = await db.execute(
-            select(func.count(Violation.id))
-        )
-        total_violations = total_result.scalar() or 0
-        
-        # Get total policies count
-        policies_result = await db.execute(
-            select(func.count(Policy.id))
-        )
-        total_policies = policies_result.scalar() or 0
-        
-        # Get total rules count
-        rules_result = await db.execute(
-            select(func.count(ComplianceRule.id))
-        )
-        total_rules = rules_result.scalar() or 0
-        
-        # Get total transactions count
-        from sqlalchemy import text
-        try:
-            tx_result = await db.execute(text("SELECT count(*) FROM transactions"))
-            total_transactions = tx_result.scalar() or 0
-        except Exception:
-            total_transactions = 0
-        
-        # Get violations count by status
-        status_counts = await _get_violations_by_status(db)
-        
-        # Get violations count by severity
-        severity_counts = await _get_violations_by_severity(db)
-        
-        # Get last scan time from scan history
-        last_scan_at = await _get_last_scan_time(db)
-        
-        # Get next scheduled scan time from monitoring config and scheduler
-        next_scan_at = await _get_next_scan_time(db)
-        
-        logger.info(
-            f"Dashboard summary retrieved: {total_violations} total violations, "
-            f"last_scan={last_scan_at}, next_scan={next_scan_at}"
-        )
-        
-        return DashboardSummaryResponse(
-            total_violations=total_violations,
-            total_policies=total_policies,
-            total_rules=total_rules,
-            total_transactions=total_transactions,
-            pending_count=status_counts.pending,
-            confirmed_count=status_counts.confirmed,
-            resolved_count=status_counts.resolved,
-            false_positive_count=status_counts.false_positive,
-            by_severity={
-                "low": severity_counts.low,
-                "medium": severity_counts.medium,
-                "high": severity_counts.high,
-                "critical": severity_counts.critical,
-            },
-            last_scan_at=last_scan_at,
-            next_scan_at=next_scan_at,
-        )
+        body = _summary_cache.get(_SUMMARY_CACHE_KEY)
+        if body is None:
+            # Only one request recomputes on a miss; the rest wait for its result
+            async with _summary_cache_lock:
+                body = _summary_cache.get(_SUMMARY_CACHE_KEY)
+                if body is None:
+                    summary = await _compute_dashboard_summary(db)
+                    body = _summary_adapter.dump_json(summary)
+                    _summary_cache[_SUMMARY_CACHE_KEY] = body
+        
+        # The cached body is already JSON, so bypass response_model serialization
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error retrieving dashboard summary: {e}")
@@ -220,142 +410,81 @@ async def get_dashboard_summary(
         )
 
 
-async def _get_violations_by_status(db: AsyncSession) -> ViolationsByStatus:
-    """Get violation counts grouped by status.
+async def _compute_dashboard_summary(db: AsyncSession) -> DashboardSummaryResponse:
+    """Query the database for the dashboard summary statistics.
     
     Args:
         db: Database session
         
     Returns:
-        ViolationsByStatus with counts for each status
+        DashboardSummaryResponse with compliance overview statistics
     """
-    # Query to get counts grouped by status
-    result = await db.execute(
-        select(
-            Violation.status,
-            func.count(Violation.id).label("count"),
-        ).group_by(Violation.status)
-    )
+    # Counters, rollups and scan times come back in a single row
+    row = await _fetch_summary_row(db)
     
-    # Initialize counts
-    counts = {
-        ViolationStatus.PENDING.value: 0,
-        ViolationStatus.CONFIRMED.value: 0,
-        ViolationStatus.FALSE_POSITIVE.value: 0,
-        ViolationStatus.RESOLVED.value: 0,
-    }
+    total_violations = row["total_violations"]
+    last_scan_at = row["last_scan_at"]
+    next_scan_at = row["next_scan_at"]
     
-    # Populate counts from query results
-    for row in result:
-        if row.status in counts:
-            counts[row.status] = row.count
-    
-    return ViolationsByStatus(
-        pending=counts[ViolationStatus.PENDING.value],
-        confirmed=counts[ViolationStatus.CONFIRMED.value],
-        false_positive=counts[ViolationStatus.FALSE_POSITIVE.value],
-        resolved=counts[ViolationStatus.RESOLVED.value],
-    )
-
-
-async def _get_violations_by_severity(db: AsyncSession) -> ViolationsBySeverity:
-    """Get violation counts grouped by severity.
-    
-    Args:
-        db: Database session
-        
-    Returns:
-        ViolationsBySeverity with counts for each severity level
-    """
-    # Query to get counts grouped by severity
-    result = await db.execute(
-        select(
-            Violation.severity,
-            func.count(Violation.id).label("count"),
-        ).group_by(Violation.severity)
+    logger.info(
+        f"Dashboard summary retrieved: {total_violations} total violations, "
+        f"last_scan={last_scan_at}, next_scan={next_scan_at}"
     )
     
-    # Initialize counts
-    counts = {
-        Severity.LOW.value: 0,
-        Severity.MEDIUM.value: 0,
-        Severity.HIGH.value: 0,
-        Severity.CRITICAL.value: 0,
-    }
-    
-    # Populate counts from query results
-    for row in result:
-        if row.severity in counts:
-            counts[row.severity] = row.count
-    
-    return ViolationsBySeverity(
-        low=counts[Severity.LOW.value],
-        medium=counts[Severity.MEDIUM.value],
-        high=counts[Severity.HIGH.value],
-        critical=counts[Severity.CRITICAL.value],
+    # Every value comes from our own typed query, so skip re-validation
+    return DashboardSummaryResponse.model_construct(
+        total_violations=total_violations,
+        total_policies=row["total_policies"] or 0,
+        total_rules=row["total_rules"] or 0,
+        total_transactions=row["total_transactions"],
+        pending_count=row[_PENDING],
+        confirmed_count=row[_CONFIRMED],
+        resolved_count=row[_RESOLVED],
+        false_positive_count=row[_FALSE_POSITIVE],
+        by_severity={key: row[key] for key in _SEVERITY_KEYS},
+        last_scan_at=last_scan_at,
+        next_scan_at=next_scan_at,
     )
 
 
-async def _get_last_scan_time(db: AsyncSession) -> Optional[datetime]:
-    """Get the timestamp of the most recent completed scan.
+async def _get_driver_connection(db: AsyncSession) -> Optional[Any]:
+    """Get the session's asyncpg connection, if it is running on PostgreSQL.
+    
+    The summary counters are single-row reads on the hottest endpoint, so on
+    PostgreSQL they skip SQLAlchemy's Result/Row processing and are fetched
+    straight from the driver connection the session already holds.
     
     Args:
         db: Database session
         
     Returns:
-        Datetime of the last completed scan, or None if no scans exist
+        The asyncpg connection, or None for other dialects
     """
-    result = await db.execute(
-        select(ScanHistory.completed_at)
-        .where(ScanHistory.completed_at.isnot(None))
-        .order_by(ScanHistory.completed_at.desc())
-        .limit(1)
-    )
-    row = result.scalar_one_or_none()
-    return row
+    if db.bind is None or db.bind.dialect.name != "postgresql":
+        return None
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
 
 
-async def _get_next_scan_time(db: AsyncSession) -> Optional[datetime]:
-    """Get the timestamp of the next scheduled scan.
-    
-    First checks the scheduler for the actual next run time,
-    then falls back to the monitoring config if scheduler info unavailable.
+async def _fetch_summary_row(db: AsyncSession) -> Mapping[str, Any]:
+    """Run the combined summary query.
     
     Args:
         db: Database session
         
     Returns:
-        Datetime of the next scheduled scan, or None if no scan is scheduled
+        Mapping of the summary query's column labels to values
     """
-    now = datetime.now(timezone.utc)
+    with_summary_view = _has_summary_view
+    driver_connection = await _get_driver_connection(db)
+    if driver_connection is not None:
+        summary_sql = _SUMMARY_SQLS[with_summary_view]
+        record_query(summary_sql)
+        return await driver_connection.fetchrow(summary_sql)
     
-    # First try to get from the scheduler (most accurate)
-    try:
-        scheduler = get_monitoring_scheduler()
-        scheduler_status = scheduler.get_status()
-        if scheduler_status.is_enabled and scheduler_status.next_run_time:
-            if scheduler_status.next_run_time > now:
-                return scheduler_status.next_run_time
-    except Exception as e:
-        logger.warning(f"Could not get scheduler status: {e}")
-    
-    # Fall back to monitoring config
-    result = await db.execute(
-        select(MonitoringConfig)
-        .where(MonitoringConfig.is_enabled == True)
-        .limit(1)
-    )
-    config = result.scalar_one_or_none()
-    
-    if config and config.next_run_at:
-        # Only return future dates
-        next_run = config.next_run_at
-        if next_run.tzinfo is None:
-            next_run = next_run.replace(tzinfo=timezone.utc)
-        if next_run > now:
-            return config.next_run_at
-    
-    return None
+    result = await db.execute(_SUMMARY_QUERIES[with_summary_view])
+    return result.mappings().one()
 
 
 # =============================================================================
@@ -365,10 +494,17 @@ async def _get_next_scan_time(db: AsyncSession) -> Optional[datetime]:
 class TimeRange(str, Enum):
     """Supported time ranges for trend analysis."""
     
-    LAST_7_DAYS = "7d"
-    LAST_14_DAYS = "14d"
-    LAST_30_DAYS = "30d"
-    LAST_90_DAYS = "90d"
+    # (query value, length in days)
+    LAST_7_DAYS = ("7d", 7)
+    LAST_14_DAYS = ("14d", 14)
+    LAST_30_DAYS = ("30d", 30)
+    LAST_90_DAYS = ("90d", 90)
+    
+    def __new__(cls, value: str, days: int) -> "TimeRange":
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.days = days
+        return member
 
 
 class TrendBucket(str, Enum):
@@ -466,6 +602,34 @@ class TrendsResponse(BaseModel):
     )
 
 
+# Trends Cache
+
+TRENDS_CACHE_TTL_SECONDS = 60
+
+# One entry per (time range, bucket), cached as the serialized JSON body like
+# the summary. The windows end at the time of computation, so an entry is at
+# most a TTL behind; committed violation writes drop every entry early (see
+# register_trends_cache_invalidation).
+_trends_cache: TTLCache = TTLCache(
+    maxsize=len(TimeRange) * len(TrendBucket), ttl=TRENDS_CACHE_TTL_SECONDS
+)
+_trends_cache_lock = asyncio.Lock()
+_trends_adapter = TypeAdapter(TrendsResponse)
+
+
+def invalidate_trends_cache() -> None:
+    """Drop every cached trends response."""
+    _trends_cache.clear()
+
+
+def register_trends_cache_invalidation() -> None:
+    """Invalidate the trends cache whenever a violation write commits.
+    
+    Safe to call more than once.
+    """
+    _register_cache_invalidation_listeners()
+
+
 @router.get(
     "/trends",
     response_model=TrendsResponse,
@@ -478,7 +642,7 @@ class TrendsResponse(BaseModel):
                 "improvement/degradation percentages. Supports daily or weekly buckets.",
 )
 async def get_dashboard_trends(
-    db: AsyncSession = Depends(get_db),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_session_maker),
     time_range: TimeRange = Query(
         default=TimeRange.LAST_7_DAYS,
         description="Time range for trend data",
@@ -487,7 +651,7 @@ async def get_dashboard_trends(
         default=TrendBucket.DAILY,
         description="Time bucket granularity (daily or weekly)",
     ),
-) -> TrendsResponse:
+) -> Response:
     """Get violation trends over time for the dashboard.
     
     This endpoint provides:
@@ -497,51 +661,32 @@ async def get_dashboard_trends(
     - Improvement/degradation indicator
     
     Args:
-        db: Database session (injected)
+        session_maker: Session factory (injected); the data points and the
+            summary are queried concurrently, each in its own session
         time_range: Time range for trend data (7d, 14d, 30d, 90d)
         bucket: Time bucket granularity (daily or weekly)
         
     Returns:
-        TrendsResponse with trend data and summary statistics
+        TrendsResponse with trend data and summary statistics, serialized to JSON
         
     Raises:
         HTTPException: 400 if parameters are invalid
         HTTPException: 500 if there's an error retrieving trends
     """
     try:
-        # Calculate date ranges
-        now = datetime.now(timezone.utc)
-        days = _get_days_from_time_range(time_range)
-        
-        current_period_start = now - timedelta(days=days)
-        previous_period_start = current_period_start - timedelta(days=days)
-        previous_period_end = current_period_start
-        
-        # Get data points for current period
-        data_points = await _get_trend_data_points(
-            db, current_period_start, now, bucket
-        )
-        
-        # Calculate summary statistics
-        summary = await _calculate_trend_summary(
-            db,
-            current_period_start,
-            now,
-            previous_period_start,
-            previous_period_end,
-        )
-        
-        logger.info(
-            f"Trends retrieved: time_range={time_range.value}, bucket={bucket.value}, "
-            f"data_points={len(data_points)}, change={summary.percentage_change}%"
-        )
-        
-        return TrendsResponse(
-            time_range=time_range.value,
-            bucket=bucket.value,
-            data_points=data_points,
-            summary=summary,
-        )
+        cache_key = (time_range, bucket)
+        body = _trends_cache.get(cache_key)
+        if body is None:
+            # Only one request recomputes on a miss; the rest wait for its result
+            async with _trends_cache_lock:
+                body = _trends_cache.get(cache_key)
+                if body is None:
+                    trends = await _compute_dashboard_trends(session_maker, time_range, bucket)
+                    body = _trends_adapter.dump_json(trends)
+                    _trends_cache[cache_key] = body
+        
+        # The cached body is already JSON, so bypass response_model serialization
+        return Response(content=body, media_type="application/json")
         
     except ValueError as e:
         logger.error(f"Invalid parameters for trends: {e}")
@@ -557,22 +702,102 @@ async def get_dashboard_trends(
         )
 
 
-def _get_days_from_time_range(time_range: TimeRange) -> int:
-    """Convert time range enum to number of days.
+async def _compute_dashboard_trends(
+    session_maker: async_sessionmaker[AsyncSession],
+    time_range: TimeRange,
+    bucket: TrendBucket,
+) -> TrendsResponse:
+    """Query the database for the violation trends.
+    
+    Args:
+        session_maker: Session factory; the data points and the summary are
+            queried concurrently, each in its own session
+        time_range: Time range for trend data
+        bucket: Time bucket granularity
+        
+    Returns:
+        TrendsResponse with trend data and summary statistics
+    """
+    # Calculate date ranges
+    now = datetime.now(timezone.utc)
+    days = time_range.days
+    
+    current_period_start = now - timedelta(days=days)
+    previous_period_start = current_period_start - timedelta(days=days)
+    previous_period_end = current_period_start
+    
+    # Get data points for the current period and the summary statistics
+    data_points, summary = await asyncio.gather(
+        _run_in_session(
+            session_maker,
+            _get_trend_data_points,
+            current_period_start,
+            now,
+            bucket,
+        ),
+        _run_in_session(
+            session_maker,
+            _calculate_trend_summary,
+            current_period_start,
+            now,
+            previous_period_start,
+            previous_period_end,
+        ),
+    )
+    
+    logger.info(
+        f"Trends retrieved: time_range={time_range.value}, bucket={bucket.value}, "
+        f"data_points={len(data_points)}, change={summary.percentage_change}%"
+    )
+    
+    return TrendsResponse.model_construct(
+        time_range=time_range.value,
+        bucket=bucket.value,
+        data_points=data_points,
+        summary=summary,
+    )
+
+
+_T = TypeVar("_T")
+
+
+async def _run_in_session(
+    session_maker: async_sessionmaker[AsyncSession],
+    query: Callable[..., Awaitable[_T]],
+    *args: Any,
+) -> _T:
+    """Run a read-only query helper in a session of its own.
     
     Args:
-        time_range: Time range enum value
+        session_maker: Session factory
+        query: Helper taking the session as its first argument
+        *args: Remaining arguments for the helper
         
     Returns:
-        Number of days for the time range
+        The helper's result
     """
-    mapping = {
-        TimeRange.LAST_7_DAYS: 7,
-        TimeRange.LAST_14_DAYS: 14,
-        TimeRange.LAST_30_DAYS: 30,
-        TimeRange.LAST_90_DAYS: 90,
-    }
-    return mapping[time_range]
+    async with session_maker() as db:
+        return await query(db, *args)
+
+
+# date_trunc units per bucket, rendered inline: a bound parameter would make
+# the SELECT and GROUP BY expressions differ and PostgreSQL reject the query
+_TREND_TRUNC_UNITS = {
+    TrendBucket.DAILY: literal_column("'day'"),
+    TrendBucket.WEEKLY: literal_column("'week'"),
+}
+
+
+def _trend_period_days(start: datetime, end: datetime):
+    """Select the rollup days of a trend period, the half-open range (start, end].
+    
+    Periods of equal length cover the same number of days, and a period
+    that ends where the next starts shares no day with it.
+    """
+    return and_(
+        DailyViolationCount.day > start.date(),
+        DailyViolationCount.day <= end.date(),
+    )
 
 
 async def _get_trend_data_points(
@@ -583,7 +808,9 @@ async def _get_trend_data_points(
 ) -> List[TrendDataPoint]:
     """Get trend data points for the specified period.
     
-    Groups violations by day or week and returns counts for each period.
+    Sums the daily violation rollup by day or week and returns counts for
+    each period. The buckets cover the same days as the trend summary's
+    current period, so their counts add up to its totals.
     
     Args:
         db: Database session
@@ -594,85 +821,60 @@ async def _get_trend_data_points(
     Returns:
         List of TrendDataPoint objects
     """
-    # Generate all dates/weeks in the range
-    data_points = []
-    current = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    # The period covers the days (start, end], as the trend summary does,
+    # so the first bucket holds the day after the start date
+    first_day = start_date.date() + timedelta(days=1)
     
     if bucket == TrendBucket.WEEKLY:
-        # Align to start of week (Monday)
-        current = current - timedelta(days=current.weekday())
-        step = timedelta(days=7)
+        # Align to start of week (Monday), as date_trunc('week') does
+        first_day = first_day - timedelta(days=first_day.weekday())
+        step_days = 7
     else:
-        step = timedelta(days=1)
-    
-    # Query for new violations (detected_at in period)
-    new_violations_query = await db.execute(
-        select(
-            cast(Violation.detected_at, Date).label("date"),
-            func.count(Violation.id).label("count"),
-        )
-        .where(
-            and_(
-                Violation.detected_at >= start_date,
-                Violation.detected_at < end_date,
-            )
-        )
-        .group_by(cast(Violation.detected_at, Date))
+        step_days = 1
+    step = timedelta(days=step_days)
+    n_buckets = (end_date.date() - first_day).days // step_days + 1
+    
+    # Per-bucket totals from the daily rollup; its days are UTC dates.
+    # Truncate them as naive timestamps so the session TimeZone cannot
+    # shift a bucket across midnight, and return the bucket as a date.
+    bucket_start = cast(
+        func.date_trunc(
+            _TREND_TRUNC_UNITS[bucket],
+            cast(DailyViolationCount.day, DateTime),
+        ),
+        Date,
     )
-    new_violations_by_date = {
-        row.date: row.count for row in new_violations_query
-    }
-    
-    # Query for resolved violations (resolved_at in period)
-    resolved_violations_query = await db.execute(
+    result = await db.execute(
         select(
-            cast(Violation.resolved_at, Date).label("date"),
-            func.count(Violation.id).label("count"),
+            bucket_start.label("bucket"),
+            _rollup_sum(DailyViolationCount.new_count).label("new_count"),
+            _rollup_sum(DailyViolationCount.resolved_count).label("resolved_count"),
         )
-        .where(
-            and_(
-                Violation.resolved_at >= start_date,
-                Violation.resolved_at < end_date,
-                Violation.resolved_at.isnot(None),
-            )
+        .where(_trend_period_days(start_date, end_date))
+        .group_by(bucket_start)
+    )
+    
+    # Accumulate each returned bucket into its slot by index, so buckets
+    # without violations stay zero and no per-bucket lookups are needed.
+    # Plain tuples unpack without Row's per-attribute lookups.
+    new_counts = [0] * n_buckets
+    resolved_counts = [0] * n_buckets
+    for bucket_start, new_count, resolved_count in result.tuples():
+        index = (bucket_start - first_day).days // step_days
+        if 0 <= index < n_buckets:
+            new_counts[index] += new_count
+            resolved_counts[index] += resolved_count
+    
+    # Counts come straight from our typed query, so skip re-validation
+    return [
+        TrendDataPoint.model_construct(
+            date=(first_day + index * step).isoformat(),
+            total_violations=new_counts[index],  # For simplicity, using new violations as total for the period
+            new_violations=new_counts[index],
+            resolved_violations=resolved_counts[index],
         )
-        .group_by(cast(Violation.resolved_at, Date))
-    )
-    resolved_violations_by_date = {
-        row.date: row.count for row in resolved_violations_query
-    }
-    
-    # Build data points
-    while current < end_date:
-        period_end = current + step
-        if period_end > end_date:
-            period_end = end_date
-        
-        # Sum violations for this bucket
-        new_count = 0
-        resolved_count = 0
-        
-        bucket_current = current
-        while bucket_current < period_end:
-            date_key = bucket_current.date()
-            new_count += new_violations_by_date.get(date_key, 0)
-            resolved_count += resolved_violations_by_date.get(date_key, 0)
-            bucket_current += timedelta(days=1)
-        
-        data_points.append(TrendDataPoint(
-            date=current.strftime("%Y-%m-%d"),
-            total_violations=new_count,  # For simplicity, using new violations as total for the period
-            new_violations=new_count,
-            resolved_violations=resolved_count,
-        ))
-        
-        current = period_end if bucket == TrendBucket.DAILY else current + step
-        
-        # Prevent infinite loop
-        if bucket == TrendBucket.DAILY and current >= end_date:
-            break
-    
-    return data_points
+        for index in range(n_buckets)
+    ]
 
 
 async def _calculate_trend_summary(
@@ -685,7 +887,8 @@ async def _calculate_trend_summary(
     """Calculate trend summary statistics.
     
     Compares current period with previous period to determine
-    improvement or degradation.
+    improvement or degradation. Periods are counted in whole UTC days
+    from the daily violation rollup.
     
     Args:
         db: Database session
@@ -697,54 +900,23 @@ async def _calculate_trend_summary(
     Returns:
         TrendSummary with comparison statistics
     """
-    # Count violations detected in current period
-    current_result = await db.execute(
-        select(func.count(Violation.id))
-        .where(
-            and_(
-                Violation.detected_at >= current_start,
-                Violation.detected_at < current_end,
-            )
-        )
-    )
-    current_total = current_result.scalar() or 0
-    
-    # Count violations detected in previous period
-    previous_result = await db.execute(
-        select(func.count(Violation.id))
-        .where(
-            and_(
-                Violation.detected_at >= previous_start,
-                Violation.detected_at < previous_end,
-            )
-        )
-    )
-    previous_total = previous_result.scalar() or 0
-    
-    # Count new violations in current period
-    new_violations_result = await db.execute(
-        select(func.count(Violation.id))
-        .where(
-            and_(
-                Violation.detected_at >= current_start,
-                Violation.detected_at < current_end,
-            )
-        )
-    )
-    total_new = new_violations_result.scalar() or 0
-    
-    # Count resolved violations in current period
-    resolved_result = await db.execute(
-        select(func.count(Violation.id))
-        .where(
-            and_(
-                Violation.resolved_at >= current_start,
-                Violation.resolved_at < current_end,
-                Violation.resolved_at.isnot(None),
-            )
+    # One pass over the rollup days of both windows, which are equally long
+    # and adjacent (see _trend_period_days). Violations detected in the
+    # current period are its new violations too.
+    current_days = _trend_period_days(current_start, current_end)
+    previous_days = _trend_period_days(previous_start, previous_end)
+    result = await db.execute(
+        select(
+            _rollup_sum(DailyViolationCount.new_count, current_days).label("current_total"),
+            _rollup_sum(DailyViolationCount.new_count, previous_days).label("previous_total"),
+            _rollup_sum(DailyViolationCount.resolved_count, current_days).label("resolved_total"),
         )
+        .where(_trend_period_days(previous_start, current_end))
     )
-    total_resolved = resolved_result.scalar() or 0
+    row = result.one()
+    current_total = row.current_total or 0
+    previous_total = row.previous_total or 0
+    total_resolved = row.resolved_total or 0
     
     # Calculate percentage change
     # Formula: ((current - previous) / previous) * 100
@@ -772,11 +944,11 @@ async def _calculate_trend_summary(
         trend_indicator = TrendIndicator.DEGRADATION
     # else: both are 0, stable
     
-    return TrendSummary(
+    return TrendSummary.model_construct(
         current_period_total=current_total,
         previous_period_total=previous_total,
         percentage_change=percentage_change,
         trend_indicator=trend_indicator,
-        total_new_violations=total_new,
+        total_new_violations=current_total,
         total_resolved_violations=total_resolved,
     )
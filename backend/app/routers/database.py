@@ -6,20 +6,29 @@ This module provides FastAPI endpoints for managing database connections:
 - Trigger manual compliance scans
 """
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import any_, bindparam, event, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.database import async_session_maker, get_db
 from app.models.compliance_rule import ComplianceRule
 from app.models.database_connection import DatabaseConnection
 from app.models.enums import ScanStatus, Severity
+from app.models.policy import Policy
 from app.models.scan_history import ScanHistory
 from app.services.db_scanner import (
     AuthenticationError,
@@ -37,19 +46,141 @@ from app.services.db_scanner import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/database", tags=["Database"])
-
+router = APIRouter(prefix="/database", tags=["Database"])
 
-# Singleton scanner service instance
-_scanner_service: Optional[DatabaseScannerService] = None
+# Lookups are built once; their compiled SQL is reused on every request
+_ACTIVE_CONNECTION = lambda_stmt(
+    lambda: select(DatabaseConnection)
+    .where(DatabaseConnection.is_active == True)
+    .order_by(DatabaseConnection.created_at.desc())
+    .limit(1)
+)
+_ACTIVE_RULES = lambda_stmt(
+    lambda: select(ComplianceRule).where(ComplianceRule.is_active == True)
+)
+# One uuid[] parameter keeps the statement text the same for any number of
+# IDs, unlike an expanding IN list
+_ACTIVE_RULES_BY_ID = lambda_stmt(
+    lambda: select(ComplianceRule)
+    .where(ComplianceRule.is_active == True)
+    .where(
+        ComplianceRule.id == any_(
+            bindparam("rule_ids", type_=ARRAY(PG_UUID(as_uuid=True)))
+        )
+    )
+)
 
 
+@lru_cache
 def get_scanner_service() -> DatabaseScannerService:
-    """Get or create the database scanner service singleton."""
-    global _scanner_service
-    if _scanner_service is None:
-        _scanner_service = DatabaseScannerService()
-    return _scanner_service
+    """Get or create the database scanner service singleton.
+    
+    The singleton holds a connection pool to the target database, so
+    concurrent requests each use a connection of their own.
+    """
+    return DatabaseScannerService()
+
+
+async def close_scanner_service() -> None:
+    """Close the scanner singleton's connection pool, if one was opened."""
+    if get_scanner_service.cache_info().currsize:
+        await get_scanner_service().disconnect()
+
+
+# Rules Cache
+
+RULES_CACHE_TTL_SECONDS = 30
+# Rule rows are read through a server-side cursor in batches of this size
+RULES_YIELD_PER = 1000
+
+# Active rules per requested rule-ID set (None for all active rules), held
+# detached from any session. Writes to rules through the ORM drop every entry
+# (see register_rules_cache_invalidation); the TTL bounds staleness otherwise,
+# e.g. for rules changed by another process.
+_rules_cache: TTLCache = TTLCache(maxsize=64, ttl=RULES_CACHE_TTL_SECONDS)
+# Bumped by every invalidation, so a query that raced one is not cached
+_rules_cache_version = 0
+
+_RULES_INVALIDATING_EVENTS = ("after_insert", "after_update", "after_delete")
+# Deleting a policy cascades to its rules in the database
+_RULES_SOURCE_MODELS = (ComplianceRule, Policy)
+
+
+def invalidate_rules_cache(*_args: Any) -> None:
+    """Drop every cached rule set.
+    
+    Accepts and ignores the (mapper, connection, target) arguments of the
+    SQLAlchemy mapper events it is registered for.
+    """
+    global _rules_cache_version
+    _rules_cache_version += 1
+    _rules_cache.clear()
+
+
+def _invalidate_rules_cache_on_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    """Drop the cached rule sets before an ORM UPDATE or DELETE of rules.
+    
+    Statements such as ``update(ComplianceRule)`` bypass the unit of work,
+    so the mapper events never see them.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in _RULES_SOURCE_MODELS:
+        invalidate_rules_cache()
+
+
+def register_rules_cache_invalidation() -> None:
+    """Invalidate the rules cache whenever a compliance rule is written.
+    
+    Covers both flushed rules and UPDATE/DELETE statements against rules or
+    policies. Safe to call more than once.
+    """
+    for event_name in _RULES_INVALIDATING_EVENTS:
+        if not event.contains(ComplianceRule, event_name, invalidate_rules_cache):
+            event.listen(ComplianceRule, event_name, invalidate_rules_cache)
+    if not event.contains(Session, "do_orm_execute", _invalidate_rules_cache_on_bulk_write):
+        event.listen(Session, "do_orm_execute", _invalidate_rules_cache_on_bulk_write)
+
+
+async def _get_active_rules(
+    db: AsyncSession,
+    rule_ids: Optional[Sequence[UUID]],
+) -> List[ComplianceRule]:
+    """Get the active compliance rules to scan, from the cache when possible.
+    
+    Args:
+        db: Application database session
+        rule_ids: Optional IDs to restrict the scan to; all active rules
+            are returned when empty
+        
+    Returns:
+        The active rules, attached to ``db``
+    """
+    key: Optional[Tuple[UUID, ...]] = tuple(sorted(set(rule_ids))) if rule_ids else None
+    rules = _rules_cache.get(key)
+    
+    if rules is None:
+        version = _rules_cache_version
+        options = {"yield_per": RULES_YIELD_PER}
+        if key is None:
+            result = await db.stream(_ACTIVE_RULES, execution_options=options)
+        else:
+            result = await db.stream(
+                _ACTIVE_RULES_BY_ID, {"rule_ids": list(key)}, execution_options=options
+            )
+        
+        # Cached instances belong to no session; every scan gets its own copies
+        rules = []
+        async for rule in result.scalars():
+            db.expunge(rule)
+            rules.append(rule)
+        if version == _rules_cache_version:
+            _rules_cache[key] = rules
+    
+    # merge(load=False) copies the loaded state into this session without a
+    # SELECT, so SQL generated during the scan is still flushed with it
+    return [await db.merge(rule, load=False) for rule in rules]
 
 
 # Pydantic Request/Response Models
@@ -159,6 +290,39 @@ class ScanResponse(BaseModel):
     message: str = Field(..., description="Human-readable summary of the scan results")
 
 
+# Built once at import. Endpoints returning these serialize through them and
+# declare the model under responses only, so FastAPI doesn't validate it again
+_connect_adapter = TypeAdapter(DatabaseConnectResponse)
+_scan_adapter = TypeAdapter(ScanResponse)
+
+
+def _scan_json_response(scan_response: ScanResponse) -> Response:
+    """Serialize a scan result straight to a JSON response."""
+    return Response(
+        content=_scan_adapter.dump_json(scan_response),
+        media_type="application/json",
+    )
+
+
+# Schema Cache
+
+SCHEMA_CACHE_TTL_SECONDS = 300
+
+# Serialized schema responses per target connection (see
+# DatabaseScannerService.connection_key). DDL on the target database is not
+# observable cheaply, so an entry lives for the TTL unless a new connection
+# or POST /schema/refresh drops it first.
+_schema_cache: TTLCache = TTLCache(maxsize=8, ttl=SCHEMA_CACHE_TTL_SECONDS)
+_schema_cache_lock = asyncio.Lock()
+_schema_adapter = TypeAdapter(DatabaseSchemaResponse)
+_table_adapter = TypeAdapter(TableInfoResponse)
+
+
+def invalidate_schema_cache() -> None:
+    """Drop every cached schema response."""
+    _schema_cache.clear()
+
+
 @router.get(
     "/connection",
     response_model=Optional[DatabaseConnectResponse],
@@ -172,12 +336,7 @@ async def get_active_connection(
     db: AsyncSession = Depends(get_db),
 ) -> DatabaseConnectResponse:
     """Get the active database connection details."""
-    result = await db.execute(
-        select(DatabaseConnection)
-        .where(DatabaseConnection.is_active == True)
-        .order_by(DatabaseConnection.created_at.desc())
-        .limit(1)
-    )
+    result = await db.execute(_ACTIVE_CONNECTION)
     connection = result.scalar_one_or_none()
 
     if connection is None:
@@ -202,9 +361,10 @@ async def get_active_connection(
 
 @router.post(
     "/connect",
-    response_model=DatabaseConnectResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     responses={
+        201: {"model": DatabaseConnectResponse, "description": "Successful Response"},
         400: {"model": ErrorResponse, "description": "Invalid connection parameters"},
         401: {"model": ErrorResponse, "description": "Authentication failed"},
         404: {"model": ErrorResponse, "description": "Database not found"},
@@ -219,7 +379,7 @@ async def connect_database(
     request: DatabaseConnectRequest,
     db: AsyncSession = Depends(get_db),
     scanner: DatabaseScannerService = Depends(get_scanner_service),
-) -> DatabaseConnectResponse:
+) -> Response:
     """Test and save a database connection.
     
     This endpoint:
@@ -234,7 +394,7 @@ async def connect_database(
         scanner: Database scanner service (injected)
         
     Returns:
-        DatabaseConnectResponse with the saved connection details
+        JSON DatabaseConnectResponse with the saved connection details
         
     Raises:
         HTTPException: Various status codes for different connection errors
@@ -252,20 +412,21 @@ async def connect_database(
     try:
         # Test the connection
         logger.info(
-            f"Testing connection to database '{request.database}' "
-            f"at {request.host}:{request.port}"
+            "Testing connection to database '%s' at %s:%s",
+            request.database, request.host, request.port,
         )
         
         await scanner.connect(connection_config)
+        # The new connection may point at a different database
+        invalidate_schema_cache()
         
         # Connection successful - save to database
-        # First, deactivate any existing active connections
-        existing_result = await db.execute(
-            select(DatabaseConnection).where(DatabaseConnection.is_active == True)
+        # First, deactivate any existing active connections in one UPDATE
+        await db.execute(
+            update(DatabaseConnection)
+            .where(DatabaseConnection.is_active == True)
+            .values(is_active=False)
         )
-        existing_connections = existing_result.scalars().all()
-        for existing in existing_connections:
-            existing.is_active = False
         
         # Create new connection record
         # Note: In production, password should be properly encrypted
@@ -279,70 +440,74 @@ async def connect_database(
             is_active=True,
         )
         
+        # id and created_at are server defaults, returned by the INSERT itself
         db.add(db_connection)
         await db.flush()
-        await db.refresh(db_connection)
         
         logger.info(
-            f"Successfully connected and saved connection to database "
-            f"'{request.database}' (ID: {db_connection.id})"
+            "Successfully connected and saved connection to database '%s' (ID: %s)",
+            request.database, db_connection.id,
         )
         
-        return DatabaseConnectResponse(
-            id=db_connection.id,
-            host=db_connection.host,
-            port=db_connection.port,
-            database_name=db_connection.database_name,
-            username=db_connection.username,
-            is_active=db_connection.is_active,
-            created_at=db_connection.created_at,
-            message=f"Successfully connected to database '{request.database}'.",
+        return Response(
+            content=_connect_adapter.dump_json(DatabaseConnectResponse.model_construct(
+                id=db_connection.id,
+                host=db_connection.host,
+                port=db_connection.port,
+                database_name=db_connection.database_name,
+                username=db_connection.username,
+                is_active=db_connection.is_active,
+                created_at=db_connection.created_at,
+                message=f"Successfully connected to database '{request.database}'.",
+            )),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
         )
         
     except AuthenticationError as e:
-        logger.warning(f"Authentication failed: {e}")
+        logger.warning("Authentication failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
         )
         
     except DatabaseNotFoundError as e:
-        logger.warning(f"Database not found: {e}")
+        logger.warning("Database not found: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
         
     except ConnectionTimeoutError as e:
-        logger.warning(f"Connection timeout: {e}")
+        logger.warning("Connection timeout: %s", e)
         raise HTTPException(
             status_code=status.HTTP_408_REQUEST_TIMEOUT,
             detail=str(e),
         )
         
     except HostUnreachableError as e:
-        logger.warning(f"Host unreachable: {e}")
+        logger.warning("Host unreachable: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
         
     except SSLError as e:
-        logger.warning(f"SSL error: {e}")
+        logger.warning("SSL error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
         
     except DatabaseConnectionError as e:
-        logger.error(f"Database connection error: {e}")
+        logger.error("Database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error connecting to database: {e}", exc_info=True)
+        logger.error("Unexpected error connecting to database: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while connecting to the database.",
@@ -351,18 +516,24 @@ async def connect_database(
 
 @router.get(
     "/schema",
-    response_model=DatabaseSchemaResponse,
+    response_model=None,
     responses={
+        200: {"model": DatabaseSchemaResponse, "description": "Successful Response"},
         400: {"model": ErrorResponse, "description": "Not connected to a database"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
     summary="Get target database schema",
     description="Retrieve the schema (tables, columns, data types) from the connected "
-                "target database.",
+                "target database. With stream=true the tables are returned as NDJSON, "
+                "one TableInfoResponse per line, as they are read.",
 )
 async def get_database_schema(
     scanner: DatabaseScannerService = Depends(get_scanner_service),
-) -> DatabaseSchemaResponse:
+    stream: bool = Query(
+        False,
+        description="Stream tables as NDJSON instead of returning one JSON document",
+    ),
+) -> Response:
     """Retrieve the schema from the connected database.
     
     This endpoint returns the complete schema of the target database including:
@@ -370,11 +541,18 @@ async def get_database_schema(
     - Column names, data types, and constraints for each table
     - Estimated row counts for each table
     
+    The response is cached per connection for SCHEMA_CACHE_TTL_SECONDS;
+    POST /schema/refresh re-reads it. Streamed responses always read the
+    live schema and are not cached, so very large schemas are never held
+    in memory whole.
+    
     Args:
         scanner: Database scanner service (injected)
+        stream: Whether to stream the tables as NDJSON
         
     Returns:
-        DatabaseSchemaResponse with the complete database schema
+        DatabaseSchemaResponse with the complete database schema, serialized
+        to JSON, or an NDJSON stream of TableInfoResponse objects
         
     Raises:
         HTTPException: 400 if not connected, 500 for server errors
@@ -383,12 +561,7 @@ async def get_database_schema(
         # Check if connected — auto-reconnect from saved connection if needed
         if not scanner.is_connected:
             async with async_session_maker() as reconnect_db:
-                result = await reconnect_db.execute(
-                    select(DatabaseConnection)
-                    .where(DatabaseConnection.is_active == True)
-                    .order_by(DatabaseConnection.created_at.desc())
-                    .limit(1)
-                )
+                result = await reconnect_db.execute(_ACTIVE_CONNECTION)
                 saved_conn = result.scalar_one_or_none()
             
             if saved_conn is None:
@@ -406,64 +579,142 @@ async def get_database_schema(
                 ssl=False,
             )
             await scanner.connect(connection_config)
-            logger.info(f"Auto-reconnected to database '{saved_conn.database_name}' for schema")
-        
-        # Retrieve schema
-        logger.info("Retrieving database schema")
-        schema = await scanner.get_schema()
-        
-        # Convert to response model
-        tables_response = [
-            TableInfoResponse(
-                name=table.name,
-                schema_name=table.schema_name,
-                columns=[
-                    ColumnInfoResponse(
-                        name=col.name,
-                        data_type=col.data_type,
-                        is_nullable=col.is_nullable,
-                        is_primary_key=col.is_primary_key,
-                        default_value=col.default_value,
-                    )
-                    for col in table.columns
-                ],
-                row_count=table.row_count,
-            )
-            for table in schema.tables
-        ]
+            logger.info("Auto-reconnected to database '%s' for schema", saved_conn.database_name)
         
-        logger.info(f"Retrieved schema with {len(tables_response)} tables")
+        if stream:
+            return StreamingResponse(
+                _stream_schema_tables(scanner),
+                media_type="application/x-ndjson",
+            )
         
-        return DatabaseSchemaResponse(
-            database_name=schema.database_name,
-            tables=tables_response,
-            version=schema.version,
-        )
+        cache_key = scanner.connection_key
+        body = _schema_cache.get(cache_key)
+        if body is None:
+            # Only one request introspects on a miss; the rest wait for its result
+            async with _schema_cache_lock:
+                body = _schema_cache.get(cache_key)
+                if body is None:
+                    logger.info("Retrieving database schema")
+                    schema = await scanner.get_schema()
+                    body = _schema_adapter.dump_json(_build_schema_response(schema))
+                    _schema_cache[cache_key] = body
+        
+        # The cached body is already JSON, so bypass response_model serialization
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
         
     except DatabaseConnectionError as e:
-        logger.error(f"Database connection error: {e}")
+        logger.error("Database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error retrieving schema: {e}", exc_info=True)
+        logger.error("Unexpected error retrieving schema: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while retrieving the database schema.",
         )
 
 
+@router.post(
+    "/schema/refresh",
+    response_model=None,
+    responses={
+        200: {"model": DatabaseSchemaResponse, "description": "Successful Response"},
+        400: {"model": ErrorResponse, "description": "Not connected to a database"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    summary="Refresh target database schema",
+    description="Discard the cached schema and retrieve it again from the connected "
+                "target database.",
+)
+async def refresh_database_schema(
+    scanner: DatabaseScannerService = Depends(get_scanner_service),
+) -> Response:
+    """Re-read the schema from the connected database, bypassing the cache.
+    
+    Args:
+        scanner: Database scanner service (injected)
+        
+    Returns:
+        DatabaseSchemaResponse with the complete database schema, serialized
+        to JSON
+        
+    Raises:
+        HTTPException: 400 if not connected, 500 for server errors
+    """
+    invalidate_schema_cache()
+    return await get_database_schema(scanner, stream=False)
+
+
+def _build_table_response(table: TableInfo) -> TableInfoResponse:
+    """Convert one of the scanner's tables into the API response model."""
+    # The scanner's models are validated already, so skip re-validation
+    return TableInfoResponse.model_construct(
+        name=table.name,
+        schema_name=table.schema_name,
+        columns=[
+            ColumnInfoResponse.model_construct(
+                name=col.name,
+                data_type=col.data_type,
+                is_nullable=col.is_nullable,
+                is_primary_key=col.is_primary_key,
+                default_value=col.default_value,
+            )
+            for col in table.columns
+        ],
+        row_count=table.row_count,
+    )
+
+
+async def _stream_schema_tables(scanner: DatabaseScannerService) -> AsyncIterator[bytes]:
+    """Serialize the target database's tables as NDJSON, one table per line.
+    
+    Args:
+        scanner: Connected database scanner service
+        
+    Yields:
+        One JSON-encoded TableInfoResponse per table, newline terminated
+    """
+    table_count = 0
+    async for table in scanner.iter_schema():
+        yield _table_adapter.dump_json(_build_table_response(table)) + b"\n"
+        table_count += 1
+    
+    logger.info("Streamed schema with %d tables", table_count)
+
+
+def _build_schema_response(schema: DatabaseSchema) -> DatabaseSchemaResponse:
+    """Convert the scanner's schema into the API response model.
+    
+    Args:
+        schema: Schema retrieved by the scanner service
+        
+    Returns:
+        DatabaseSchemaResponse for the schema
+    """
+    tables_response = [_build_table_response(table) for table in schema.tables]
+    
+    logger.info("Retrieved schema with %d tables", len(tables_response))
+    
+    return DatabaseSchemaResponse.model_construct(
+        database_name=schema.database_name,
+        tables=tables_response,
+        version=schema.version,
+    )
+
+
 @router.post(
     "/scan",
-    response_model=ScanResponse,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     responses={
+        200: {"model": ScanResponse, "description": "Successful Response"},
         400: {"model": ErrorResponse, "description": "Not connected to a database or no active rules"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
@@ -475,7 +726,7 @@ async def trigger_scan(
     request: Optional[ScanRequest] = None,
     db: AsyncSession = Depends(get_db),
     scanner: DatabaseScannerService = Depends(get_scanner_service),
-) -> ScanResponse:
+) -> Response:
     """Trigger a manual compliance scan.
     
     This endpoint:
@@ -490,7 +741,7 @@ async def trigger_scan(
         scanner: Database scanner service (injected)
         
     Returns:
-        ScanResponse with scan results and violation counts
+        JSON ScanResponse with scan results and violation counts
         
     Raises:
         HTTPException: 400 if not connected or no rules, 500 for server errors
@@ -498,12 +749,7 @@ async def trigger_scan(
     # Check if connected to target database — auto-reconnect from saved connection if needed
     if not scanner.is_connected:
         # Try to reconnect using saved active connection
-        result = await db.execute(
-            select(DatabaseConnection)
-            .where(DatabaseConnection.is_active == True)
-            .order_by(DatabaseConnection.created_at.desc())
-            .limit(1)
-        )
+        result = await db.execute(_ACTIVE_CONNECTION)
         saved_conn = result.scalar_one_or_none()
         
         if saved_conn is None:
@@ -523,68 +769,55 @@ async def trigger_scan(
                 ssl=False,
             )
             await scanner.connect(connection_config)
-            logger.info(f"Auto-reconnected to database '{saved_conn.database_name}' for scan")
+            logger.info("Auto-reconnected to database '%s' for scan", saved_conn.database_name)
         except Exception as e:
-            logger.error(f"Failed to auto-reconnect for scan: {e}")
+            logger.error("Failed to auto-reconnect for scan: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to reconnect to database: {e}",
             )
     
-    # Create scan history record
+    # The scan history row is inserted once, in its final state, in the same
+    # transaction as the violations. A RUNNING row flushed up front was never
+    # visible to other sessions before that commit anyway.
+    scan_id = uuid4()
+    started_at = datetime.now(timezone.utc)
     scan_history = ScanHistory(
+        id=scan_id,
+        started_at=started_at,
         status=ScanStatus.RUNNING.value,
         violations_found=0,
         new_violations=0,
     )
-    db.add(scan_history)
-    await db.flush()
-    await db.refresh(scan_history)
-    
-    scan_id = scan_history.id
-    started_at = scan_history.started_at
     
-    logger.info(f"Starting compliance scan (ID: {scan_id})")
+    logger.info("Starting compliance scan (ID: %s)", scan_id)
     
     try:
-        # Fetch compliance rules
-        if request and request.rule_ids:
-            # Fetch specific rules by ID
-            rules_result = await db.execute(
-                select(ComplianceRule).where(
-                    ComplianceRule.id.in_(request.rule_ids),
-                    ComplianceRule.is_active == True
-                )
-            )
-        else:
-            # Fetch all active rules
-            rules_result = await db.execute(
-                select(ComplianceRule).where(ComplianceRule.is_active == True)
-            )
-        
-        rules = list(rules_result.scalars().all())
+        # Fetch compliance rules, either the requested ones or all active rules
+        rules = await _get_active_rules(db, request.rule_ids if request else None)
         
         if not rules:
             # Update scan history with no rules found
             scan_history.status = ScanStatus.COMPLETED.value
             scan_history.completed_at = datetime.now(timezone.utc)
+            db.add(scan_history)
             await db.commit()
             
             logger.warning("No active compliance rules found for scan")
             
-            return ScanResponse(
+            return _scan_json_response(ScanResponse.model_construct(
                 scan_id=scan_id,
                 started_at=started_at,
                 completed_at=scan_history.completed_at,
                 status=ScanStatus.COMPLETED.value,
                 total_violations=0,
                 new_violations=0,
-                violations_by_severity=ViolationCountBySeverity(),
+                violations_by_severity=ViolationCountBySeverity.model_construct(),
                 rules_evaluated=0,
                 message="No active compliance rules found. Please add rules before scanning.",
-            )
+            ))
         
-        logger.info(f"Found {len(rules)} active rules to evaluate")
+        logger.info("Found %d active rules to evaluate", len(rules))
         
         # Execute the scan
         violations = await scanner.scan_for_violations(
@@ -593,18 +826,8 @@ async def trigger_scan(
             llm_client=None,  # Will use default LLM client
         )
         
-        # Count violations by severity
-        severity_counts: Dict[str, int] = {
-            Severity.LOW.value: 0,
-            Severity.MEDIUM.value: 0,
-            Severity.HIGH.value: 0,
-            Severity.CRITICAL.value: 0,
-        }
-        
-        for violation in violations:
-            severity = violation.severity
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        # Count violations by severity; severities without any read as 0
+        severity_counts = Counter(violation.severity for violation in violations)
         
         # Update scan history
         completed_at = datetime.now(timezone.utc)
@@ -612,15 +835,17 @@ async def trigger_scan(
         scan_history.completed_at = completed_at
         scan_history.violations_found = len(violations)
         scan_history.new_violations = len(violations)  # All violations are new in manual scan
+        db.add(scan_history)
         
-        await db.commit()
+        # No commit here: get_db commits the violations and the scan history
+        # once the response has been sent, so the client doesn't wait on it
         
         logger.info(
-            f"Scan completed (ID: {scan_id}): found {len(violations)} violations"
+            "Scan completed (ID: %s): found %d violations", scan_id, len(violations)
         )
         
         # Build response
-        violations_by_severity = ViolationCountBySeverity(
+        violations_by_severity = ViolationCountBySeverity.model_construct(
             low=severity_counts[Severity.LOW.value],
             medium=severity_counts[Severity.MEDIUM.value],
             high=severity_counts[Severity.HIGH.value],
@@ -639,7 +864,7 @@ async def trigger_scan(
                 f"Low: {severity_counts[Severity.LOW.value]}."
             )
         
-        return ScanResponse(
+        return _scan_json_response(ScanResponse.model_construct(
             scan_id=scan_id,
             started_at=started_at,
             completed_at=completed_at,
@@ -649,16 +874,17 @@ async def trigger_scan(
             violations_by_severity=violations_by_severity,
             rules_evaluated=len(rules),
             message=message,
-        )
+        ))
         
     except DatabaseConnectionError as e:
         # Update scan history with failure
         scan_history.status = ScanStatus.FAILED.value
         scan_history.completed_at = datetime.now(timezone.utc)
         scan_history.error_message = str(e)
+        db.add(scan_history)
         await db.commit()
         
-        logger.error(f"Scan failed due to database connection error: {e}")
+        logger.error("Scan failed due to database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Database connection error during scan: {e}",
@@ -669,12 +895,13 @@ async def trigger_scan(
         scan_history.status = ScanStatus.FAILED.value
         scan_history.completed_at = datetime.now(timezone.utc)
         scan_history.error_message = str(e)
+        db.add(scan_history)
         try:
             await db.commit()
         except Exception:
             await db.rollback()
         
-        logger.error(f"Unexpected error during scan: {e}", exc_info=True)
+        logger.error("Unexpected error during scan: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Scan error: {str(e)[:500]}",
@@ -27,7 +27,7 @@ from app.services.scheduler import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/monitoring", tags=["Monitoring"])
+router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
 
 
 # Pydantic Models
@@ -160,8 +160,8 @@ async def get_status(
     status = scheduler.get_status()
     
     logger.info(
-        f"Scheduler status requested: running={status.is_running}, "
-        f"enabled={status.is_enabled}, interval={status.interval_minutes}"
+        "Scheduler status requested: running=%s, enabled=%s, interval=%s",
+        status.is_running, status.is_enabled, status.interval_minutes,
     )
     
     return SchedulerStatusResponse(
@@ -207,7 +207,7 @@ async def configure_schedule(
     try:
         message = await scheduler.schedule_scan(config.interval_minutes)
         
-        logger.info(f"Schedule configured: interval={config.interval_minutes} minutes")
+        logger.info("Schedule configured: interval=%s minutes", config.interval_minutes)
         
         # Get the updated status to return next_run_at and last_run_at
         scheduler_status = scheduler.get_status()
@@ -220,7 +220,7 @@ async def configure_schedule(
             last_run_at=scheduler_status.last_run_time,
         )
     except SchedulerConfigError as e:
-        logger.warning(f"Invalid schedule configuration: {e}")
+        logger.warning("Invalid schedule configuration: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
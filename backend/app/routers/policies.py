@@ -7,16 +7,19 @@ This module provides FastAPI endpoints for managing policy documents:
 - Delete policies
 """
 
+import hashlib
 import logging
 from datetime import datetime
+from itertools import chain
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from pydantic import BaseModel, ConfigDict
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models.compliance_rule import ComplianceRule
@@ -25,15 +28,17 @@ from app.models.policy import Policy
 from app.services.policy_parser import (
     CorruptedPDFError,
     EmptyPDFError,
+    PDF_HEADER_SCAN_BYTES,
     FileTooLargeError,
     PolicyParserService,
     UnsupportedFormatError,
     get_policy_parser_service,
+    has_pdf_header,
 )
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/policies", tags=["Policies"])
+router = APIRouter(prefix="/policies", tags=["Policies"])
 
 
 # Pydantic Response Models
@@ -96,6 +101,68 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+# Upload content types accepted without a .pdf filename
+_PDF_CONTENT_TYPES = frozenset({"application/pdf", "application/x-pdf", "application/octet-stream"})
+
+# Built once at import; the detail endpoint returns bodies serialized through
+# it, so its route declares no response_model for FastAPI to run again. The
+# list dumps its typed rows with orjson, without validating them first
+_policy_detail_adapter = TypeAdapter(PolicyDetailResponse)
+
+# Policies and their rule sets are never modified after upload, so the
+# newest upload time and the policy count identify the list's contents
+_POLICY_LIST_VERSION = select(func.max(Policy.uploaded_at), func.count(Policy.id))
+
+# A policy's rules as one JSON array of the ComplianceRuleResponse fields, so
+# the detail endpoint reads a policy and its rules as a single row; a JOIN
+# would repeat the policy's raw_text on every rule row
+_POLICY_RULES_JSON = (
+    select(
+        func.coalesce(
+            func.json_agg(
+                postgresql.aggregate_order_by(
+                    func.json_build_object(
+                        *chain.from_iterable(
+                            (literal_column(f"'{name}'"), getattr(ComplianceRule, name))
+                            for name in ComplianceRuleResponse.model_fields
+                        )
+                    ),
+                    ComplianceRule.created_at,
+                ),
+                type_=postgresql.JSON,
+            ),
+            literal_column("'[]'::json"),
+        )
+    )
+    .where(ComplianceRule.policy_id == Policy.id)
+    .scalar_subquery()
+)
+
+
+def _etag(content: bytes) -> str:
+    """Compute a strong ETag for a response body or version key."""
+    return f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return 304 Not Modified if the client's If-None-Match holds ``etag``."""
+    if request.headers.get("if-none-match") != etag:
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def _json_response(content: bytes, etag: str) -> Response:
+    """Return a serialized JSON body that clients must revalidate by ETag."""
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
 # API Endpoints
 
 @router.post(
@@ -134,21 +201,34 @@ async def upload_policy(
     Raises:
         HTTPException: 400 for invalid PDF, 413 for file too large, 500 for server errors
     """
-    # Validate content type - be lenient, rely on magic bytes check in parser
-    logger.info(f"Upload attempt: filename={file.filename}, content_type={file.content_type}, size={file.size}")
-    if file.content_type and file.content_type not in (
-        "application/pdf",
-        "application/x-pdf",
-        "application/octet-stream",
-        None,
+    logger.info(
+        "Upload attempt: filename=%s, content_type=%s, size=%s",
+        file.filename,
+        file.content_type,
+        file.size,
+    )
+    # Validate content type - be lenient, also allow a .pdf filename
+    content_type = file.content_type
+    if (
+        content_type
+        and content_type not in _PDF_CONTENT_TYPES
+        and not (file.filename or "").lower().endswith(".pdf")
     ):
-        # Also allow if filename ends with .pdf
-        if not (file.filename and file.filename.lower().endswith(".pdf")):
-            logger.warning(f"Invalid content type: {file.content_type}, filename: {file.filename}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Please upload a valid PDF file. Received content type: {file.content_type}",
-            )
+        logger.warning("Invalid content type: %s, filename: %s", content_type, file.filename)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Please upload a valid PDF file. Received content type: {content_type}",
+        )
+    
+    # Reject files without PDF magic bytes before any parsing work is queued
+    pdf_header = await file.read(PDF_HEADER_SCAN_BYTES)
+    await file.seek(0)
+    if not has_pdf_header(pdf_header):
+        logger.warning("Invalid PDF magic bytes, filename: %s", file.filename)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Please upload a valid PDF file.",
+        )
     
     try:
         # Process the policy document
@@ -158,8 +238,9 @@ async def upload_policy(
         rule_count = len(policy.rules) if policy.rules else 0
         
         logger.info(
-            f"Successfully uploaded policy '{policy.filename}' "
-            f"with {rule_count} rules"
+            "Successfully uploaded policy '%s' with %d rules",
+            policy.filename,
+            rule_count,
         )
         
         return PolicyUploadResponse(
@@ -172,31 +253,31 @@ async def upload_policy(
         )
         
     except FileTooLargeError as e:
-        logger.warning(f"File too large: {e}")
+        logger.warning("File too large: %s", e)
         raise HTTPException(
             status_code=status.HTTP_413_CONTENT_TOO_LARGE,
             detail=str(e),
         )
     except UnsupportedFormatError as e:
-        logger.warning(f"Unsupported format: {e}")
+        logger.warning("Unsupported format: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except CorruptedPDFError as e:
-        logger.warning(f"Corrupted PDF: {e}")
+        logger.warning("Corrupted PDF: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except EmptyPDFError as e:
-        logger.warning(f"Empty PDF: {e}")
+        logger.warning("Empty PDF: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Unexpected error processing policy: {e}", exc_info=True)
+        logger.error("Unexpected error processing policy: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing policy: {str(e)}",
@@ -205,44 +286,60 @@ async def upload_policy(
 
 @router.get(
     "",
-    response_model=List[PolicyResponse],
+    response_model=None,
+    responses={
+        200: {"model": List[PolicyResponse], "description": "Successful Response"},
+    },
     summary="List all policies",
     description="Retrieve a list of all uploaded policy documents with their rule counts.",
 )
 async def list_policies(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> List[PolicyResponse]:
+) -> Response:
     """List all policy documents.
     
+    Answers 304 Not Modified, without listing, when the client's
+    If-None-Match still matches the policies' version.
+    
     Args:
+        request: The incoming request
         db: Database session (injected)
         
     Returns:
-        List of PolicyResponse objects
+        List of PolicyResponse objects, serialized to JSON
     """
-    # Query all policies with their rules loaded
+    version = (await db.execute(_POLICY_LIST_VERSION)).one()
+    etag = _etag(repr(tuple(version)).encode())
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    # Count rules in SQL and select only the listed columns, so neither the
+    # rules nor raw_text are loaded
     result = await db.execute(
-        select(Policy).options(selectinload(Policy.rules)).order_by(Policy.uploaded_at.desc())
+        select(
+            Policy.id,
+            Policy.filename,
+            Policy.status,
+            Policy.uploaded_at,
+            func.count(ComplianceRule.id).label("rule_count"),
+        )
+        .outerjoin(ComplianceRule, ComplianceRule.policy_id == Policy.id)
+        .group_by(Policy.id)
+        .order_by(Policy.uploaded_at.desc())
     )
-    policies = result.scalars().all()
     
-    # Convert to response models with rule counts
-    return [
-        PolicyResponse(
-            id=policy.id,
-            filename=policy.filename,
-            status=policy.status,
-            uploaded_at=policy.uploaded_at,
-            rule_count=len(policy.rules) if policy.rules else 0,
-        )
-        for policy in policies
-    ]
+    # Row keys are named after PolicyResponse's fields
+    content = orjson.dumps([dict(row) for row in result.mappings()])
+    return _json_response(content, etag)
 
 
 @router.get(
     "/{policy_id}",
-    response_model=PolicyDetailResponse,
+    response_model=None,
     responses={
+        200: {"model": PolicyDetailResponse, "description": "Successful Response"},
         404: {"model": ErrorResponse, "description": "Policy not found"},
     },
     summary="Get policy details",
@@ -250,27 +347,40 @@ async def list_policies(
 )
 async def get_policy(
     policy_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> PolicyDetailResponse:
+) -> Response:
     """Get a specific policy with its rules.
     
+    The ETag is taken from the body, since rules can be enabled or disabled
+    after upload; a matching If-None-Match still saves sending the
+    policy's raw text.
+    
     Args:
         policy_id: The UUID of the policy to retrieve
+        request: The incoming request
         db: Database session (injected)
         
     Returns:
-        PolicyDetailResponse with full policy details and rules
+        PolicyDetailResponse with full policy details and rules, serialized
+        to JSON
         
     Raises:
         HTTPException: 404 if policy not found
     """
-    # Query the policy with rules
+    # Query the policy with its rules in one round-trip
     result = await db.execute(
-        select(Policy)
-        .options(selectinload(Policy.rules))
+        select(
+            Policy.id,
+            Policy.filename,
+            Policy.status,
+            Policy.uploaded_at,
+            Policy.raw_text,
+            _POLICY_RULES_JSON.label("rules"),
+        )
         .where(Policy.id == policy_id)
     )
-    policy = result.scalar_one_or_none()
+    policy = result.one_or_none()
     
     if policy is None:
         raise HTTPException(
@@ -278,30 +388,14 @@ async def get_policy(
             detail=f"Policy with ID '{policy_id}' not found.",
         )
     
-    # Convert rules to response models
-    rules_response = [
-        ComplianceRuleResponse(
-            id=rule.id,
-            policy_id=rule.policy_id,
-            rule_code=rule.rule_code,
-            description=rule.description,
-            evaluation_criteria=rule.evaluation_criteria,
-            target_table=rule.target_table,
-            severity=rule.severity,
-            is_active=rule.is_active,
-            created_at=rule.created_at,
-        )
-        for rule in (policy.rules or [])
-    ]
+    policy_response = PolicyDetailResponse.model_validate(policy, from_attributes=True)
+    content = _policy_detail_adapter.dump_json(policy_response)
+    etag = _etag(content)
     
-    return PolicyDetailResponse(
-        id=policy.id,
-        filename=policy.filename,
-        status=policy.status,
-        uploaded_at=policy.uploaded_at,
-        raw_text=policy.raw_text,
-        rules=rules_response,
-    )
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return _json_response(content, etag)
 
 
 @router.delete(
@@ -328,19 +422,20 @@ async def delete_policy(
     Raises:
         HTTPException: 404 if policy not found
     """
-    # Query the policy
+    # One DELETE finds and removes the policy; its rules, their violations
+    # and review actions go with it through the ON DELETE CASCADE foreign keys
     result = await db.execute(
-        select(Policy).where(Policy.id == policy_id)
+        delete(Policy)
+        .where(Policy.id == policy_id)
+        .returning(Policy.filename)
+        .execution_options(synchronize_session=False)
     )
-    policy = result.scalar_one_or_none()
+    filename = result.scalar_one_or_none()
     
-    if policy is None:
+    if filename is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Policy with ID '{policy_id}' not found.",
         )
     
-    # Delete the policy (cascade will delete associated rules)
-    await db.delete(policy)
-    
-    logger.info(f"Deleted policy '{policy.filename}' (ID: {policy_id})")
+    logger.info("Deleted policy '%s' (ID: %s)", filename, policy_id)
@@ -11,19 +11,21 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models.compliance_rule import ComplianceRule
+from app.models.enums import Severity
 
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/rules", tags=["Rules"])
+router = APIRouter(prefix="/rules", tags=["Rules"])
 
 
 # Pydantic Models
@@ -57,33 +59,69 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+# Built once at import; the single-rule endpoints return bodies serialized
+# through it, so their routes declare no response_model for FastAPI to run again
+_rule_adapter = TypeAdapter(RuleResponse)
+
+# The list selects RuleResponse's columns directly and dumps the typed rows
+# with orjson, skipping ORM hydration and model validation per row
+_RULE_LIST_COLUMNS = tuple(getattr(ComplianceRule, name) for name in RuleResponse.model_fields)
+
+
 # API Endpoints
 
 @router.get(
     "",
-    response_model=List[RuleResponse],
+    response_model=None,
+    responses={
+        200: {"model": List[RuleResponse], "description": "Successful Response"},
+    },
     summary="List all compliance rules",
-    description="Retrieve a list of all extracted compliance rules across all policies.",
+    description="Retrieve extracted compliance rules across all policies, newest first. "
+                "Pass skip and limit to page through them.",
 )
 async def list_rules(
     db: AsyncSession = Depends(get_db),
     is_active: Optional[bool] = None,
     severity: Optional[str] = None,
     policy_id: Optional[UUID] = None,
-) -> List[RuleResponse]:
-    """List all compliance rules with optional filtering.
+    skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Maximum number of records to return (all by default)"
+    ),
+) -> Response:
+    """List compliance rules with optional filtering and pagination.
     
     Args:
         db: Database session (injected)
         is_active: Filter by active status (optional)
         severity: Filter by severity level (optional)
         policy_id: Filter by policy ID (optional)
+        skip: Number of records to skip
+        limit: Maximum number of records to return (optional). The list
+            carries no total, so clients that do not page get every rule.
         
     Returns:
-        List of RuleResponse objects
+        List of RuleResponse objects, serialized to JSON
+        
+    Raises:
+        HTTPException: 400 if the severity filter is not a valid level
     """
-    # Build query with optional filters
-    query = select(ComplianceRule).order_by(ComplianceRule.created_at.desc())
+    # Validate severity filter if provided; severity is a native enum column,
+    # so an unknown value would otherwise fail in the database
+    if severity is not None:
+        valid_severities = [s.value for s in Severity]
+        if severity not in valid_severities:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid severity '{severity}'. Valid values are: {', '.join(valid_severities)}",
+            )
+    
+    # Build query with optional filters; rules extracted together share a
+    # created_at, so id breaks ties to keep pages stable
+    query = select(*_RULE_LIST_COLUMNS).order_by(
+        ComplianceRule.created_at.desc(), ComplianceRule.id.desc()
+    )
     
     if is_active is not None:
         query = query.where(ComplianceRule.is_active == is_active)
@@ -94,30 +132,23 @@ async def list_rules(
     if policy_id is not None:
         query = query.where(ComplianceRule.policy_id == policy_id)
     
+    query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    
     result = await db.execute(query)
-    rules = result.scalars().all()
-    
-    return [
-        RuleResponse(
-            id=rule.id,
-            policy_id=rule.policy_id,
-            rule_code=rule.rule_code,
-            description=rule.description,
-            evaluation_criteria=rule.evaluation_criteria,
-            target_table=rule.target_table,
-            generated_sql=rule.generated_sql,
-            severity=rule.severity,
-            is_active=rule.is_active,
-            created_at=rule.created_at,
-        )
-        for rule in rules
-    ]
+    
+    return Response(
+        content=orjson.dumps([dict(row) for row in result.mappings()]),
+        media_type="application/json",
+    )
 
 
 @router.get(
     "/{rule_id}",
-    response_model=RuleResponse,
+    response_model=None,
     responses={
+        200: {"model": RuleResponse, "description": "Successful Response"},
         404: {"model": ErrorResponse, "description": "Rule not found"},
     },
     summary="Get rule details",
@@ -126,7 +157,7 @@ async def list_rules(
 async def get_rule(
     rule_id: UUID,
     db: AsyncSession = Depends(get_db),
-) -> RuleResponse:
+) -> Response:
     """Get a specific compliance rule by ID.
     
     Args:
@@ -134,7 +165,7 @@ async def get_rule(
         db: Database session (injected)
         
     Returns:
-        RuleResponse with full rule details
+        RuleResponse with full rule details, serialized to JSON
         
     Raises:
         HTTPException: 404 if rule not found
@@ -150,24 +181,19 @@ async def get_rule(
             detail=f"Rule with ID '{rule_id}' not found.",
         )
     
-    return RuleResponse(
-        id=rule.id,
-        policy_id=rule.policy_id,
-        rule_code=rule.rule_code,
-        description=rule.description,
-        evaluation_criteria=rule.evaluation_criteria,
-        target_table=rule.target_table,
-        generated_sql=rule.generated_sql,
-        severity=rule.severity,
-        is_active=rule.is_active,
-        created_at=rule.created_at,
+    rule_response = RuleResponse.model_validate(rule)
+    
+    return Response(
+        content=_rule_adapter.dump_json(rule_response),
+        media_type="application/json",
     )
 
 
 @router.patch(
     "/{rule_id}",
-    response_model=RuleResponse,
+    response_model=None,
     responses={
+        200: {"model": RuleResponse, "description": "Successful Response"},
         404: {"model": ErrorResponse, "description": "Rule not found"},
     },
     summary="Update a rule",
@@ -177,7 +203,7 @@ async def update_rule(
     rule_id: UUID,
     update_data: RuleUpdateRequest,
     db: AsyncSession = Depends(get_db),
-) -> RuleResponse:
+) -> Response:
     """Update a compliance rule (enable/disable).
     
     Args:
@@ -186,14 +212,25 @@ async def update_rule(
         db: Database session (injected)
         
     Returns:
-        RuleResponse with updated rule details
+        RuleResponse with updated rule details, serialized to JSON
         
     Raises:
         HTTPException: 404 if rule not found
     """
-    result = await db.execute(
-        select(ComplianceRule).where(ComplianceRule.id == rule_id)
-    )
+    values = update_data.model_dump(exclude_unset=True, exclude_none=True)
+    if values:
+        # One round-trip writes the fields and returns the updated row; the
+        # session will be committed by the get_db dependency
+        stmt = (
+            update(ComplianceRule)
+            .where(ComplianceRule.id == rule_id)
+            .values(**values)
+            .returning(ComplianceRule)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(ComplianceRule).where(ComplianceRule.id == rule_id)
+    result = await db.execute(stmt)
     rule = result.scalar_one_or_none()
     
     if rule is None:
@@ -202,27 +239,17 @@ async def update_rule(
             detail=f"Rule with ID '{rule_id}' not found.",
         )
     
-    # Update fields if provided
-    if update_data.is_active is not None:
-        rule.is_active = update_data.is_active
+    if "is_active" in values:
         logger.info(
-            f"Rule '{rule.rule_code}' (ID: {rule_id}) "
-            f"{'enabled' if update_data.is_active else 'disabled'}"
+            "Rule '%s' (ID: %s) %s",
+            rule.rule_code,
+            rule_id,
+            "enabled" if rule.is_active else "disabled",
         )
     
-    # The session will be committed by the get_db dependency
-    await db.flush()
-    await db.refresh(rule)
-    
-    return RuleResponse(
-        id=rule.id,
-        policy_id=rule.policy_id,
-        rule_code=rule.rule_code,
-        description=rule.description,
-        evaluation_criteria=rule.evaluation_criteria,
-        target_table=rule.target_table,
-        generated_sql=rule.generated_sql,
-        severity=rule.severity,
-        is_active=rule.is_active,
-        created_at=rule.created_at,
+    rule_response = RuleResponse.model_validate(rule)
+    
+    return Response(
+        content=_rule_adapter.dump_json(rule_response),
+        media_type="application/json",
     )
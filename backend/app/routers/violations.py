@@ -13,7 +13,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,7 +26,7 @@ from app.models.violation import Violation
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/violations", tags=["Violations"])
+router = APIRouter(prefix="/violations", tags=["Violations"])
 
 
 # Pydantic Models
@@ -253,12 +253,12 @@ async def list_violations(
         base_query = base_query.where(and_(*conditions))
     
     # Get total count
-    count_query = select(Violation)
+    count_query = select(func.count()).select_from(Violation)
     if conditions:
         count_query = count_query.where(and_(*conditions))
     
     count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    total = count_result.scalar_one()
     
     # Apply pagination
     paginated_query = base_query.offset(skip).limit(limit)
@@ -5,15 +5,18 @@ retrieve schema information, generate SQL queries for compliance rules,
 and scan for compliance violations.
 """
 
+import asyncio
 import logging
 import re
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Optional, TYPE_CHECKING
 from uuid import UUID
 
 import asyncpg
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+
 if TYPE_CHECKING:
     from app.models.compliance_rule import ComplianceRule
     from app.models.violation import Violation
@@ -145,7 +148,7 @@ class DatabaseScannerService:
     """Service for connecting to and scanning PostgreSQL databases.
     
     This service handles:
-    - Establishing connections to target PostgreSQL databases
+    - Establishing a connection pool to target PostgreSQL databases
     - Retrieving database schema information (tables, columns, types)
     - Error handling with diagnostic messages
     
@@ -158,16 +161,35 @@ class DatabaseScannerService:
 
     def __init__(self):
         """Initialize the DatabaseScannerService."""
-        self._connection: Optional[asyncpg.Connection] = None
+        self._pool: Optional[asyncpg.Pool] = None
         self._config: Optional[DBConnectionConfig] = None
 
     @property
     def is_connected(self) -> bool:
-        """Check if there is an active database connection."""
-        return self._connection is not None and not self._connection.is_closed()
+        """Check if there is an open connection pool."""
+        return self._pool is not None and not self._pool.is_closing()
+
+    @property
+    def connection_key(self) -> Optional[tuple[str, int, str, str]]:
+        """Identify the target database of the current configuration.
+        
+        Returns:
+            (host, port, database, username), or None before connect().
+        """
+        if self._config is None:
+            return None
+        return (
+            self._config.host,
+            self._config.port,
+            self._config.database,
+            self._config.username,
+        )
 
     async def connect(self, connection_config: DBConnectionConfig) -> bool:
-        """Establish connection to target PostgreSQL database.
+        """Establish a connection pool to the target PostgreSQL database.
+        
+        The pool opens its minimum number of connections up front, so
+        connection errors surface here.
         
         Args:
             connection_config: Configuration containing connection details.
@@ -182,7 +204,7 @@ class DatabaseScannerService:
             ConnectionTimeoutError: If the connection times out.
             SSLError: If SSL/TLS connection fails.
         """
-        # Close any existing connection
+        # Close any existing pool
         await self.disconnect()
         
         self._config = connection_config
@@ -196,8 +218,9 @@ class DatabaseScannerService:
                 f"'{connection_config.database}' at {connection_config.host}:{connection_config.port}"
             )
             
-            # Establish connection with timeout
-            self._connection = await asyncpg.connect(
+            # Establish the pool; each connection attempt has a timeout
+            settings = get_settings()
+            self._pool = await asyncpg.create_pool(
                 host=connection_config.host,
                 port=connection_config.port,
                 database=connection_config.database,
@@ -205,6 +228,8 @@ class DatabaseScannerService:
                 password=connection_config.password,
                 ssl=ssl_context,
                 timeout=30,  # 30 second connection timeout
+                min_size=settings.target_db_pool_min_size,
+                max_size=settings.target_db_pool_max_size,
             )
             
             logger.info(
@@ -253,11 +278,11 @@ class DatabaseScannerService:
             raise DatabaseConnectionError(f"Failed to connect to database: {e}")
 
     async def disconnect(self) -> None:
-        """Close the database connection if open."""
-        if self._connection is not None and not self._connection.is_closed():
-            await self._connection.close()
-            logger.info("Database connection closed")
-        self._connection = None
+        """Close the connection pool if open."""
+        if self._pool is not None and not self._pool.is_closing():
+            await self._pool.close()
+            logger.info("Database connection pool closed")
+        self._pool = None
 
     async def get_schema(self) -> DatabaseSchema:
         """Retrieve table and column metadata from target database.
@@ -274,7 +299,33 @@ class DatabaseScannerService:
         logger.info(f"Retrieving schema for database '{self._config.database}'")
         
         # Get PostgreSQL version
-        version_result = await self._connection.fetchval("SELECT version()")
+        version_result = await self._pool.fetchval("SELECT version()")
+        
+        tables = [table async for table in self.iter_schema()]
+        
+        schema = DatabaseSchema(
+            database_name=self._config.database,
+            tables=tables,
+            version=version_result,
+        )
+        
+        logger.info(
+            f"Retrieved schema with {len(tables)} tables from database '{self._config.database}'"
+        )
+        
+        return schema
+
+    async def iter_schema(self) -> AsyncIterator[TableInfo]:
+        """Yield table and column metadata from target database, one table at a time.
+        
+        Yields:
+            TableInfo for each user table, ordered by schema and table name.
+            
+        Raises:
+            DatabaseConnectionError: If not connected to a database.
+        """
+        if not self.is_connected or self._config is None:
+            raise DatabaseConnectionError("Not connected to a database. Call connect() first.")
         
         # Query to get all tables in the public schema (and other user schemas)
         tables_query = """
@@ -292,9 +343,7 @@ class DatabaseScannerService:
             ORDER BY t.table_schema, t.table_name
         """
         
-        tables_result = await self._connection.fetch(tables_query)
-        
-        tables: list[TableInfo] = []
+        tables_result = await self._pool.fetch(tables_query)
         
         for table_row in tables_result:
             schema_name = table_row['table_schema']
@@ -324,7 +373,7 @@ class DatabaseScannerService:
                 ORDER BY c.ordinal_position
             """
             
-            columns_result = await self._connection.fetch(
+            columns_result = await self._pool.fetch(
                 columns_query, schema_name, table_name
             )
             
@@ -339,25 +388,12 @@ class DatabaseScannerService:
                 )
                 columns.append(column)
             
-            table_info = TableInfo(
+            yield TableInfo(
                 name=table_name,
                 schema_name=schema_name,
                 columns=columns,
                 row_count=int(estimated_rows) if estimated_rows is not None else None,
             )
-            tables.append(table_info)
-        
-        schema = DatabaseSchema(
-            database_name=self._config.database,
-            tables=tables,
-            version=version_result,
-        )
-        
-        logger.info(
-            f"Retrieved schema with {len(tables)} tables from database '{self._config.database}'"
-        )
-        
-        return schema
 
     def schema_to_dict(self, schema: DatabaseSchema) -> dict[str, Any]:
         """Convert DatabaseSchema to a dictionary format suitable for LLM prompts.
@@ -554,9 +590,8 @@ class DatabaseScannerService:
         Raises:
             DatabaseConnectionError: If not connected to a database.
         """
-        from app.models.violation import Violation
-        from app.models.enums import ViolationStatus
         from app.services.llm_client import get_llm_client
+        from app.services.violation_writer import bulk_insert_violations
         
         if not self.is_connected:
             raise DatabaseConnectionError("Not connected to a database. Call connect() first.")
@@ -572,79 +607,112 @@ class DatabaseScannerService:
         # Get database schema for query generation
         schema = await self.get_schema()
         
-        violations: list[Violation] = []
-        
         # Filter to only active rules
         active_rules = [rule for rule in rules if rule.is_active]
         
         logger.info(f"Scanning {len(active_rules)} active rules for violations")
         
+        # Rules are independent, so their SQL generation (LLM) and queries
+        # overlap, bounded by the semaphore; results keep the rule order
+        semaphore = asyncio.Semaphore(get_settings().scan_rule_concurrency)
+        
+        async def scan_rule(rule: "ComplianceRule") -> list["Violation"]:
+            async with semaphore:
+                return await self._scan_rule(rule, schema, llm_client)
+        
+        results = await asyncio.gather(*(scan_rule(rule) for rule in active_rules))
+        violations = [violation for rule_violations in results for violation in rule_violations]
+        
+        # Write all violations in one COPY (don't commit — caller manages the session)
+        if violations:
+            await bulk_insert_violations(db_session, violations)
+            logger.info(f"Created {len(violations)} violations")
+        
+        return violations
+
+    async def _scan_rule(
+        self,
+        rule: "ComplianceRule",
+        schema: DatabaseSchema,
+        llm_client: Optional["LLMClient"],
+    ) -> list["Violation"]:
+        """Evaluate one rule against the target database.
+        
+        Errors are logged and skip the rule, so one bad rule doesn't fail
+        the scan.
+        
+        Args:
+            rule: Active compliance rule to evaluate.
+            schema: Target database schema, for SQL generation.
+            llm_client: LLM client for SQL generation, if available.
+            
+        Returns:
+            Violation objects (not yet persisted) for the violating records.
+        """
+        from app.models.violation import Violation
+        from app.models.enums import ViolationStatus
+        
         MAX_VIOLATIONS_PER_RULE = 50  # Limit to avoid overwhelming the system
         
-        for rule in active_rules:
-            try:
-                # Generate SQL if not already present
-                sql_query = rule.generated_sql
-                if not sql_query:
-                    try:
-                        sql_query = await self.generate_query(rule, schema, llm_client)
-                    except SQLGenerationError as e:
-                        logger.warning(f"Skipping rule '{rule.rule_code}': {e}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Skipping rule '{rule.rule_code}' (SQL gen failed): {e}")
-                        continue
-                
-                # Execute the query against the target database
-                logger.info(f"Executing query for rule '{rule.rule_code}'")
-                
+        violations: list[Violation] = []
+        
+        try:
+            # Generate SQL if not already present
+            sql_query = rule.generated_sql
+            if not sql_query:
                 try:
-                    records = await self._connection.fetch(sql_query)
+                    sql_query = await self.generate_query(rule, schema, llm_client)
+                except SQLGenerationError as e:
+                    logger.warning(f"Skipping rule '{rule.rule_code}': {e}")
+                    return violations
                 except Exception as e:
-                    logger.error(f"Query execution failed for rule '{rule.rule_code}': {e}")
-                    continue
+                    logger.warning(f"Skipping rule '{rule.rule_code}' (SQL gen failed): {e}")
+                    return violations
+            
+            # Execute the query against the target database
+            logger.info(f"Executing query for rule '{rule.rule_code}'")
+            
+            try:
+                records = await self._pool.fetch(sql_query)
+            except Exception as e:
+                logger.error(f"Query execution failed for rule '{rule.rule_code}': {e}")
+                return violations
+            
+            logger.info(f"Found {len(records)} potential violations for rule '{rule.rule_code}'")
+            
+            # Limit violations per rule
+            capped_records = records[:MAX_VIOLATIONS_PER_RULE]
+            
+            # Create violations for each violating record (no LLM calls for speed)
+            for record in capped_records:
+                record_data = {
+                    k: (v.isoformat() if hasattr(v, 'isoformat') else str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v)
+                    for k, v in dict(record).items()
+                }
+                record_identifier = self._get_record_identifier(record_data)
                 
-                logger.info(f"Found {len(records)} potential violations for rule '{rule.rule_code}'")
+                # Use template-based justification (fast, no LLM)
+                justification = (
+                    f"Record violates rule '{rule.rule_code}': {rule.description}. "
+                    f"Evaluation criteria: {rule.evaluation_criteria}"
+                )
+                remediation = f"Review record '{record_identifier}' and ensure compliance with rule '{rule.rule_code}'."
                 
-                # Limit violations per rule
-                capped_records = records[:MAX_VIOLATIONS_PER_RULE]
+                # id and detected_at are left to the database defaults
+                violation = Violation(
+                    rule_id=rule.id,
+                    record_identifier=record_identifier,
+                    record_data=record_data,
+                    justification=justification,
+                    remediation_suggestion=remediation,
+                    severity=rule.severity,
+                    status=ViolationStatus.PENDING.value,
+                )
                 
-                # Create violations for each violating record (no LLM calls for speed)
-                for record in capped_records:
-                    record_data = {
-                        k: (v.isoformat() if hasattr(v, 'isoformat') else str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v)
-                        for k, v in dict(record).items()
-                    }
-                    record_identifier = self._get_record_identifier(record_data)
-                    
-                    # Use template-based justification (fast, no LLM)
-                    justification = (
-                        f"Record violates rule '{rule.rule_code}': {rule.description}. "
-                        f"Evaluation criteria: {rule.evaluation_criteria}"
-                    )
-                    remediation = f"Review record '{record_identifier}' and ensure compliance with rule '{rule.rule_code}'."
-                    
-                    violation = Violation(
-                        rule_id=rule.id,
-                        record_identifier=record_identifier,
-                        record_data=record_data,
-                        justification=justification,
-                        remediation_suggestion=remediation,
-                        severity=rule.severity,
-                        status=ViolationStatus.PENDING.value,
-                    )
-                    
-                    db_session.add(violation)
-                    violations.append(violation)
-                    
-            except Exception as e:
-                logger.error(f"Error processing rule '{rule.rule_code}': {e}")
-                continue
-        
-        # Flush all violations to the database (don't commit — caller manages the session)
-        if violations:
-            await db_session.flush()
-            logger.info(f"Created {len(violations)} violations")
+                violations.append(violation)
+                
+        except Exception as e:
+            logger.error(f"Error processing rule '{rule.rule_code}': {e}")
         
         return violations
 
@@ -0,0 +1,153 @@
+"""Migration Runner Service for applying Alembic migrations at startup.
+
+This module runs ``alembic upgrade head`` from inside the application so a
+deployment does not need a separate migration step. Migrations can either
+block startup (``sync``), failing it if they fail, or run in the background
+while the app already serves requests (``async``); the current state is
+exposed through ``/health/migrations``.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI_PATH = Path(__file__).parent.parent.parent / "alembic.ini"
+
+# Migration states
+STATE_PENDING = "pending"
+STATE_RUNNING = "running"
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+STATE_SKIPPED = "skipped"
+
+
+class MigrationStatus(BaseModel):
+    """Status information for startup migrations.
+
+    Attributes:
+        mode: The configured migration mode (sync, async or skip).
+        state: Current state of the migration run.
+        started_at: When the migration run started, if it has.
+        completed_at: When the migration run finished, if it has.
+        error_message: Error message if the run failed.
+    """
+    mode: str = Field(..., description="Configured migration mode")
+    state: str = Field(default=STATE_PENDING, description="Migration state")
+    started_at: Optional[datetime] = Field(default=None, description="Migration start time")
+    completed_at: Optional[datetime] = Field(default=None, description="Migration completion time")
+    error_message: Optional[str] = Field(default=None, description="Error message if failed")
+
+
+class MigrationRunner:
+    """Runs Alembic migrations and tracks their progress.
+
+    Alembic's env.py uses a synchronous psycopg2 engine, so the upgrade is
+    executed in a worker thread to keep the event loop responsive.
+
+    Usage:
+        runner = get_migration_runner()
+        await runner.start("async")
+        runner.get_status()
+    """
+
+    def __init__(self, ini_path: Path = ALEMBIC_INI_PATH):
+        """Initialize the runner.
+
+        Args:
+            ini_path: Path to the alembic.ini file.
+        """
+        self._ini_path = ini_path
+        self._status = MigrationStatus(mode="skip")
+        self._task: Optional[asyncio.Task] = None
+
+    def _upgrade(self) -> None:
+        """Run ``alembic upgrade head`` synchronously."""
+        config = Config(str(self._ini_path))
+        # Keep the application's logging configuration intact
+        config.attributes["configure_logger"] = False
+        command.upgrade(config, "head")
+
+    async def run(self, raise_on_failure: bool = False) -> None:
+        """Apply all pending migrations, recording the outcome.
+
+        Failures are logged and recorded in the status. By default they are
+        not raised, so a failed background migration does not take down the
+        running application.
+
+        Args:
+            raise_on_failure: Re-raise a failed upgrade after recording it.
+        """
+        self._status.state = STATE_RUNNING
+        self._status.started_at = datetime.now(timezone.utc)
+        logger.info("Applying database migrations")
+
+        try:
+            await asyncio.to_thread(self._upgrade)
+        except Exception as e:
+            logger.error("Database migrations failed: %s", e)
+            self._status.state = STATE_FAILED
+            self._status.error_message = str(e)
+            if raise_on_failure:
+                raise
+        else:
+            logger.info("Database migrations applied")
+            self._status.state = STATE_COMPLETED
+        finally:
+            self._status.completed_at = datetime.now(timezone.utc)
+
+    async def start(self, mode: str) -> None:
+        """Start migrations according to the configured mode.
+
+        Args:
+            mode: ``sync`` to wait for migrations to finish, ``async`` to run
+                them in a background task, or ``skip`` to do nothing.
+
+        Raises:
+            Exception: In ``sync`` mode, whatever the failed upgrade raised,
+                so startup stops instead of serving an unmigrated schema.
+        """
+        self._status = MigrationStatus(mode=mode)
+
+        if mode == "sync":
+            await self.run(raise_on_failure=True)
+        elif mode == "async":
+            self._task = asyncio.create_task(self.run())
+        else:
+            self._status.state = STATE_SKIPPED
+
+    async def wait(self) -> None:
+        """Wait for a background migration run to finish, if one was started."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    def get_status(self) -> MigrationStatus:
+        """Get the current migration status.
+
+        Returns:
+            A copy of the current MigrationStatus.
+        """
+        return self._status.model_copy()
+
+
+# Global runner instance
+_runner_instance: Optional[MigrationRunner] = None
+
+
+def get_migration_runner() -> MigrationRunner:
+    """Get or create the global MigrationRunner instance.
+
+    Returns:
+        The global MigrationRunner instance.
+    """
+    global _runner_instance
+    if _runner_instance is None:
+        _runner_instance = MigrationRunner()
+    return _runner_instance
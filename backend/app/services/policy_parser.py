@@ -4,12 +4,14 @@ This module provides functionality to extract text from PDF policy documents
 and parse compliance rules using the LLM client.
 """
 
+import asyncio
 import io
 import logging
+import threading
 import uuid
 from typing import BinaryIO, List, Optional, Union
 
-import pdfplumber
+import pypdfium2 as pdfium
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +24,25 @@ from app.services.llm_client import LLMClient, get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# PDFium must not be called from two threads at once, even for different
+# documents, so every extraction holds this lock
+_PDFIUM_LOCK = threading.Lock()
+# Uploads extract in a worker thread to keep the event loop responsive, one
+# at a time; later ones wait here rather than parked on the lock in a thread
+_PARSE_SEMAPHORE = asyncio.Semaphore(1)
+
+# Leading bytes searched for the %PDF marker
+PDF_HEADER_SCAN_BYTES = 1024
+
+
+def has_pdf_header(header: bytes) -> bool:
+    """Check the leading bytes of a file for the PDF magic bytes.
+    
+    Some PDFs have whitespace or a BOM before the header, so the %PDF marker
+    may appear anywhere in the first PDF_HEADER_SCAN_BYTES.
+    """
+    return b'%PDF' in header[:PDF_HEADER_SCAN_BYTES]
+
 
 class PDFExtractionError(Exception):
     """Base exception for PDF extraction errors."""
@@ -52,7 +73,7 @@ class PolicyParserService:
     """Service for parsing PDF policy documents and extracting compliance rules.
     
     This service handles:
-    - PDF text extraction using pdfplumber
+    - PDF text extraction using PDFium
     - Error handling for corrupted, empty, or invalid PDFs
     - File size validation
     
@@ -67,7 +88,7 @@ class PolicyParserService:
         self._max_file_size_bytes = self._settings.max_pdf_size_mb * 1024 * 1024
 
     async def extract_text(self, pdf_file: UploadFile) -> str:
-        """Extract text content from a PDF file using pdfplumber.
+        """Extract text content from a PDF file using PDFium.
         
         Args:
             pdf_file: The uploaded PDF file (FastAPI UploadFile).
@@ -81,14 +102,14 @@ class PolicyParserService:
             CorruptedPDFError: If the PDF is corrupted or unreadable.
             EmptyPDFError: If the PDF contains no extractable text.
         """
-        # Read file content
-        content = await pdf_file.read()
-        
-        # Reset file position for potential re-reads
-        await pdf_file.seek(0)
+        # Starlette has already spooled the upload to a temporary file, so
+        # validate and parse it in place rather than reading it into memory
+        file_size = pdf_file.size
+        if file_size is None:
+            pdf_file.file.seek(0, io.SEEK_END)
+            file_size = pdf_file.file.tell()
         
         # Validate file size
-        file_size = len(content)
         if file_size > self._max_file_size_bytes:
             max_size_mb = self._settings.max_pdf_size_mb
             raise FileTooLargeError(
@@ -100,22 +121,26 @@ class PolicyParserService:
             raise UnsupportedFormatError("Please upload a valid PDF file.")
         
         # Check for PDF magic bytes (PDF files start with %PDF)
-        # Some PDFs may have whitespace or BOM before the header
-        pdf_header = content[:1024]  # Check first 1KB for %PDF marker
-        if b'%PDF' not in pdf_header:
-            logger.warning(f"Invalid PDF magic bytes. First 20 bytes: {content[:20]!r}")
+        await pdf_file.seek(0)
+        pdf_header = await pdf_file.read(PDF_HEADER_SCAN_BYTES)
+        await pdf_file.seek(0)
+        if not has_pdf_header(pdf_header):
+            logger.warning("Invalid PDF magic bytes. First 20 bytes: %r", pdf_header[:20])
             raise UnsupportedFormatError("Please upload a valid PDF file.")
         
-        # Extract text using pdfplumber
-        extracted_text = self._extract_text_from_bytes(content)
+        # Extract text using PDFium
+        async with _PARSE_SEMAPHORE:
+            extracted_text = await asyncio.to_thread(
+                self._extract_text_from_stream, pdf_file.file
+            )
         
         return extracted_text
 
-    def _extract_text_from_bytes(self, content: bytes) -> str:
-        """Extract text from PDF bytes using pdfplumber.
+    def _extract_text_from_stream(self, pdf_stream: BinaryIO) -> str:
+        """Extract text from a seekable PDF stream using PDFium.
         
         Args:
-            content: The raw bytes of the PDF file.
+            pdf_stream: A binary file object positioned at the start of the PDF.
             
         Returns:
             The extracted text content from all pages.
@@ -125,44 +150,51 @@ class PolicyParserService:
             EmptyPDFError: If no text can be extracted.
         """
         try:
-            pdf_stream = io.BytesIO(content)
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(pdf_stream)
+                try:
+                    page_count = len(pdf)
+                    # Check if PDF has any pages
+                    if page_count == 0:
+                        raise EmptyPDFError(
+                            "The uploaded PDF contains no extractable text."
+                        )
+                    
+                    # Extract text from all pages, releasing each as we go
+                    text_parts = []
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                        if page_text:
+                            text_parts.append(page_text.replace("\r\n", "\n"))
+                finally:
+                    pdf.close()
             
-            with pdfplumber.open(pdf_stream) as pdf:
-                # Check if PDF has any pages
-                if len(pdf.pages) == 0:
-                    raise EmptyPDFError(
-                        "The uploaded PDF contains no extractable text."
-                    )
-                
-                # Extract text from all pages
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                
-                # Combine all extracted text
-                full_text = "\n\n".join(text_parts)
-                
-                # Check if any text was extracted
-                if not full_text.strip():
-                    raise EmptyPDFError(
-                        "The uploaded PDF contains no extractable text."
-                    )
-                
-                logger.info(
-                    f"Successfully extracted {len(full_text)} characters "
-                    f"from {len(pdf.pages)} pages"
+            # Combine all extracted text
+            full_text = "\n\n".join(text_parts)
+            
+            # Check if any text was extracted
+            if not full_text.strip():
+                raise EmptyPDFError(
+                    "The uploaded PDF contains no extractable text."
                 )
-                
-                return full_text
+            
+            logger.info(
+                "Successfully extracted %d characters from %d pages",
+                len(full_text),
+                page_count,
+            )
+            
+            return full_text
                 
         except EmptyPDFError:
             # Re-raise our custom exceptions
             raise
         except Exception as e:
             # Log the original error for debugging
-            logger.error(f"Failed to extract text from PDF: {e}")
+            logger.error("Failed to extract text from PDF: %s", e)
             raise CorruptedPDFError(
                 "Unable to read PDF file. Please ensure the file is not corrupted."
             )
@@ -207,7 +239,7 @@ class PolicyParserService:
             raise UnsupportedFormatError("Please upload a valid PDF file.")
         
         # Extract text
-        return self._extract_text_from_bytes(content)
+        return self._extract_text_from_stream(io.BytesIO(content))
 
     async def parse_rules(
         self,
@@ -233,7 +265,7 @@ class PolicyParserService:
         client = llm_client or get_llm_client()
         
         # Extract rules using LLM
-        logger.info(f"Sending policy text to LLM for rule extraction (policy_id={policy_id})")
+        logger.info("Sending policy text to LLM for rule extraction (policy_id=%s)", policy_id)
         raw_rules = await client.extract_rules(text)
         
         # Convert raw rule dictionaries to ComplianceRule model instances
@@ -247,8 +279,9 @@ class PolicyParserService:
                 severity = Severity(severity_str)
             except ValueError:
                 logger.warning(
-                    f"Invalid severity '{severity_str}' for rule {raw_rule.get('rule_code')}, "
-                    f"defaulting to MEDIUM"
+                    "Invalid severity '%s' for rule %s, defaulting to MEDIUM",
+                    severity_str,
+                    raw_rule.get("rule_code"),
                 )
                 severity = Severity.MEDIUM
             
@@ -265,7 +298,7 @@ class PolicyParserService:
             compliance_rules.append(rule)
         
         logger.info(
-            f"Parsed {len(compliance_rules)} compliance rules from policy {policy_id}"
+            "Parsed %d compliance rules from policy %s", len(compliance_rules), policy_id
         )
         
         return compliance_rules
@@ -315,13 +348,16 @@ class PolicyParserService:
 
             if manage_session:
                 await session.commit()
-                await session.refresh(policy)
+                # Policy.rules is not lazy-loadable, so load it explicitly
+                # along with the server-generated upload timestamp
+                await session.refresh(policy, attribute_names=["uploaded_at", "rules"])
             else:
                 await session.flush()
 
             logger.info(
-                f"Successfully processed policy {policy.id}: "
-                f"extracted {len(compliance_rules_data)} rules"
+                "Successfully processed policy %s: extracted %d rules",
+                policy.id,
+                len(compliance_rules_data),
             )
             return policy
 
@@ -342,7 +378,7 @@ class PolicyParserService:
         """Extract rules via LLM and build ComplianceRule objects (no DB interaction)."""
         client = llm_client or get_llm_client()
 
-        logger.info(f"Sending policy text to LLM for rule extraction (policy_id={policy_id})")
+        logger.info("Sending policy text to LLM for rule extraction (policy_id=%s)", policy_id)
         raw_rules = await client.extract_rules(text)
 
         compliance_rules: List[ComplianceRule] = []
@@ -364,7 +400,7 @@ class PolicyParserService:
             )
             compliance_rules.append(rule)
 
-        logger.info(f"Parsed {len(compliance_rules)} compliance rules from policy {policy_id}")
+        logger.info("Parsed %d compliance rules from policy %s", len(compliance_rules), policy_id)
         return compliance_rules
 
 
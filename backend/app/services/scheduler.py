@@ -6,19 +6,21 @@ execute scans and detect new violations.
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple, TYPE_CHECKING
 from uuid import UUID
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.base import JobLookupError
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_maker
 from app.models.compliance_rule import ComplianceRule
+from app.models.dashboard_summary import REFRESH_DASHBOARD_SUMMARY_MV_SQL
 from app.models.database_connection import DatabaseConnection
 from app.models.monitoring_config import MonitoringConfig
 from app.models.scan_history import ScanHistory
@@ -37,6 +39,9 @@ SCAN_JOB_ID = "compliance_scan_job"
 MIN_INTERVAL_MINUTES = 60
 MAX_INTERVAL_MINUTES = 1440
 
+# How long get_status() serves a snapshot before reading APScheduler again
+STATUS_CACHE_TTL_SECONDS = 0.5
+
 
 class SchedulerStatus(BaseModel):
     """Status information for the monitoring scheduler.
@@ -104,6 +109,8 @@ class MonitoringScheduler:
         self._retry_count: int = 0
         self._max_retries: int = 3
         self._base_retry_delay: int = 1  # seconds
+        # (time.monotonic() when taken, snapshot); dropped by every state change
+        self._status_cache: Optional[Tuple[float, SchedulerStatus]] = None
 
     def start(self) -> None:
         """Start the APScheduler.
@@ -113,6 +120,7 @@ class MonitoringScheduler:
         if not self._is_started:
             self._scheduler.start()
             self._is_started = True
+            self._status_cache = None
             logger.info("Monitoring scheduler started")
 
     def shutdown(self, wait: bool = False) -> None:
@@ -129,6 +137,7 @@ class MonitoringScheduler:
             except Exception:
                 pass  # Ignore errors during shutdown
             self._is_started = False
+            self._status_cache = None
             logger.info("Monitoring scheduler shut down")
 
     async def schedule_scan(self, interval_minutes: int) -> str:
@@ -174,6 +183,7 @@ class MonitoringScheduler:
             name="Compliance Scan",
             replace_existing=True,
         )
+        self._status_cache = None
         
         # Persist configuration to database
         async with async_session_maker() as session:
@@ -194,6 +204,7 @@ class MonitoringScheduler:
         """
         try:
             self._scheduler.remove_job(SCAN_JOB_ID)
+            self._status_cache = None
             logger.info("Cancelled scheduled compliance scans")
             
             # Update configuration in database (fire and forget)
@@ -216,9 +227,18 @@ class MonitoringScheduler:
     def get_status(self) -> SchedulerStatus:
         """Get the current scheduler status.
         
+        Snapshots are reused for STATUS_CACHE_TTL_SECONDS, so frequent
+        polling reads APScheduler's job store at most that often.
+        
         Returns:
             SchedulerStatus containing the current state of the scheduler.
         """
+        now = time.monotonic()
+        if self._status_cache is not None:
+            taken_at, cached_status = self._status_cache
+            if now - taken_at < STATUS_CACHE_TTL_SECONDS:
+                return cached_status
+        
         status = SchedulerStatus(
             is_running=self._is_started and self._scheduler.running,
             is_enabled=False,
@@ -238,8 +258,18 @@ class MonitoringScheduler:
                 total_seconds = job.trigger.interval.total_seconds()
                 status.interval_minutes = int(total_seconds / 60)
         
+        self._status_cache = (now, status)
         return status
 
+    def _job_next_run_time(self) -> Optional[datetime]:
+        """Get the next run time APScheduler has computed for the scan job.
+        
+        Returns:
+            The job's next run time, or None if no scan is scheduled.
+        """
+        job = self._scheduler.get_job(SCAN_JOB_ID)
+        return job.next_run_time if job else None
+
     async def run_scheduled_scan(
         self,
         db_session: Optional[AsyncSession] = None,
@@ -361,6 +391,8 @@ class MonitoringScheduler:
                 
                 await session.commit()
                 
+                await self._refresh_summary_view(session)
+                
                 logger.info(
                     f"Scan {scan_history.id} completed: "
                     f"{len(violations)} violations found, {new_violation_count} new"
@@ -391,6 +423,8 @@ class MonitoringScheduler:
             scan_history.error_message = str(e)
             
             try:
+                # The job still reschedules after a failed scan
+                await self._update_next_run(session)
                 await session.commit()
             except Exception:
                 await session.rollback()
@@ -442,6 +476,9 @@ class MonitoringScheduler:
     ) -> None:
         """Save or update monitoring configuration in database.
         
+        next_run_at is taken from the scheduled job, so the database holds
+        the same next scan time that APScheduler will use.
+        
         Args:
             session: Database session.
             interval_minutes: The scan interval in minutes.
@@ -451,7 +488,9 @@ class MonitoringScheduler:
         result = await session.execute(select(MonitoringConfig))
         config = result.scalar_one_or_none()
         
-        next_run = datetime.now(timezone.utc)
+        next_run = self._job_next_run_time()
+        if next_run is None:
+            next_run = datetime.now(timezone.utc) + timedelta(minutes=interval_minutes)
         
         if config:
             config.interval_minutes = interval_minutes
@@ -494,10 +533,48 @@ class MonitoringScheduler:
         
         if config:
             config.last_run_at = last_run_at
-            # Calculate next run time based on interval
-            if config.is_enabled and config.interval_minutes:
-                from datetime import timedelta
-                config.next_run_at = last_run_at + timedelta(minutes=config.interval_minutes)
+            if config.is_enabled:
+                # APScheduler has already rescheduled the running job;
+                # fall back to the interval when run outside the scheduler
+                next_run = self._job_next_run_time()
+                if next_run is None and config.interval_minutes:
+                    next_run = last_run_at + timedelta(minutes=config.interval_minutes)
+                config.next_run_at = next_run
+
+    async def _refresh_summary_view(self, session: AsyncSession) -> None:
+        """Refresh the dashboard_summary_mv materialized view.
+        
+        Runs after the scan has been committed, so a failed refresh only
+        leaves the dashboard totals one more interval out of date. The
+        transactions loader also refreshes the view after each load; with
+        monitoring disabled and no new load, the totals are otherwise never
+        refreshed and may be arbitrarily stale.
+        
+        Args:
+            session: Database session.
+        """
+        try:
+            await session.execute(text(REFRESH_DASHBOARD_SUMMARY_MV_SQL))
+            await session.commit()
+        except Exception as e:
+            logger.warning(f"Could not refresh dashboard_summary_mv: {e}")
+            await session.rollback()
+
+    async def _update_next_run(self, session: AsyncSession) -> None:
+        """Copy the scan job's next run time into the monitoring configuration.
+        
+        Args:
+            session: Database session.
+        """
+        next_run = self._job_next_run_time()
+        if next_run is None:
+            return
+        
+        result = await session.execute(select(MonitoringConfig))
+        config = result.scalar_one_or_none()
+        
+        if config and config.is_enabled:
+            config.next_run_at = next_run
 
 
 # Global scheduler instance
@@ -0,0 +1,160 @@
+"""Bulk loader for the IBM AML transactions dataset.
+
+This module streams transaction CSV files into the ``transactions`` table
+using PostgreSQL's binary COPY protocol (asyncpg ``copy_records_to_table``).
+Rows are converted to native Python types up front so asyncpg can encode
+them directly, without a text round-trip through the server's input parsers.
+The loader is the only writer of ``transactions``, so it also refreshes the
+dashboard_summary_mv total once the rows are committed.
+"""
+
+import csv
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import asyncpg
+
+from app.models.dashboard_summary import REFRESH_DASHBOARD_SUMMARY_MV_SQL
+
+logger = logging.getLogger(__name__)
+
+# Table columns in the order they appear in the IBM AML CSV files.
+# The CSV header repeats "Account", so columns are mapped by position.
+TRANSACTION_COLUMNS: List[str] = [
+    "timestamp",
+    "from_bank",
+    "from_account",
+    "to_bank",
+    "to_account",
+    "amount_received",
+    "receiving_currency",
+    "amount_paid",
+    "payment_currency",
+    "payment_format",
+    "is_laundering",
+]
+
+TransactionRecord = Tuple[
+    datetime, str, str, str, str, Decimal, str, Decimal, str, str, int
+]
+
+
+class TransactionsLoadError(Exception):
+    """Raised when a transactions file cannot be parsed or loaded."""
+    pass
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an IBM AML timestamp of the form ``YYYY/MM/DD HH:MM``.
+
+    Slicing is used instead of ``strptime`` since this runs once per row.
+    """
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        tzinfo=timezone.utc,
+    )
+
+
+def parse_row(row: List[str]) -> TransactionRecord:
+    """Convert a raw CSV row into a record of native Python types.
+
+    Args:
+        row: The CSV fields in IBM AML column order.
+
+    Returns:
+        A tuple matching TRANSACTION_COLUMNS.
+
+    Raises:
+        TransactionsLoadError: If the row is malformed.
+    """
+    if len(row) != len(TRANSACTION_COLUMNS):
+        raise TransactionsLoadError(
+            f"Expected {len(TRANSACTION_COLUMNS)} fields, got {len(row)}"
+        )
+    try:
+        return (
+            _parse_timestamp(row[0]),
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            Decimal(row[5]),
+            row[6],
+            Decimal(row[7]),
+            row[8],
+            row[9],
+            int(row[10]),
+        )
+    except (ArithmeticError, ValueError) as e:
+        raise TransactionsLoadError(f"Invalid transaction row {row!r}: {e}")
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[TransactionRecord]:
+    """Yield parsed records from CSV lines, skipping the header row."""
+    reader = csv.reader(lines)
+    next(reader, None)
+    for row in reader:
+        yield parse_row(row)
+
+
+async def refresh_summary_view(conn: asyncpg.Connection) -> None:
+    """Refresh dashboard_summary_mv if its migration has already run.
+
+    The view may not exist yet when transactions are loaded between the
+    table and index migrations; it is then populated when it is created.
+    A failed refresh is logged rather than raised since the rows are
+    already committed.
+
+    Args:
+        conn: An open asyncpg connection to the application database.
+    """
+    try:
+        if await conn.fetchval("SELECT to_regclass('dashboard_summary_mv') IS NOT NULL"):
+            await conn.execute(REFRESH_DASHBOARD_SUMMARY_MV_SQL)
+    except asyncpg.PostgresError as e:
+        logger.warning("Could not refresh dashboard_summary_mv: %s", e)
+
+
+async def load_transactions(
+    conn: asyncpg.Connection,
+    csv_path: Union[str, Path],
+) -> int:
+    """Stream a transactions CSV into the database with binary COPY.
+
+    The whole file is loaded in a single transaction, so a malformed row
+    leaves the table untouched. The dashboard's transaction total is
+    refreshed afterwards.
+
+    Args:
+        conn: An open asyncpg connection to the application database.
+        csv_path: Path to an IBM AML transactions CSV file.
+
+    Returns:
+        Number of rows loaded.
+
+    Raises:
+        TransactionsLoadError: If a row cannot be parsed.
+    """
+    path = Path(csv_path)
+    logger.info("Loading transactions from %s", path)
+
+    with path.open(newline="") as f:
+        async with conn.transaction():
+            status = await conn.copy_records_to_table(
+                "transactions",
+                records=iter_records(f),
+                columns=TRANSACTION_COLUMNS,
+            )
+
+    # status is the command tag, e.g. "COPY 5078345"
+    rows = int(status.split()[-1])
+    await refresh_summary_view(conn)
+    logger.info("Loaded %d transactions from %s", rows, path.name)
+    return rows
@@ -0,0 +1,120 @@
+"""Bulk writer for persisting scan violations.
+
+Scans can produce thousands of violations at once. Adding them to the ORM
+session issues one INSERT per row; this module instead writes them in bulk
+on the session's own connection, so the rows stay part of the caller's
+transaction. Small batches go out as a single multi-row INSERT; large ones
+are streamed to the ``violations`` table with PostgreSQL's binary COPY
+protocol.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence, Tuple
+
+import asyncpg
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import record_bulk_write
+from app.models.violation import Violation
+
+logger = logging.getLogger(__name__)
+
+# Columns written by COPY, in record order. id and detected_at are filled
+# in by their server defaults, which COPY and INSERT apply when omitted.
+VIOLATION_COLUMNS: List[str] = [
+    "rule_id",
+    "record_identifier",
+    "record_data",
+    "justification",
+    "remediation_suggestion",
+    "severity",
+    "status",
+]
+
+# Batches at least this large are written with COPY. asyncpg looks up the
+# column types before each COPY, so smaller batches are cheaper as one
+# multi-row INSERT (SQLAlchemy's insertmanyvalues pages 1000 rows at a time).
+COPY_MIN_ROWS = 1000
+
+
+def violation_to_params(violation: Violation) -> Dict[str, Any]:
+    """Convert a Violation into INSERT parameters keyed by VIOLATION_COLUMNS."""
+    return {column: getattr(violation, column) for column in VIOLATION_COLUMNS}
+
+
+def violation_to_record(violation: Violation) -> Tuple[Any, ...]:
+    """Convert a Violation into a COPY record matching VIOLATION_COLUMNS."""
+    return (
+        violation.rule_id,
+        violation.record_identifier,
+        # JSONB is sent as its text form; this works with both asyncpg's
+        # default codec and the one SQLAlchemy installs on its connections.
+        orjson.dumps(violation.record_data).decode(),
+        violation.justification,
+        violation.remediation_suggestion,
+        violation.severity,
+        violation.status,
+    )
+
+
+async def copy_violations(
+    conn: asyncpg.Connection,
+    violations: Sequence[Violation],
+) -> int:
+    """Write violations with binary COPY on an asyncpg connection.
+
+    Args:
+        conn: An open asyncpg connection to the application database.
+        violations: Violations to write.
+
+    Returns:
+        Number of rows written.
+    """
+    if not violations:
+        return 0
+
+    await conn.copy_records_to_table(
+        "violations",
+        records=[violation_to_record(v) for v in violations],
+        columns=VIOLATION_COLUMNS,
+    )
+    return len(violations)
+
+
+async def bulk_insert_violations(
+    db_session: AsyncSession,
+    violations: Sequence[Violation],
+) -> int:
+    """Write violations through the session's connection and transaction.
+
+    Batches smaller than COPY_MIN_ROWS are sent as a bulk INSERT, larger
+    ones with COPY. The session is not committed; the caller manages the
+    transaction as it would after a flush.
+
+    Args:
+        db_session: SQLAlchemy async session for the application database.
+        violations: Violations to write.
+
+    Returns:
+        Number of rows written.
+    """
+    if not violations:
+        return 0
+
+    if len(violations) < COPY_MIN_ROWS:
+        await db_session.execute(
+            insert(Violation),
+            [violation_to_params(v) for v in violations],
+        )
+        rows = len(violations)
+    else:
+        connection = await db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        rows = await copy_violations(raw_connection.driver_connection, violations)
+        # COPY bypasses the ORM, so record it for commit-time listeners
+        record_bulk_write(db_session, Violation)
+
+    logger.info("Bulk inserted %d violations", rows)
+    return rows
@@ -0,0 +1,300 @@
+"""Unit tests for the authentication endpoints and helpers."""
+
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import bcrypt
+import jwt
+import pytest
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from app.config import Settings
+from app.main import (
+    ACCESS_TOKEN_EXPIRE_SECONDS,
+    ALGORITHM,
+    SECRET_KEY,
+    _token_cache,
+    app,
+    create_token,
+    decode_token,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+from app.models.user import User
+
+
+@pytest.fixture
+def mock_db_session():
+    """Create a mock database session."""
+    session = MagicMock()
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def _user_result(user):
+    """Build a mock execute() result returning ``user``."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    result.one_or_none.return_value = user
+    result.scalar.return_value = user is not None
+    return result
+
+
+async def _post(path, json, session):
+    """POST to the app with ``session`` as the database dependency."""
+    async def override_get_db():
+        yield session
+
+    from app.database import get_db
+    app.dependency_overrides[get_db] = override_get_db
+
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, json=json)
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestPasswordHashing:
+    """Tests for password hashing helpers."""
+
+    async def test_hash_is_argon2(self):
+        """Test that new hashes use Argon2id."""
+        hashed = await hash_password("s3cret")
+
+        assert hashed.startswith("$argon2id$")
+        assert not needs_rehash(hashed)
+
+    async def test_verify_round_trip(self):
+        """Test that a hash verifies only against the original password."""
+        hashed = await hash_password("s3cret")
+
+        assert await verify_password("s3cret", hashed)
+        assert not await verify_password("wrong", hashed)
+
+    async def test_verify_legacy_bcrypt_hash(self):
+        """Test that existing bcrypt hashes still verify and need rehashing."""
+        hashed = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+        assert await verify_password("s3cret", hashed)
+        assert not await verify_password("wrong", hashed)
+        assert needs_rehash(hashed)
+
+    async def test_verify_garbage_hash(self):
+        """Test that an unparseable hash fails verification."""
+        assert not await verify_password("s3cret", "not-a-hash")
+
+
+class TestLogin:
+    """Tests for POST /api/auth/login endpoint."""
+
+    async def test_login_rehashes_legacy_hash(self, mock_db_session):
+        """Test that a successful login upgrades a bcrypt hash to Argon2."""
+        legacy = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        user = User(id=uuid.uuid4(), email="a@example.com", password_hash=legacy)
+        mock_db_session.execute = AsyncMock(
+            side_effect=[_user_result(user), MagicMock()]
+        )
+
+        response = await _post(
+            "/api/auth/login",
+            {"email": "a@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["token_type"] == "bearer"
+        update_stmt = mock_db_session.execute.call_args_list[1].args[0]
+        new_hash = update_stmt.compile().params["password_hash"]
+        assert new_hash.startswith("$argon2id$")
+
+    async def test_login_current_hash_not_rewritten(self, mock_db_session):
+        """Test that an up-to-date Argon2 hash is left alone."""
+        user = User(email="a@example.com", password_hash=await hash_password("s3cret"))
+        mock_db_session.execute = AsyncMock(return_value=_user_result(user))
+
+        response = await _post(
+            "/api/auth/login",
+            {"email": "a@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_db_session.execute.await_count == 1
+
+    async def test_login_wrong_password(self, mock_db_session):
+        """Test that a wrong password is rejected."""
+        user = User(email="a@example.com", password_hash=await hash_password("s3cret"))
+        mock_db_session.execute = AsyncMock(return_value=_user_result(user))
+
+        response = await _post(
+            "/api/auth/login",
+            {"email": "a@example.com", "password": "wrong"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_login_unknown_user(self, mock_db_session):
+        """Test that an unknown email is rejected."""
+        mock_db_session.execute = AsyncMock(return_value=_user_result(None))
+
+        response = await _post(
+            "/api/auth/login",
+            {"email": "nobody@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert mock_db_session.execute.call_args.args[1] == {"email": "nobody@example.com"}
+
+
+class TestRegister:
+    """Tests for POST /api/auth/register endpoint."""
+
+    async def test_register_new_user(self, mock_db_session):
+        """Test registering a new user stores an Argon2 hash."""
+        mock_db_session.execute = AsyncMock(return_value=_user_result(None))
+
+        response = await _post(
+            "/api/auth/register",
+            {"email": "new@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        added = mock_db_session.add.call_args.args[0]
+        assert added.password_hash.startswith("$argon2id$")
+        mock_db_session.commit.assert_awaited()
+        mock_db_session.flush.assert_not_awaited()
+
+    async def test_register_concurrent_duplicate(self, mock_db_session):
+        """Test that a unique violation at commit is reported as a duplicate."""
+        mock_db_session.execute = AsyncMock(return_value=_user_result(None))
+        mock_db_session.commit = AsyncMock(
+            side_effect=IntegrityError("INSERT", {}, Exception("duplicate key"))
+        )
+        mock_db_session.rollback = AsyncMock()
+
+        response = await _post(
+            "/api/auth/register",
+            {"email": "a@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_db_session.rollback.assert_awaited()
+
+    async def test_register_existing_email(self, mock_db_session):
+        """Test registering an existing email is rejected."""
+        existing = User(email="a@example.com", password_hash="x")
+        mock_db_session.execute = AsyncMock(return_value=_user_result(existing))
+
+        response = await _post(
+            "/api/auth/register",
+            {"email": "a@example.com", "password": "s3cret"},
+            mock_db_session,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestJwtSecretSetting:
+    """Tests for the jwt_secret setting."""
+
+    def test_short_secret_rejected(self):
+        """Test that secrets under 32 characters fail validation."""
+        with pytest.raises(ValidationError):
+            Settings(jwt_secret="too-short")
+
+    def test_multibyte_secret_measured_in_bytes(self):
+        """Test that a 40-character secret over 64 UTF-8 bytes is rejected."""
+        with pytest.raises(ValidationError):
+            Settings(jwt_secret="é" * 40)
+
+    def test_default_secret_length(self):
+        """Test that the development default meets the length bounds."""
+        assert 32 <= len(Settings().jwt_secret.encode()) <= 64
+
+
+class TestCreateToken:
+    """Tests for token creation."""
+
+    def test_exp_is_integer_epoch(self):
+        """Test that exp is an int one token lifetime from now."""
+        before = int(time.time())
+        payload = jwt.decode(create_token("a@example.com"), SECRET_KEY, algorithms=[ALGORITHM])
+
+        assert payload["sub"] == "a@example.com"
+        assert isinstance(payload["exp"], int)
+        assert before + ACCESS_TOKEN_EXPIRE_SECONDS <= payload["exp"] <= int(time.time()) + ACCESS_TOKEN_EXPIRE_SECONDS
+
+
+class TestProtectedRoute:
+    """Tests for GET /api/protected endpoint."""
+
+    async def _get(self, token):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(
+                "/api/protected", headers={"Authorization": f"Bearer {token}"}
+            )
+
+    async def test_valid_token(self):
+        """Test that a freshly issued token is accepted."""
+        response = await self._get(create_token("a@example.com"))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_tampered_token(self):
+        """Test that a token with a modified signature is rejected."""
+        token = create_token("a@example.com")
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+        response = await self._get(tampered)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_expired_token(self):
+        """Test that an expired token is rejected."""
+        token = jwt.encode({"sub": "a@example.com", "exp": 0}, SECRET_KEY, algorithm=ALGORITHM)
+
+        response = await self._get(token)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestDecodeToken:
+    """Tests for the cached token validator."""
+
+    def setup_method(self):
+        _token_cache.clear()
+
+    def test_reuses_cached_validation(self):
+        """Test that a second decode of the same token skips jwt.decode."""
+        token = create_token("a@example.com")
+
+        with patch("app.main.jwt.decode", wraps=jwt.decode) as decode:
+            first = decode_token(token)
+            second = decode_token(token)
+
+        assert first == second
+        assert decode.call_count == 1
+
+    def test_expired_cache_entry_is_revalidated(self):
+        """Test that a cached token past its exp is decoded (and rejected) again."""
+        token = create_token("a@example.com")
+        _token_cache[token] = ({"sub": "a@example.com"}, 0)
+
+        with patch(
+            "app.main.jwt.decode", side_effect=jwt.ExpiredSignatureError("expired")
+        ):
+            with pytest.raises(jwt.PyJWTError):
+                decode_token(token)
@@ -0,0 +1,42 @@
+"""Unit tests for the CORS configuration."""
+
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+
+
+class TestCors:
+    """Tests for CORS preflight handling."""
+
+    async def test_preflight_allows_configured_origin(self):
+        """Test that a preflight from a configured origin is accepted."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.options(
+                "/api/rules/1",
+                headers={
+                    "Origin": "http://localhost:5173",
+                    "Access-Control-Request-Method": "PATCH",
+                    "Access-Control-Request-Headers": "content-type",
+                },
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+        assert "PATCH" in response.headers["access-control-allow-methods"]
+
+    async def test_preflight_rejects_unlisted_header(self):
+        """Test that headers outside the allow list are refused."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.options(
+                "/api/rules",
+                headers={
+                    "Origin": "http://localhost:5173",
+                    "Access-Control-Request-Method": "GET",
+                    "Access-Control-Request-Headers": "x-custom",
+                },
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,12 +1,13 @@
 """Unit tests for the Dashboard API endpoints."""
 
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy.dialects import postgresql
 
 from app.main import app
 from app.models.enums import Severity, ViolationStatus, ScanStatus
@@ -17,11 +18,30 @@ from app.routers.dashboard import (
     DashboardSummaryResponse,
     ViolationsByStatus,
     ViolationsBySeverity,
+    _SUMMARY_CACHE_KEY,
+    _invalidate_stale_caches_on_commit,
+    _mark_stale_caches_on_bulk_write,
+    _mark_stale_caches_on_flush,
+    _summary_cache,
+    invalidate_summary_cache,
+    invalidate_trends_cache,
+    register_summary_cache_invalidation,
+    register_trends_cache_invalidation,
 )
 
 
 # Test fixtures
 
+@pytest.fixture(autouse=True)
+def clear_dashboard_caches():
+    """Start every test with empty dashboard summary and trends caches."""
+    invalidate_summary_cache()
+    invalidate_trends_cache()
+    yield
+    invalidate_summary_cache()
+    invalidate_trends_cache()
+
+
 @pytest.fixture
 def sample_violations():
     """Create sample violations with various statuses and severities."""
@@ -136,366 +156,410 @@ def mock_db_session():
     return session
 
 
+def _summary_row(status, severity, count):
+    """Build a mock dashboard_summary row."""
+    return MagicMock(status=status, severity=severity, count=count)
+
+
+def _summary_results(
+    summary_rows=(),
+    total_policies=0,
+    total_rules=0,
+    total_transactions=0,
+    last_scan_at=None,
+    monitoring_config=None,
+):
+    """Build execute() results in the order the summary endpoint queries them.
+    
+    The summary row is aggregated from ``summary_rows`` the same way the
+    FILTER sums in the combined query aggregate dashboard_summary.
+    """
+    def count(**match):
+        return sum(
+            r.count for r in summary_rows
+            if all(getattr(r, k) == v for k, v in match.items())
+        )
+    
+    mock_summary_result = MagicMock()
+    mock_summary_result.mappings.return_value.one.return_value = dict(
+        total_violations=count(),
+        pending=count(status=ViolationStatus.PENDING.value),
+        confirmed=count(status=ViolationStatus.CONFIRMED.value),
+        false_positive=count(status=ViolationStatus.FALSE_POSITIVE.value),
+        resolved=count(status=ViolationStatus.RESOLVED.value),
+        low=count(severity=Severity.LOW.value),
+        medium=count(severity=Severity.MEDIUM.value),
+        high=count(severity=Severity.HIGH.value),
+        critical=count(severity=Severity.CRITICAL.value),
+        total_policies=total_policies,
+        total_rules=total_rules,
+        total_transactions=total_transactions,
+        last_scan_at=last_scan_at,
+        next_scan_at=monitoring_config.next_run_at if monitoring_config else None,
+    )
+    
+    return [mock_summary_result]
+
+
+async def _get_summary(mock_db_session):
+    """Call GET /api/dashboard/summary with a mocked session."""
+    async def override_get_db():
+        yield mock_db_session
+    
+    from app.database import get_db
+    app.dependency_overrides[get_db] = override_get_db
+    
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/dashboard/summary")
+    finally:
+        app.dependency_overrides.clear()
+
+
 class TestGetDashboardSummary:
     """Tests for GET /api/dashboard/summary endpoint."""
 
     @pytest.mark.asyncio
     async def test_get_summary_empty_database(self, mock_db_session):
         """Test getting summary when no violations exist."""
-        # Mock total count query
-        mock_total_result = MagicMock()
-        mock_total_result.scalar.return_value = 0
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results())
+        
+        response = await _get_summary(mock_db_session)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        assert data["total_violations"] == 0
+        assert data["pending_count"] == 0
+        assert data["confirmed_count"] == 0
+        assert data["false_positive_count"] == 0
+        assert data["resolved_count"] == 0
+        assert data["by_severity"]["low"] == 0
+        assert data["by_severity"]["medium"] == 0
+        assert data["by_severity"]["high"] == 0
+        assert data["by_severity"]["critical"] == 0
+        assert data["last_scan_at"] is None
+        assert data["next_scan_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_summary_with_violations(
+        self, mock_db_session, sample_violations, sample_monitoring_config
+    ):
+        """Test getting summary with existing violations."""
+        summary_rows = [
+            _summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 3),
+            _summary_row(ViolationStatus.CONFIRMED.value, Severity.CRITICAL.value, 2),
+            _summary_row(ViolationStatus.FALSE_POSITIVE.value, Severity.LOW.value, 1),
+            _summary_row(ViolationStatus.RESOLVED.value, Severity.MEDIUM.value, 4),
+        ]
+        last_scan_time = datetime.now(timezone.utc) - timedelta(minutes=25)
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results(
+            summary_rows,
+            total_policies=2,
+            total_rules=7,
+            total_transactions=100,
+            last_scan_at=last_scan_time,
+            monitoring_config=sample_monitoring_config,
+        ))
+        
+        response = await _get_summary(mock_db_session)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        # Check totals
+        assert data["total_violations"] == 10
+        assert data["total_policies"] == 2
+        assert data["total_rules"] == 7
+        assert data["total_transactions"] == 100
+        
+        # Check by status (flat fields)
+        assert data["pending_count"] == 3
+        assert data["confirmed_count"] == 2
+        assert data["false_positive_count"] == 1
+        assert data["resolved_count"] == 4
+        
+        # Check by severity
+        assert data["by_severity"]["low"] == 1
+        assert data["by_severity"]["medium"] == 4
+        assert data["by_severity"]["high"] == 3
+        assert data["by_severity"]["critical"] == 2
+        
+        # Check scan times
+        assert data["last_scan_at"] is not None
+        assert data["next_scan_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_summary_scheduler_disabled(self, mock_db_session):
+        """Test getting summary when scheduler is disabled."""
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results(
+            [_summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 5)],
+            last_scan_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        ))
         
-        # Mock status count query (empty)
-        mock_status_result = MagicMock()
-        mock_status_result.__iter__ = lambda self: iter([])
+        response = await _get_summary(mock_db_session)
         
-        # Mock severity count query (empty)
-        mock_severity_result = MagicMock()
-        mock_severity_result.__iter__ = lambda self: iter([])
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
         
-        # Mock last scan query (no scans)
-        mock_scan_result = MagicMock()
-        mock_scan_result.scalar_one_or_none.return_value = None
+        assert data["total_violations"] == 5
+        assert data["last_scan_at"] is not None
+        assert data["next_scan_at"] is None  # No scheduled scan
+
+    @pytest.mark.asyncio
+    async def test_get_summary_next_scan_from_monitoring_config(self, mock_db_session, sample_monitoring_config):
+        """Test that the next scan time is the monitoring config's next_run_at."""
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results(
+            monitoring_config=sample_monitoring_config,
+        ))
         
-        # Mock monitoring config query (no config)
-        mock_config_result = MagicMock()
-        mock_config_result.scalar_one_or_none.return_value = None
+        response = await _get_summary(mock_db_session)
         
-        # Setup execute to return different results for different queries
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        assert data["next_scan_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_summary_partial_status_counts(self, mock_db_session):
+        """Test getting summary when only some statuses have violations."""
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results([
+            _summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 3),
+            _summary_row(ViolationStatus.CONFIRMED.value, Severity.HIGH.value, 2),
+        ]))
+        
+        response = await _get_summary(mock_db_session)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        # Check that missing statuses default to 0 (flat fields)
+        assert data["pending_count"] == 3
+        assert data["confirmed_count"] == 2
+        assert data["false_positive_count"] == 0
+        assert data["resolved_count"] == 0
+        
+        # Check that missing severities default to 0
+        assert data["by_severity"]["low"] == 0
+        assert data["by_severity"]["medium"] == 0
+        assert data["by_severity"]["high"] == 5
+        assert data["by_severity"]["critical"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_summary_is_cached(self, mock_db_session):
+        """Test that repeated calls are served from the cache."""
+        mock_db_session.execute = AsyncMock(side_effect=_summary_results([
+            _summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 3),
+        ]))
+        
+        first = await _get_summary(mock_db_session)
+        second = await _get_summary(mock_db_session)
+        
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json() == first.json()
+        assert mock_db_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_summary_recomputed_after_invalidation(self, mock_db_session):
+        """Test that invalidating the cache forces a fresh query."""
         mock_db_session.execute = AsyncMock(side_effect=[
-            mock_total_result,
-            mock_status_result,
-            mock_severity_result,
-            mock_scan_result,
-            mock_config_result,
+            *_summary_results([_summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 3)]),
+            *_summary_results([_summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 4)]),
         ])
         
-        async def override_get_db():
-            yield mock_db_session
+        await _get_summary(mock_db_session)
+        invalidate_summary_cache()
+        response = await _get_summary(mock_db_session)
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
-        
-        # Mock the scheduler
-        with patch('app.routers.dashboard.get_monitoring_scheduler') as mock_scheduler:
-            mock_scheduler_instance = MagicMock()
-            mock_scheduler_instance.get_status.return_value = MagicMock(
-                is_enabled=False,
-                next_run_time=None,
-            )
-            mock_scheduler.return_value = mock_scheduler_instance
-            
-            try:
-                transport = ASGITransport(app=app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    response = await client.get("/api/dashboard/summary")
-                
-                assert response.status_code == status.HTTP_200_OK
-                data = response.json()
-                
-                assert data["total_violations"] == 0
-                assert data["pending_count"] == 0
-                assert data["confirmed_count"] == 0
-                assert data["false_positive_count"] == 0
-                assert data["resolved_count"] == 0
-                assert data["by_severity"]["low"] == 0
-                assert data["by_severity"]["medium"] == 0
-                assert data["by_severity"]["high"] == 0
-                assert data["by_severity"]["critical"] == 0
-                assert data["last_scan_at"] is None
-                assert data["next_scan_at"] is None
-            finally:
-                app.dependency_overrides.clear()
+        assert response.json()["pending_count"] == 4
 
     @pytest.mark.asyncio
-    async def test_get_summary_with_violations(self, mock_db_session, sample_violations):
-        """Test getting summary with existing violations."""
-        # Mock total count query
-        mock_total_result = MagicMock()
-        mock_total_result.scalar.return_value = 10  # Total violations
-        
-        # Mock status count query
-        mock_status_result = MagicMock()
-        status_rows = [
-            MagicMock(status=ViolationStatus.PENDING.value, count=3),
-            MagicMock(status=ViolationStatus.CONFIRMED.value, count=2),
-            MagicMock(status=ViolationStatus.FALSE_POSITIVE.value, count=1),
-            MagicMock(status=ViolationStatus.RESOLVED.value, count=4),
-        ]
-        mock_status_result.__iter__ = lambda self: iter(status_rows)
-        
-        # Mock severity count query
-        mock_severity_result = MagicMock()
-        severity_rows = [
-            MagicMock(severity=Severity.LOW.value, count=1),
-            MagicMock(severity=Severity.MEDIUM.value, count=4),
-            MagicMock(severity=Severity.HIGH.value, count=3),
-            MagicMock(severity=Severity.CRITICAL.value, count=2),
-        ]
-        mock_severity_result.__iter__ = lambda self: iter(severity_rows)
-        
-        # Mock last scan query
-        last_scan_time = datetime.now(timezone.utc) - timedelta(minutes=25)
-        mock_scan_result = MagicMock()
-        mock_scan_result.scalar_one_or_none.return_value = last_scan_time
-        
-        # Mock monitoring config query
-        mock_config_result = MagicMock()
-        mock_config_result.scalar_one_or_none.return_value = None
-        
-        # Setup execute to return different results for different queries
+    async def test_get_summary_error_not_cached(self, mock_db_session):
+        """Test that a failed computation is not cached."""
         mock_db_session.execute = AsyncMock(side_effect=[
-            mock_total_result,
-            mock_status_result,
-            mock_severity_result,
-            mock_scan_result,
-            mock_config_result,
+            Exception("connection lost"),
+            *_summary_results(),
         ])
         
-        async def override_get_db():
-            yield mock_db_session
+        failed = await _get_summary(mock_db_session)
+        response = await _get_summary(mock_db_session)
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
-        
-        # Mock the scheduler
-        next_scan_time = datetime.now(timezone.utc) + timedelta(minutes=35)
-        with patch('app.routers.dashboard.get_monitoring_scheduler') as mock_scheduler:
-            mock_scheduler_instance = MagicMock()
-            mock_scheduler_instance.get_status.return_value = MagicMock(
-                is_enabled=True,
-                next_run_time=next_scan_time,
-            )
-            mock_scheduler.return_value = mock_scheduler_instance
-            
-            try:
-                transport = ASGITransport(app=app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    response = await client.get("/api/dashboard/summary")
-                
-                assert response.status_code == status.HTTP_200_OK
-                data = response.json()
-                
-                # Check total
-                assert data["total_violations"] == 10
-                
-                # Check by status (flat fields)
-                assert data["pending_count"] == 3
-                assert data["confirmed_count"] == 2
-                assert data["false_positive_count"] == 1
-                assert data["resolved_count"] == 4
-                
-                # Check by severity
-                assert data["by_severity"]["low"] == 1
-                assert data["by_severity"]["medium"] == 4
-                assert data["by_severity"]["high"] == 3
-                assert data["by_severity"]["critical"] == 2
-                
-                # Check scan times
-                assert data["last_scan_at"] is not None
-                assert data["next_scan_at"] is not None
-            finally:
-                app.dependency_overrides.clear()
+        assert failed.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.status_code == status.HTTP_200_OK
 
-    @pytest.mark.asyncio
-    async def test_get_summary_scheduler_disabled(self, mock_db_session):
-        """Test getting summary when scheduler is disabled."""
-        # Mock total count query
-        mock_total_result = MagicMock()
-        mock_total_result.scalar.return_value = 5
-        
-        # Mock status count query
-        mock_status_result = MagicMock()
-        status_rows = [
-            MagicMock(status=ViolationStatus.PENDING.value, count=5),
-        ]
-        mock_status_result.__iter__ = lambda self: iter(status_rows)
-        
-        # Mock severity count query
-        mock_severity_result = MagicMock()
-        severity_rows = [
-            MagicMock(severity=Severity.HIGH.value, count=5),
-        ]
-        mock_severity_result.__iter__ = lambda self: iter(severity_rows)
+    def test_register_summary_cache_invalidation_is_idempotent(self):
+        """Test that the invalidation listeners are registered only once."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
         
-        # Mock last scan query
-        mock_scan_result = MagicMock()
-        mock_scan_result.scalar_one_or_none.return_value = datetime.now(timezone.utc) - timedelta(hours=1)
+        register_summary_cache_invalidation()
+        register_summary_cache_invalidation()
         
-        # Mock monitoring config query (disabled)
-        mock_config_result = MagicMock()
-        mock_config_result.scalar_one_or_none.return_value = None
+        assert event.contains(Session, "after_flush", _mark_stale_caches_on_flush)
+        assert event.contains(Session, "do_orm_execute", _mark_stale_caches_on_bulk_write)
+        assert event.contains(Session, "after_commit", _invalidate_stale_caches_on_commit)
+
+    def test_bulk_update_invalidates_summary_cache_on_commit(self):
+        """Test that an ORM UPDATE of a summarized model drops the summary once committed."""
+        from sqlalchemy.orm import Session
+        
+        register_summary_cache_invalidation()
+        _summary_cache[_SUMMARY_CACHE_KEY] = b"{}"
+        session = Session()
+        state = MagicMock(is_insert=False, is_update=True, is_delete=False, session=session)
+        state.bind_mapper.class_ = Violation
+        
+        _mark_stale_caches_on_bulk_write(state)
+        
+        # A request racing the uncommitted write must not see it cleared yet
+        assert _SUMMARY_CACHE_KEY in _summary_cache
+        session.commit()
+        assert _SUMMARY_CACHE_KEY not in _summary_cache
+
+    def test_flushed_objects_mark_summary_stale(self):
+        """Test that flushed summarized objects mark only the caches they feed."""
+        from sqlalchemy.orm import Session
         
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_total_result,
-            mock_status_result,
-            mock_severity_result,
-            mock_scan_result,
-            mock_config_result,
-        ])
+        from app.routers.dashboard import _STALE_CACHES_INFO_KEY
         
-        async def override_get_db():
-            yield mock_db_session
+        session = Session()
+        session.add(ScanHistory())
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        _mark_stale_caches_on_flush(session, None)
         
-        # Mock the scheduler as disabled
-        with patch('app.routers.dashboard.get_monitoring_scheduler') as mock_scheduler:
-            mock_scheduler_instance = MagicMock()
-            mock_scheduler_instance.get_status.return_value = MagicMock(
-                is_enabled=False,
-                next_run_time=None,
-            )
-            mock_scheduler.return_value = mock_scheduler_instance
-            
-            try:
-                transport = ASGITransport(app=app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    response = await client.get("/api/dashboard/summary")
-                
-                assert response.status_code == status.HTTP_200_OK
-                data = response.json()
-                
-                assert data["total_violations"] == 5
-                assert data["last_scan_at"] is not None
-                assert data["next_scan_at"] is None  # No scheduled scan
-            finally:
-                app.dependency_overrides.clear()
+        assert session.info[_STALE_CACHES_INFO_KEY] == {invalidate_summary_cache}
 
-    @pytest.mark.asyncio
-    async def test_get_summary_fallback_to_monitoring_config(self, mock_db_session, sample_monitoring_config):
-        """Test getting next scan time from monitoring config when scheduler unavailable."""
-        # Mock total count query
-        mock_total_result = MagicMock()
-        mock_total_result.scalar.return_value = 0
-        
-        # Mock status count query
-        mock_status_result = MagicMock()
-        mock_status_result.__iter__ = lambda self: iter([])
-        
-        # Mock severity count query
-        mock_severity_result = MagicMock()
-        mock_severity_result.__iter__ = lambda self: iter([])
+    def test_rollback_keeps_summary_cache(self):
+        """Test that rolled back writes leave the cached summary in place."""
+        from sqlalchemy.orm import Session
+        
+        register_summary_cache_invalidation()
+        _summary_cache[_SUMMARY_CACHE_KEY] = b"{}"
+        session = Session()
+        session.begin()
+        state = MagicMock(is_insert=False, is_update=True, is_delete=False, session=session)
+        state.bind_mapper.class_ = Violation
+        
+        _mark_stale_caches_on_bulk_write(state)
+        session.rollback()
+        session.commit()
+        
+        assert _SUMMARY_CACHE_KEY in _summary_cache
+
+    def test_select_keeps_summary_cache(self):
+        """Test that plain reads leave the cached summary in place."""
+        from sqlalchemy.orm import Session
         
-        # Mock last scan query
-        mock_scan_result = MagicMock()
-        mock_scan_result.scalar_one_or_none.return_value = None
+        register_summary_cache_invalidation()
+        _summary_cache[_SUMMARY_CACHE_KEY] = b"{}"
+        session = Session()
+        state = MagicMock(is_insert=False, is_update=False, is_delete=False, session=session)
+        state.bind_mapper.class_ = Violation
         
-        # Mock monitoring config query (enabled with next_run_at)
-        mock_config_result = MagicMock()
-        mock_config_result.scalar_one_or_none.return_value = sample_monitoring_config
+        _mark_stale_caches_on_bulk_write(state)
+        session.commit()
         
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_total_result,
-            mock_status_result,
-            mock_severity_result,
-            mock_scan_result,
-            mock_config_result,
-        ])
+        assert _SUMMARY_CACHE_KEY in _summary_cache
+
+
+    @pytest.mark.asyncio
+    async def test_get_summary_uses_driver_connection_on_postgresql(self, mock_db_session):
+        """Test that PostgreSQL sessions fetch the counters from asyncpg directly."""
+        from app.routers.dashboard import _SUMMARY_SQLS
+        
+        summary_row = _summary_results(
+            [_summary_row(ViolationStatus.PENDING.value, Severity.HIGH.value, 3)],
+            total_transactions=42,
+        )[0].mappings().one()
+        driver_connection = MagicMock()
+        driver_connection.fetchrow = AsyncMock(return_value=summary_row)
+        raw_connection = MagicMock(driver_connection=driver_connection)
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+        mock_db_session.bind = MagicMock()
+        mock_db_session.bind.dialect.name = "postgresql"
+        mock_db_session.connection = AsyncMock(return_value=connection)
+        mock_db_session.execute = AsyncMock()
+        
+        response = await _get_summary(mock_db_session)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["pending_count"] == 3
+        assert data["total_transactions"] == 42
+        driver_connection.fetchrow.assert_awaited_once_with(_SUMMARY_SQLS[False])
+        mock_db_session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_summary_reads_summary_view_when_present(self, mock_db_session):
+        """Test that the transactions total is read from the materialized view."""
+        from app.routers.dashboard import _SUMMARY_QUERIES
         
-        async def override_get_db():
-            yield mock_db_session
+        mock_db_session.execute = AsyncMock(
+            side_effect=_summary_results(total_transactions=100)
+        )
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        with patch('app.routers.dashboard._has_summary_view', True):
+            response = await _get_summary(mock_db_session)
         
-        # Mock the scheduler to raise an exception (simulating unavailability)
-        with patch('app.routers.dashboard.get_monitoring_scheduler') as mock_scheduler:
-            mock_scheduler_instance = MagicMock()
-            mock_scheduler_instance.get_status.return_value = MagicMock(
-                is_enabled=False,
-                next_run_time=None,
-            )
-            mock_scheduler.return_value = mock_scheduler_instance
-            
-            try:
-                transport = ASGITransport(app=app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    response = await client.get("/api/dashboard/summary")
-                
-                assert response.status_code == status.HTTP_200_OK
-                data = response.json()
-                
-                # Should fall back to monitoring config's next_run_at
-                assert data["next_scan_at"] is not None
-            finally:
-                app.dependency_overrides.clear()
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_transactions"] == 100
+        mock_db_session.execute.assert_awaited_once_with(_SUMMARY_QUERIES[True])
 
     @pytest.mark.asyncio
-    async def test_get_summary_partial_status_counts(self, mock_db_session):
-        """Test getting summary when only some statuses have violations."""
-        # Mock total count query
-        mock_total_result = MagicMock()
-        mock_total_result.scalar.return_value = 5
-        
-        # Mock status count query - only pending and confirmed
-        mock_status_result = MagicMock()
-        status_rows = [
-            MagicMock(status=ViolationStatus.PENDING.value, count=3),
-            MagicMock(status=ViolationStatus.CONFIRMED.value, count=2),
-        ]
-        mock_status_result.__iter__ = lambda self: iter(status_rows)
+    async def test_resolve_summary_view_defaults_to_absent(self):
+        """Test that a failed existence check disables the transactions total."""
+        from app.routers.dashboard import resolve_summary_view
         
-        # Mock severity count query - only high
-        mock_severity_result = MagicMock()
-        severity_rows = [
-            MagicMock(severity=Severity.HIGH.value, count=5),
-        ]
-        mock_severity_result.__iter__ = lambda self: iter(severity_rows)
+        with patch('app.routers.dashboard.engine') as mock_engine:
+            mock_engine.connect.side_effect = OSError("connection refused")
+            
+            assert await resolve_summary_view() is False
+
+class TestSummaryQuery:
+    """Tests for the combined summary SQL."""
+
+    def test_counts_every_status_and_severity_in_one_pass(self):
+        """Test that all counters are FILTER aggregates of one statement."""
+        from app.routers.dashboard import _SUMMARY_SQLS
         
-        # Mock last scan query
-        mock_scan_result = MagicMock()
-        mock_scan_result.scalar_one_or_none.return_value = None
+        sql = _SUMMARY_SQLS[True].lower()
         
-        # Mock monitoring config query
-        mock_config_result = MagicMock()
-        mock_config_result.scalar_one_or_none.return_value = None
+        assert "group by" not in sql
+        for value in [s.value for s in ViolationStatus]:
+            assert f"filter (where dashboard_summary.status = '{value}')" in sql
+        for value in [s.value for s in Severity]:
+            assert f"filter (where dashboard_summary.severity = '{value}')" in sql
+
+    def test_last_scan_time_matches_completed_at_index(self):
+        """Test that last scan time is a max() restricted like the partial index."""
+        from app.routers.dashboard import _SUMMARY_SQLS
         
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_total_result,
-            mock_status_result,
-            mock_severity_result,
-            mock_scan_result,
-            mock_config_result,
-        ])
+        sql = _SUMMARY_SQLS[True].lower()
         
-        async def override_get_db():
-            yield mock_db_session
+        assert "max(scan_history.completed_at)" in sql
+        assert "where scan_history.completed_at is not null" in sql
+        assert "order by scan_history.completed_at" not in sql
+
+    def test_next_scan_time_read_from_monitoring_config(self):
+        """Test that the next scan time is a future next_run_at of an enabled config."""
+        from app.routers.dashboard import _SUMMARY_SQLS
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        sql = _SUMMARY_SQLS[True].lower()
         
-        with patch('app.routers.dashboard.get_monitoring_scheduler') as mock_scheduler:
-            mock_scheduler_instance = MagicMock()
-            mock_scheduler_instance.get_status.return_value = MagicMock(
-                is_enabled=False,
-                next_run_time=None,
-            )
-            mock_scheduler.return_value = mock_scheduler_instance
-            
-            try:
-                transport = ASGITransport(app=app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    response = await client.get("/api/dashboard/summary")
-                
-                assert response.status_code == status.HTTP_200_OK
-                data = response.json()
-                
-                # Check that missing statuses default to 0 (flat fields)
-                assert data["pending_count"] == 3
-                assert data["confirmed_count"] == 2
-                assert data["false_positive_count"] == 0
-                assert data["resolved_count"] == 0
-                
-                # Check that missing severities default to 0
-                assert data["by_severity"]["low"] == 0
-                assert data["by_severity"]["medium"] == 0
-                assert data["by_severity"]["high"] == 5
-                assert data["by_severity"]["critical"] == 0
-            finally:
-                app.dependency_overrides.clear()
+        assert "monitoring_config.is_enabled is true" in sql
+        assert "monitoring_config.next_run_at > now()" in sql
+
+    def test_transactions_total_read_from_summary_view(self):
+        """Test that transactions are never counted by the summary request."""
+        from app.routers.dashboard import _SUMMARY_SQLS
+        
+        assert "from dashboard_summary_mv" in _SUMMARY_SQLS[True].lower()
+        assert "dashboard_summary_mv" not in _SUMMARY_SQLS[False].lower()
+        for sql in _SUMMARY_SQLS.values():
+            assert "from transactions" not in sql.lower()
 
 
 class TestPydanticModels:
@@ -604,7 +668,6 @@ from app.routers.dashboard import (
     TrendDataPoint,
     TrendSummary,
     TrendsResponse,
-    _get_days_from_time_range,
 )
 
 
@@ -698,24 +761,30 @@ class TestTrendsPydanticModels:
         assert response.summary.current_period_total == 0
 
 
-class TestTimeRangeHelpers:
-    """Tests for time range helper functions."""
+class TestTimeRangeDays:
+    """Tests for the day counts carried by TimeRange."""
 
-    def test_get_days_from_time_range_7d(self):
+    def test_days_7d(self):
         """Test 7 days time range."""
-        assert _get_days_from_time_range(TimeRange.LAST_7_DAYS) == 7
+        assert TimeRange.LAST_7_DAYS.days == 7
 
-    def test_get_days_from_time_range_14d(self):
+    def test_days_14d(self):
         """Test 14 days time range."""
-        assert _get_days_from_time_range(TimeRange.LAST_14_DAYS) == 14
+        assert TimeRange.LAST_14_DAYS.days == 14
 
-    def test_get_days_from_time_range_30d(self):
+    def test_days_30d(self):
         """Test 30 days time range."""
-        assert _get_days_from_time_range(TimeRange.LAST_30_DAYS) == 30
+        assert TimeRange.LAST_30_DAYS.days == 30
 
-    def test_get_days_from_time_range_90d(self):
+    def test_days_90d(self):
         """Test 90 days time range."""
-        assert _get_days_from_time_range(TimeRange.LAST_90_DAYS) == 90
+        assert TimeRange.LAST_90_DAYS.days == 90
+
+    def test_lookup_by_query_value(self):
+        """Test that members are still looked up by their string value."""
+        assert TimeRange("30d") is TimeRange.LAST_30_DAYS
+        assert TimeRange.LAST_30_DAYS.value == "30d"
+        assert TimeRange.LAST_30_DAYS == "30d"
 
 
 class TestTrendIndicatorEnum:
@@ -728,46 +797,44 @@ class TestTrendIndicatorEnum:
         assert TrendIndicator.STABLE.value == "stable"
 
 
+def _session_maker_for(session):
+    """Build a get_session_maker override whose sessions are all ``session``."""
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=session)
+    session_context.__aexit__ = AsyncMock(return_value=False)
+    return lambda: MagicMock(return_value=session_context)
+
+
+def _trends_results(current_total=0, previous_total=0, resolved_total=0):
+    """Build execute() results in the order the trends endpoint queries them.
+    
+    The data points query returns no rows; the summary query returns one
+    row of conditional counts.
+    """
+    mock_data_points_result = MagicMock()
+    mock_data_points_result.tuples.return_value = []
+    
+    mock_summary_result = MagicMock()
+    mock_summary_result.one.return_value = MagicMock(
+        current_total=current_total,
+        previous_total=previous_total,
+        resolved_total=resolved_total,
+    )
+    
+    return [mock_data_points_result, mock_summary_result]
+
+
 class TestGetDashboardTrends:
     """Tests for GET /api/dashboard/trends endpoint."""
 
     @pytest.mark.asyncio
     async def test_get_trends_empty_database(self, mock_db_session):
         """Test getting trends when no violations exist."""
-        # Mock queries for data points (empty results)
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
         # Mock queries for summary (all zeros)
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 0
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 0
-        
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 0
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results())
         
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 0
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -789,39 +856,10 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_with_time_range_parameter(self, mock_db_session):
         """Test getting trends with custom time range."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 0
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 0
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results())
         
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 0
-        
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 0
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -838,39 +876,10 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_with_weekly_bucket(self, mock_db_session):
         """Test getting trends with weekly bucket."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 0
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 0
-        
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 0
-        
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 0
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results())
         
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -887,40 +896,13 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_improvement_indicator(self, mock_db_session):
         """Test trends showing improvement (fewer violations than previous period)."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
         # Current period: 5 violations, Previous period: 10 violations = -50% (improvement)
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 5
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 10
-        
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 5
-        
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 8
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results(
+            current_total=5, previous_total=10, resolved_total=8,
+        ))
         
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -940,40 +922,13 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_degradation_indicator(self, mock_db_session):
         """Test trends showing degradation (more violations than previous period)."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
         # Current period: 15 violations, Previous period: 10 violations = +50% (degradation)
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 15
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 10
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results(
+            current_total=15, previous_total=10, resolved_total=2,
+        ))
         
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 15
-        
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 2
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -993,40 +948,13 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_stable_indicator(self, mock_db_session):
         """Test trends showing stable (similar violations to previous period)."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
         # Current period: 10 violations, Previous period: 10 violations = 0% (stable)
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 10
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results(
+            current_total=10, previous_total=10, resolved_total=10,
+        ))
         
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 10
-        
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 10
-        
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 10
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -1046,40 +974,13 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_no_previous_period_data(self, mock_db_session):
         """Test trends when previous period has no violations."""
-        # Mock queries
-        mock_new_violations_result = MagicMock()
-        mock_new_violations_result.__iter__ = lambda self: iter([])
-        
-        mock_resolved_violations_result = MagicMock()
-        mock_resolved_violations_result.__iter__ = lambda self: iter([])
-        
         # Current period: 5 violations, Previous period: 0 violations
-        mock_current_count = MagicMock()
-        mock_current_count.scalar.return_value = 5
-        
-        mock_previous_count = MagicMock()
-        mock_previous_count.scalar.return_value = 0
-        
-        mock_new_count = MagicMock()
-        mock_new_count.scalar.return_value = 5
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results(
+            current_total=5,
+        ))
         
-        mock_resolved_count = MagicMock()
-        mock_resolved_count.scalar.return_value = 0
-        
-        mock_db_session.execute = AsyncMock(side_effect=[
-            mock_new_violations_result,
-            mock_resolved_violations_result,
-            mock_current_count,
-            mock_previous_count,
-            mock_new_count,
-            mock_resolved_count,
-        ])
-        
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -1098,14 +999,299 @@ class TestGetDashboardTrends:
         finally:
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_get_trends_summary_counts_in_one_query(self, mock_db_session):
+        """Test that the summary counts come from a single conditional aggregate."""
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results(
+            current_total=7, previous_total=4, resolved_total=3,
+        ))
+        
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/dashboard/trends")
+            
+            assert response.status_code == status.HTTP_200_OK
+            summary = response.json()["summary"]
+            
+            assert summary["total_new_violations"] == summary["current_period_total"] == 7
+            assert summary["total_resolved_violations"] == 3
+            assert mock_db_session.execute.await_count == 2
+            
+            summary_sql = str(mock_db_session.execute.await_args_list[-1].args[0]).lower()
+            assert summary_sql.count("filter (where") == 3
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_trend_summary_steady_rate_is_stable(self):
+        """Test that equal daily counts give equal-length windows and no change."""
+        from sqlalchemy import create_engine, insert
+        
+        from app.models.daily_violation_count import DailyViolationCount
+        from app.routers.dashboard import TrendIndicator, _calculate_trend_summary
+        
+        engine = create_engine("sqlite://")
+        DailyViolationCount.__table__.create(engine)
+        now = datetime(2026, 3, 16, 12, tzinfo=timezone.utc)
+        with engine.connect() as connection:
+            connection.execute(
+                insert(DailyViolationCount),
+                [
+                    {"day": (now - timedelta(days=offset)).date(), "new_count": 10, "resolved_count": 1}
+                    for offset in range(30)
+                ],
+            )
+            session = MagicMock()
+            session.execute = AsyncMock(side_effect=connection.execute)
+            
+            current_start = now - timedelta(days=7)
+            summary = await _calculate_trend_summary(
+                session,
+                current_start,
+                now,
+                current_start - timedelta(days=7),
+                current_start,
+            )
+        
+        assert summary.current_period_total == summary.previous_period_total == 70
+        assert summary.total_resolved_violations == 7
+        assert summary.percentage_change == 0.0
+        assert summary.trend_indicator == TrendIndicator.STABLE
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bucket_value", ["daily", "weekly"])
+    async def test_trend_data_points_add_up_to_summary(self, bucket_value):
+        """Test that the chart's buckets cover exactly the summary's current period."""
+        from sqlalchemy import create_engine, insert, select
+        
+        from app.models.daily_violation_count import DailyViolationCount
+        from app.routers.dashboard import (
+            TrendBucket,
+            _calculate_trend_summary,
+            _get_trend_data_points,
+        )
+        
+        bucket = TrendBucket(bucket_value)
+        engine = create_engine("sqlite://")
+        DailyViolationCount.__table__.create(engine)
+        now = datetime(2026, 3, 18, 12, tzinfo=timezone.utc)  # a Wednesday
+        current_start = now - timedelta(days=7)
+        with engine.connect() as connection:
+            # Distinct daily counts, so a day counted twice or missed shows up
+            connection.execute(
+                insert(DailyViolationCount),
+                [
+                    {
+                        "day": (now - timedelta(days=offset)).date(),
+                        "new_count": offset + 1,
+                        "resolved_count": 2 * offset + 1,
+                    }
+                    for offset in range(30)
+                ],
+            )
+            
+            def execute(statement):
+                if "bucket" not in statement.selected_columns.keys():
+                    return connection.execute(statement)
+                # SQLite has no date_trunc, so run the data points query's
+                # own filter and bucket its days here
+                days = connection.execute(
+                    select(
+                        DailyViolationCount.day,
+                        DailyViolationCount.new_count,
+                        DailyViolationCount.resolved_count,
+                    ).where(statement.whereclause)
+                ).all()
+                result = MagicMock()
+                result.tuples.return_value = [
+                    (
+                        day - timedelta(days=day.weekday()) if bucket == TrendBucket.WEEKLY else day,
+                        new_count,
+                        resolved_count,
+                    )
+                    for day, new_count, resolved_count in days
+                ]
+                return result
+            
+            session = MagicMock()
+            session.execute = AsyncMock(side_effect=execute)
+            
+            data_points = await _get_trend_data_points(session, current_start, now, bucket)
+            summary = await _calculate_trend_summary(
+                session,
+                current_start,
+                now,
+                current_start - timedelta(days=7),
+                current_start,
+            )
+        
+        assert sum(p.new_violations for p in data_points) == summary.current_period_total
+        assert sum(p.resolved_violations for p in data_points) == summary.total_resolved_violations
+        if bucket == TrendBucket.DAILY:
+            assert [p.date for p in data_points][0] == "2026-03-12"
+            assert len(data_points) == 7
+
+    @pytest.mark.asyncio
+    async def test_get_trends_queries_in_separate_sessions(self, mock_db_session):
+        """Test that the concurrent data points and summary queries do not share a session."""
+        mock_db_session.execute = AsyncMock(side_effect=_trends_results())
+        override = _session_maker_for(mock_db_session)
+        session_maker = override()
+        
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = lambda: session_maker
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/dashboard/trends")
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert session_maker.call_count == 2
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_trends_is_cached_per_range_and_bucket(self, mock_db_session):
+        """Test that repeated calls with the same parameters are served from the cache."""
+        mock_db_session.execute = AsyncMock(
+            side_effect=[*_trends_results(current_total=3), *_trends_results()]
+        )
+        
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await client.get("/api/dashboard/trends")
+                second = await client.get("/api/dashboard/trends")
+                weekly = await client.get("/api/dashboard/trends?bucket=weekly")
+            
+            assert second.json() == first.json()
+            assert first.json()["summary"]["current_period_total"] == 3
+            assert weekly.json()["bucket"] == "weekly"
+            assert mock_db_session.execute.await_count == 4
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_trends_recomputed_after_invalidation(self, mock_db_session):
+        """Test that invalidating the trends cache forces fresh queries."""
+        mock_db_session.execute = AsyncMock(
+            side_effect=[*_trends_results(current_total=3), *_trends_results(current_total=4)]
+        )
+        
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/api/dashboard/trends")
+                invalidate_trends_cache()
+                response = await client.get("/api/dashboard/trends")
+            
+            assert response.json()["summary"]["current_period_total"] == 4
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_register_trends_cache_invalidation_is_idempotent(self):
+        """Test that the trends invalidation listeners are registered only once."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+        
+        register_trends_cache_invalidation()
+        register_trends_cache_invalidation()
+        
+        assert event.contains(Session, "after_commit", _invalidate_stale_caches_on_commit)
+
+    def test_violation_write_invalidates_trends_cache_on_commit(self):
+        """Test that a bulk violation INSERT drops every trends entry once committed."""
+        from sqlalchemy.orm import Session
+        
+        from app.routers.dashboard import _trends_cache
+        
+        register_trends_cache_invalidation()
+        _trends_cache["7d", "daily"] = b"{}"
+        session = Session()
+        state = MagicMock(is_insert=True, is_update=False, is_delete=False, session=session)
+        state.bind_mapper.class_ = Violation
+        
+        _mark_stale_caches_on_bulk_write(state)
+        
+        assert _trends_cache
+        session.commit()
+        assert not _trends_cache
+
+    @pytest.mark.asyncio
+    async def test_trend_data_points_use_sql_buckets(self, mock_db_session):
+        """Test that weekly buckets come from one date_trunc query without re-bucketing."""
+        from app.routers.dashboard import TrendBucket, _get_trend_data_points
+        
+        week_start = date(2026, 3, 2)  # a Monday
+        result = MagicMock()
+        result.tuples.return_value = [(week_start, 6, 2)]
+        mock_db_session.execute = AsyncMock(return_value=result)
+        
+        data_points = await _get_trend_data_points(
+            mock_db_session,
+            datetime(2026, 3, 4, 12, tzinfo=timezone.utc),
+            datetime(2026, 3, 16, 12, tzinfo=timezone.utc),
+            TrendBucket.WEEKLY,
+        )
+        
+        assert [p.date for p in data_points] == ["2026-03-02", "2026-03-09", "2026-03-16"]
+        assert data_points[0].new_violations == 6
+        assert data_points[0].resolved_violations == 2
+        assert data_points[1].new_violations == 0
+        
+        mock_db_session.execute.assert_awaited_once()
+        sql = str(mock_db_session.execute.await_args.args[0]).lower()
+        # Buckets are summed from the daily rollup, not the violations table
+        assert "from daily_violation_counts" in sql
+        assert "violations.detected_at" not in sql
+        # Days are truncated as naive timestamps, not in the session TimeZone
+        pg_sql = str(
+            mock_db_session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        ).lower()
+        assert (
+            "group by cast(date_trunc('week', cast(daily_violation_counts.day as timestamp without time zone)) as date)"
+            in pg_sql
+        )
+
+    @pytest.mark.asyncio
+    async def test_trend_data_points_accumulate_by_bucket_index(self, mock_db_session):
+        """Test that rows are placed by their offset from the first bucket."""
+        from app.routers.dashboard import TrendBucket, _get_trend_data_points
+        
+        result = MagicMock()
+        result.tuples.return_value = [
+            (date(2026, 3, 4), 1, 0),
+            (date(2026, 3, 11), 2, 1),
+            (date(2026, 3, 12), 3, 0),
+        ]
+        mock_db_session.execute = AsyncMock(return_value=result)
+        
+        data_points = await _get_trend_data_points(
+            mock_db_session,
+            datetime(2026, 3, 4, 12, tzinfo=timezone.utc),
+            datetime(2026, 3, 16, 12, tzinfo=timezone.utc),
+            TrendBucket.WEEKLY,
+        )
+        
+        assert [p.new_violations for p in data_points] == [1, 5, 0]
+        assert [p.resolved_violations for p in data_points] == [0, 1, 0]
+
     @pytest.mark.asyncio
     async def test_get_trends_invalid_time_range(self, mock_db_session):
         """Test getting trends with invalid time range parameter."""
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -1120,11 +1306,8 @@ class TestGetDashboardTrends:
     @pytest.mark.asyncio
     async def test_get_trends_invalid_bucket(self, mock_db_session):
         """Test getting trends with invalid bucket parameter."""
-        async def override_get_db():
-            yield mock_db_session
-        
-        from app.database import get_db
-        app.dependency_overrides[get_db] = override_get_db
+        from app.database import get_session_maker
+        app.dependency_overrides[get_session_maker] = _session_maker_for(mock_db_session)
         
         try:
             transport = ASGITransport(app=app)
@@ -0,0 +1,77 @@
+"""Unit tests for database engine and column type configuration."""
+
+import uuid
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+import app.models  # noqa: F401  (registers the models on Base.metadata)
+from app.database import Base
+from app.models import ComplianceRule, Policy, Violation
+
+
+def _uuid_columns():
+    return [
+        column
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if column.type.__visit_name__ == "UUID"
+    ]
+
+
+class TestUUIDColumns:
+    """UUID columns should use asyncpg's native codec without Python processing."""
+
+    def test_models_have_uuid_columns(self):
+        """Test that the model metadata contains UUID columns to check."""
+        assert _uuid_columns()
+
+    @pytest.mark.parametrize("column", _uuid_columns(), ids=str)
+    def test_no_python_uuid_processing(self, column):
+        """Test that asyncpg UUID values are bound and returned as-is."""
+        dialect = asyncpg_dialect()
+        impl = column.type.dialect_impl(dialect)
+        
+        assert impl.bind_processor(dialect) is None
+        assert impl.result_processor(dialect, None) is None
+
+
+class TestModelRepr:
+    """Model reprs should only use attributes that are already loaded."""
+
+    def test_repr_skips_unset_attributes(self):
+        """Test that an unflushed model without an id has a short repr."""
+        violation = Violation(record_identifier="42")
+        
+        assert repr(violation) == "<Violation record_identifier=42>"
+
+    def test_repr_formats_uuid_as_hex(self):
+        """Test that the id is rendered from its integer value."""
+        violation_id = uuid.uuid4()
+        violation = Violation(id=violation_id, record_identifier="42", status="pending")
+        
+        assert repr(violation) == (
+            f"<Violation id={violation_id.hex} record_identifier=42 status=pending>"
+        )
+
+
+class TestRelationshipLoading:
+    """Policies and rules must not lazy-load inside async handlers."""
+
+    @pytest.mark.parametrize(
+        "relationship",
+        [
+            *ComplianceRule.__mapper__.relationships,
+            *Policy.__mapper__.relationships,
+        ],
+        ids=str,
+    )
+    def test_relationships_raise_on_sql(self, relationship):
+        """Test that a relationship access never issues a hidden per-row query."""
+        assert relationship.lazy == "raise_on_sql"
+
+    def test_policy_rules_deleted_by_database_cascade(self):
+        """Test that deleting a policy leaves its rules to ON DELETE CASCADE."""
+        assert Policy.rules.property.passive_deletes is True
+        (policy_fk,) = ComplianceRule.__table__.c.policy_id.foreign_keys
+        assert policy_fk.ondelete == "CASCADE"
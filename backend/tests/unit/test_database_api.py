@@ -1,5 +1,6 @@
 """Unit tests for the Database API endpoints."""
 
+import json
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +18,8 @@ from app.routers.database import (
     DatabaseSchemaResponse,
     TableInfoResponse,
     get_scanner_service,
+    invalidate_rules_cache,
+    invalidate_schema_cache,
 )
 from app.services.db_scanner import (
     AuthenticationError,
@@ -34,6 +37,27 @@ from app.services.db_scanner import (
 
 # Test fixtures
 
+def mock_rules_stream(rules):
+    """Mock AsyncSession.stream() for a query yielding ``rules``."""
+    async def scalars():
+        for rule in rules:
+            yield rule
+    
+    result = MagicMock()
+    result.scalars = MagicMock(side_effect=lambda: scalars())
+    return AsyncMock(return_value=result)
+
+
+@pytest.fixture(autouse=True)
+def clear_database_caches():
+    """Start and end every test with empty rules and schema caches."""
+    invalidate_rules_cache()
+    invalidate_schema_cache()
+    yield
+    invalidate_rules_cache()
+    invalidate_schema_cache()
+
+
 @pytest.fixture
 def sample_connection():
     """Create a sample database connection for testing."""
@@ -121,6 +145,9 @@ def sample_schema():
 def mock_db_session():
     """Create a mock database session."""
     session = AsyncMock()
+    # expunge is synchronous; merge hands back the instance it was given
+    session.expunge = MagicMock()
+    session.merge = AsyncMock(side_effect=lambda instance, load=True: instance)
     return session
 
 
@@ -129,6 +156,7 @@ def mock_scanner_service():
     """Create a mock database scanner service."""
     scanner = MagicMock(spec=DatabaseScannerService)
     scanner.is_connected = False
+    scanner.connection_key = ("localhost", 5432, "test_db", "test_user")
     scanner.connect = AsyncMock(return_value=True)
     scanner.get_schema = AsyncMock()
     return scanner
@@ -142,20 +170,24 @@ class TestConnectDatabase:
         self, mock_db_session, mock_scanner_service, sample_connection
     ):
         """Test successful database connection."""
+        from app.routers.database import _schema_cache
+        
         mock_scanner_service.connect = AsyncMock(return_value=True)
+        _schema_cache[("old_host", 5432, "old_db", "old_user")] = b"{}"
         
         # Mock the database query for existing connections
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
         mock_db_session.execute = AsyncMock(return_value=mock_result)
-        mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
+        # The INSERT's RETURNING fills in the server defaults at flush
+        added = []
+        mock_db_session.add = MagicMock(side_effect=added.append)
         
-        # Mock refresh to set the ID and created_at
-        async def mock_refresh(obj):
-            obj.id = sample_connection.id
-            obj.created_at = sample_connection.created_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+        async def mock_flush():
+            for obj in added:
+                obj.id = sample_connection.id
+                obj.created_at = sample_connection.created_at
+        mock_db_session.flush = AsyncMock(side_effect=mock_flush)
         
         async def override_get_db():
             yield mock_db_session
@@ -192,6 +224,10 @@ class TestConnectDatabase:
             
             # Verify scanner.connect was called
             mock_scanner_service.connect.assert_called_once()
+            # A schema cached for the previous connection is dropped
+            assert len(_schema_cache) == 0
+            # created_at came back with the INSERT, so no reload is needed
+            mock_db_session.refresh.assert_not_awaited()
         finally:
             app.dependency_overrides.clear()
 
@@ -202,27 +238,16 @@ class TestConnectDatabase:
         """Test that connecting deactivates existing active connections."""
         mock_scanner_service.connect = AsyncMock(return_value=True)
         
-        # Create an existing active connection
-        existing_connection = DatabaseConnection(
-            host="old_host",
-            port=5432,
-            database_name="old_db",
-            username="old_user",
-            encrypted_password="old_password",
-            is_active=True,
-        )
-        existing_connection.id = uuid.uuid4()
+        mock_db_session.execute = AsyncMock(return_value=MagicMock())
+        # The INSERT's RETURNING fills in the server defaults at flush
+        added = []
+        mock_db_session.add = MagicMock(side_effect=added.append)
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [existing_connection]
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
-        mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
-        
-        async def mock_refresh(obj):
-            obj.id = sample_connection.id
-            obj.created_at = sample_connection.created_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+        async def mock_flush():
+            for obj in added:
+                obj.id = sample_connection.id
+                obj.created_at = sample_connection.created_at
+        mock_db_session.flush = AsyncMock(side_effect=mock_flush)
         
         async def override_get_db():
             yield mock_db_session
@@ -249,8 +274,11 @@ class TestConnectDatabase:
                 )
             
             assert response.status_code == status.HTTP_201_CREATED
-            # Verify existing connection was deactivated
-            assert existing_connection.is_active is False
+            # Existing connections are deactivated by one bulk UPDATE
+            mock_db_session.execute.assert_awaited_once()
+            sql = str(mock_db_session.execute.await_args.args[0]).lower()
+            assert sql.startswith("update database_connections set is_active=")
+            assert "where database_connections.is_active = true" in sql
         finally:
             app.dependency_overrides.clear()
 
@@ -578,6 +606,97 @@ class TestGetDatabaseSchema:
         finally:
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_get_schema_cached(self, mock_scanner_service, sample_schema):
+        """Test that repeated requests reuse the introspected schema."""
+        mock_scanner_service.is_connected = True
+        mock_scanner_service.get_schema = AsyncMock(return_value=sample_schema)
+        
+        app.dependency_overrides[get_scanner_service] = lambda: mock_scanner_service
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await client.get("/api/database/schema")
+                second = await client.get("/api/database/schema")
+            
+            assert first.status_code == status.HTTP_200_OK
+            assert second.json() == first.json()
+            mock_scanner_service.get_schema.assert_awaited_once()
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_schema_cached_per_connection(self, mock_scanner_service, sample_schema):
+        """Test that a different target database is introspected again."""
+        mock_scanner_service.is_connected = True
+        mock_scanner_service.get_schema = AsyncMock(return_value=sample_schema)
+        
+        app.dependency_overrides[get_scanner_service] = lambda: mock_scanner_service
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/api/database/schema")
+                mock_scanner_service.connection_key = ("localhost", 5432, "other_db", "test_user")
+                await client.get("/api/database/schema")
+            
+            assert mock_scanner_service.get_schema.await_count == 2
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_refresh_schema(self, mock_scanner_service, sample_schema):
+        """Test that POST /schema/refresh bypasses the cached schema."""
+        mock_scanner_service.is_connected = True
+        mock_scanner_service.get_schema = AsyncMock(return_value=sample_schema)
+        
+        app.dependency_overrides[get_scanner_service] = lambda: mock_scanner_service
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/api/database/schema")
+                response = await client.post("/api/database/schema/refresh")
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["database_name"] == "test_db"
+            assert mock_scanner_service.get_schema.await_count == 2
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_schema_stream(self, mock_scanner_service, sample_schema):
+        """Test that stream=true returns one NDJSON table per line, uncached."""
+        from app.routers.database import _schema_cache
+        
+        async def iter_schema():
+            for table in sample_schema.tables:
+                yield table
+        
+        mock_scanner_service.is_connected = True
+        mock_scanner_service.iter_schema = iter_schema
+        mock_scanner_service.get_schema = AsyncMock(return_value=sample_schema)
+        
+        app.dependency_overrides[get_scanner_service] = lambda: mock_scanner_service
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/database/schema", params={"stream": "true"})
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = response.text.splitlines()
+            assert [json.loads(line)["name"] for line in lines] == [
+                table.name for table in sample_schema.tables
+            ]
+            assert json.loads(lines[0])["columns"][0]["name"] == "id"
+            mock_scanner_service.get_schema.assert_not_awaited()
+            assert not _schema_cache
+        finally:
+            app.dependency_overrides.clear()
+
 
 class TestPydanticModels:
     """Tests for Pydantic models."""
@@ -693,6 +812,7 @@ class TestPydanticModels:
 
 
 from app.models.compliance_rule import ComplianceRule
+from app.models.policy import Policy
 from app.models.scan_history import ScanHistory
 from app.models.violation import Violation
 from app.models.enums import ScanStatus, Severity, ViolationStatus
@@ -749,23 +869,10 @@ class TestTriggerScan:
         mock_scanner_service.scan_for_violations = AsyncMock(return_value=sample_violations)
         
         # Mock database queries
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = sample_rules
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream(sample_rules)
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        # Mock refresh to set scan history fields
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -784,7 +891,6 @@ class TestTriggerScan:
             assert response.status_code == status.HTTP_200_OK
             data = response.json()
             
-            assert data["scan_id"] == str(scan_history_id)
             assert data["status"] == ScanStatus.COMPLETED.value
             assert data["total_violations"] == 4
             assert data["new_violations"] == 4
@@ -798,6 +904,22 @@ class TestTriggerScan:
             
             # Verify scan_for_violations was called
             mock_scanner_service.scan_for_violations.assert_called_once()
+            # The commit is left to get_db, after the response is sent
+            mock_db_session.commit.assert_not_awaited()
+            
+            # The scan history is added once, already in its final state
+            scan_histories = [
+                obj for (obj,), _ in mock_db_session.add.call_args_list
+                if isinstance(obj, ScanHistory)
+            ]
+            assert len(scan_histories) == 1
+            scan_history = scan_histories[0]
+            assert data["scan_id"] == str(scan_history.id)
+            assert data["started_at"] == scan_history.started_at.isoformat().replace("+00:00", "Z")
+            assert scan_history.status == ScanStatus.COMPLETED.value
+            assert scan_history.violations_found == 4
+            mock_db_session.flush.assert_not_awaited()
+            mock_db_session.refresh.assert_not_awaited()
         finally:
             app.dependency_overrides.clear()
 
@@ -832,22 +954,10 @@ class TestTriggerScan:
         mock_scanner_service.is_connected = True
         
         # Mock database queries - return empty rules
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = []
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream([])
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -870,6 +980,9 @@ class TestTriggerScan:
             assert data["total_violations"] == 0
             assert data["rules_evaluated"] == 0
             assert "No active compliance rules" in data["message"]
+            assert data["violations_by_severity"] == {
+                "low": 0, "medium": 0, "high": 0, "critical": 0,
+            }
         finally:
             app.dependency_overrides.clear()
 
@@ -881,22 +994,10 @@ class TestTriggerScan:
         mock_scanner_service.is_connected = True
         mock_scanner_service.scan_for_violations = AsyncMock(return_value=[])
         
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = sample_rules
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream(sample_rules)
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -932,22 +1033,10 @@ class TestTriggerScan:
         mock_scanner_service.scan_for_violations = AsyncMock(return_value=sample_violations[:2])
         
         # Return only first 2 rules
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = sample_rules[:2]
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream(sample_rules[:2])
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -985,22 +1074,10 @@ class TestTriggerScan:
             side_effect=DatabaseConnectionError("Connection lost during scan")
         )
         
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = sample_rules
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream(sample_rules)
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -1031,22 +1108,10 @@ class TestTriggerScan:
             side_effect=RuntimeError("Unexpected error")
         )
         
-        mock_rules_result = MagicMock()
-        mock_rules_result.scalars.return_value.all.return_value = sample_rules
-        mock_db_session.execute = AsyncMock(return_value=mock_rules_result)
+        mock_db_session.stream = mock_rules_stream(sample_rules)
         mock_db_session.add = MagicMock()
-        mock_db_session.flush = AsyncMock()
         mock_db_session.commit = AsyncMock()
         
-        scan_history_id = uuid.uuid4()
-        scan_started_at = datetime.now(timezone.utc)
-        
-        async def mock_refresh(obj):
-            if isinstance(obj, ScanHistory):
-                obj.id = scan_history_id
-                obj.started_at = scan_started_at
-        mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
-        
         async def override_get_db():
             yield mock_db_session
         
@@ -1068,6 +1133,137 @@ class TestTriggerScan:
             app.dependency_overrides.clear()
 
 
+class TestRulesCache:
+    """Tests for the active rules cache used by scans."""
+
+    @pytest.mark.asyncio
+    async def test_rules_cached_between_scans(self, mock_db_session, sample_rules):
+        """Test that a second lookup reuses the rules without a query."""
+        from app.routers.database import _get_active_rules
+        
+        mock_db_session.stream = mock_rules_stream(sample_rules)
+        
+        first = await _get_active_rules(mock_db_session, None)
+        second = await _get_active_rules(mock_db_session, None)
+        
+        assert first == sample_rules
+        assert second == sample_rules
+        mock_db_session.stream.assert_awaited_once()
+        # Cached rules are detached, and merged back into each scan's session
+        assert mock_db_session.expunge.call_count == len(sample_rules)
+        assert mock_db_session.merge.await_count == 2 * len(sample_rules)
+        mock_db_session.merge.assert_awaited_with(sample_rules[-1], load=False)
+
+    @pytest.mark.asyncio
+    async def test_rules_cached_per_rule_id_set(self, mock_db_session, sample_rules):
+        """Test that rule-ID sets are cached separately, regardless of order."""
+        from app.routers.database import _get_active_rules
+        
+        mock_db_session.stream = mock_rules_stream(sample_rules[:2])
+        rule_ids = [sample_rules[0].id, sample_rules[1].id]
+        
+        await _get_active_rules(mock_db_session, rule_ids)
+        await _get_active_rules(mock_db_session, list(reversed(rule_ids)))
+        mock_db_session.stream.assert_awaited_once()
+        
+        await _get_active_rules(mock_db_session, None)
+        assert mock_db_session.stream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rule_ids_bound_as_single_array(self, mock_db_session, sample_rules):
+        """Test that rule IDs are passed as one uuid[] parameter, not an IN list."""
+        from sqlalchemy.dialects import postgresql
+        from app.routers.database import RULES_YIELD_PER, _get_active_rules
+        
+        mock_db_session.stream = mock_rules_stream(sample_rules)
+        rule_ids = [rule.id for rule in sample_rules]
+        
+        await _get_active_rules(mock_db_session, rule_ids)
+        
+        statement, params = mock_db_session.stream.await_args.args
+        assert mock_db_session.stream.await_args.kwargs == {
+            "execution_options": {"yield_per": RULES_YIELD_PER}
+        }
+        sql = str(statement.compile(dialect=postgresql.asyncpg.dialect())).lower()
+        assert "compliance_rules.id = any (" in sql
+        assert " in (" not in sql
+        assert params == {"rule_ids": sorted(rule_ids)}
+
+    @pytest.mark.asyncio
+    async def test_rules_recomputed_after_invalidation(self, mock_db_session, sample_rules):
+        """Test that invalidating the cache forces a fresh query."""
+        from app.routers.database import _get_active_rules
+        
+        mock_db_session.stream = mock_rules_stream(sample_rules)
+        
+        await _get_active_rules(mock_db_session, None)
+        invalidate_rules_cache()
+        await _get_active_rules(mock_db_session, None)
+        
+        assert mock_db_session.stream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rules_not_cached_when_invalidated_during_query(
+        self, mock_db_session, sample_rules
+    ):
+        """Test that a query racing an invalidation does not fill the cache."""
+        from app.routers.database import _get_active_rules
+        
+        mock_db_session.stream = mock_rules_stream(sample_rules)
+        
+        async def stream_and_invalidate(*args, **kwargs):
+            invalidate_rules_cache()
+            return mock_db_session.stream.return_value
+        mock_db_session.stream.side_effect = stream_and_invalidate
+        
+        await _get_active_rules(mock_db_session, None)
+        await _get_active_rules(mock_db_session, None)
+        
+        assert mock_db_session.stream.await_count == 2
+
+    def test_register_rules_cache_invalidation(self):
+        """Test that rule flushes are wired to invalidate the cache."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+        from app.routers.database import (
+            _invalidate_rules_cache_on_bulk_write,
+            register_rules_cache_invalidation,
+        )
+        
+        register_rules_cache_invalidation()
+        register_rules_cache_invalidation()  # idempotent
+        
+        for event_name in ("after_insert", "after_update", "after_delete"):
+            assert event.contains(ComplianceRule, event_name, invalidate_rules_cache)
+        assert event.contains(
+            Session, "do_orm_execute", _invalidate_rules_cache_on_bulk_write
+        )
+
+    @pytest.mark.parametrize(
+        "model, is_update, is_delete, invalidated",
+        [
+            (ComplianceRule, True, False, True),
+            (Policy, False, True, True),
+            (ComplianceRule, False, False, False),
+            (ScanHistory, True, False, False),
+        ],
+    )
+    def test_bulk_write_invalidates_rules_cache(self, model, is_update, is_delete, invalidated):
+        """Test that UPDATE/DELETE statements on rules or policies drop the cache."""
+        from app.routers.database import (
+            _invalidate_rules_cache_on_bulk_write,
+            _rules_cache,
+        )
+        
+        _rules_cache[None] = []
+        state = MagicMock(is_update=is_update, is_delete=is_delete)
+        state.bind_mapper.class_ = model
+        
+        _invalidate_rules_cache_on_bulk_write(state)
+        
+        assert (None not in _rules_cache) is invalidated
+
+
 class TestScanPydanticModels:
     """Tests for scan-related Pydantic models."""
 
@@ -1128,3 +1324,54 @@ class TestScanPydanticModels:
         assert response.new_violations == 5
         assert response.rules_evaluated == 5
         assert response.violations_by_severity.critical == 1
+
+
+class TestResponseDocumentation:
+    """Endpoints returning pre-serialized JSON still document their models."""
+
+    @pytest.mark.parametrize(
+        "path,method,status_code,model",
+        [
+            ("/api/database/connect", "post", "201", "DatabaseConnectResponse"),
+            ("/api/database/schema", "get", "200", "DatabaseSchemaResponse"),
+            ("/api/database/schema/refresh", "post", "200", "DatabaseSchemaResponse"),
+            ("/api/database/scan", "post", "200", "ScanResponse"),
+        ],
+    )
+    def test_success_response_schema(self, path, method, status_code, model):
+        """Test that the OpenAPI success response references the response model."""
+        responses = app.openapi()["paths"][path][method]["responses"]
+        
+        schema = responses[status_code]["content"]["application/json"]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model}"}
+
+
+class TestScannerServiceSingleton:
+    """Tests for the scanner service dependency."""
+
+    def test_returns_same_instance(self):
+        """Test that every request shares one scanner, and so one pool."""
+        assert get_scanner_service() is get_scanner_service()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_create_scanner(self):
+        """Test that shutdown without a prior request doesn't build a scanner."""
+        from app.routers.database import close_scanner_service
+        
+        get_scanner_service.cache_clear()
+        
+        await close_scanner_service()
+        
+        assert get_scanner_service.cache_info().currsize == 0
+
+    @pytest.mark.asyncio
+    async def test_close_disconnects_scanner(self):
+        """Test that shutdown closes the existing scanner's pool."""
+        from app.routers.database import close_scanner_service
+        
+        scanner = get_scanner_service()
+        
+        with patch.object(scanner, "disconnect", new_callable=AsyncMock) as mock_disconnect:
+            await close_scanner_service()
+        
+        mock_disconnect.assert_awaited_once()
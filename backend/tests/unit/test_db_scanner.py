@@ -1,5 +1,7 @@
 """Unit tests for the Database Scanner Service."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -140,23 +142,30 @@ class TestDatabaseScannerService:
     def test_initial_state(self, scanner):
         """Test that scanner starts with no connection."""
         assert scanner.is_connected is False
-        assert scanner._connection is None
+        assert scanner._pool is None
         assert scanner._config is None
+        assert scanner.connection_key is None
+
+    def test_connection_key_excludes_password(self, scanner, valid_config):
+        """Test that the connection key identifies the target database."""
+        scanner._config = valid_config
+        
+        assert scanner.connection_key == ("localhost", 5432, "testdb", "user")
 
     @pytest.mark.asyncio
     async def test_connect_success(self, scanner, valid_config):
         """Test successful database connection."""
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             result = await scanner.connect(valid_config)
             
             assert result is True
             assert scanner.is_connected is True
-            mock_connect.assert_called_once_with(
+            mock_create_pool.assert_called_once_with(
                 host="localhost",
                 port=5432,
                 database="testdb",
@@ -164,6 +173,8 @@ class TestDatabaseScannerService:
                 password="pass",
                 ssl=False,
                 timeout=30,
+                min_size=2,
+                max_size=20,
             )
 
     @pytest.mark.asyncio
@@ -176,16 +187,16 @@ class TestDatabaseScannerService:
             password="pass",
             ssl=True
         )
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             await scanner.connect(config)
             
-            mock_connect.assert_called_once()
-            call_kwargs = mock_connect.call_args[1]
+            mock_create_pool.assert_called_once()
+            call_kwargs = mock_create_pool.call_args[1]
             assert call_kwargs["ssl"] == "require"
 
     @pytest.mark.asyncio
@@ -193,8 +204,8 @@ class TestDatabaseScannerService:
         """Test that invalid password raises AuthenticationError."""
         import asyncpg
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = asyncpg.InvalidPasswordError("Invalid password")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = asyncpg.InvalidPasswordError("Invalid password")
             
             with pytest.raises(AuthenticationError) as exc_info:
                 await scanner.connect(valid_config)
@@ -207,8 +218,8 @@ class TestDatabaseScannerService:
         """Test that invalid authorization raises AuthenticationError."""
         import asyncpg
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = asyncpg.InvalidAuthorizationSpecificationError("Invalid auth")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = asyncpg.InvalidAuthorizationSpecificationError("Invalid auth")
             
             with pytest.raises(AuthenticationError) as exc_info:
                 await scanner.connect(valid_config)
@@ -220,8 +231,8 @@ class TestDatabaseScannerService:
         """Test that missing database raises DatabaseNotFoundError."""
         import asyncpg
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = asyncpg.InvalidCatalogNameError("Database not found")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = asyncpg.InvalidCatalogNameError("Database not found")
             
             with pytest.raises(DatabaseNotFoundError) as exc_info:
                 await scanner.connect(valid_config)
@@ -234,8 +245,8 @@ class TestDatabaseScannerService:
         """Test that unreachable host raises HostUnreachableError."""
         import asyncpg
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = asyncpg.PostgresConnectionError("Connection refused")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = asyncpg.PostgresConnectionError("Connection refused")
             
             with pytest.raises(HostUnreachableError) as exc_info:
                 await scanner.connect(valid_config)
@@ -248,8 +259,8 @@ class TestDatabaseScannerService:
         """Test that SSL errors raise SSLError."""
         import asyncpg
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = asyncpg.PostgresConnectionError("SSL connection failed")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = asyncpg.PostgresConnectionError("SSL connection failed")
             
             with pytest.raises(SSLError) as exc_info:
                 await scanner.connect(valid_config)
@@ -260,8 +271,8 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_connect_timeout(self, scanner, valid_config):
         """Test that timeout raises ConnectionTimeoutError."""
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = TimeoutError("Connection timed out")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = TimeoutError("Connection timed out")
             
             with pytest.raises(ConnectionTimeoutError) as exc_info:
                 await scanner.connect(valid_config)
@@ -271,8 +282,8 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_connect_os_error_timeout(self, scanner, valid_config):
         """Test that OS timeout error raises ConnectionTimeoutError."""
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = OSError("Connection timed out")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = OSError("Connection timed out")
             
             with pytest.raises(ConnectionTimeoutError) as exc_info:
                 await scanner.connect(valid_config)
@@ -282,8 +293,8 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_connect_os_error_network(self, scanner, valid_config):
         """Test that OS network error raises HostUnreachableError."""
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = OSError("Network is unreachable")
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = OSError("Network is unreachable")
             
             with pytest.raises(HostUnreachableError) as exc_info:
                 await scanner.connect(valid_config)
@@ -293,38 +304,38 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_disconnect(self, scanner, valid_config):
         """Test disconnecting from database."""
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.close = AsyncMock()
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.close = AsyncMock()
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             await scanner.connect(valid_config)
             assert scanner.is_connected is True
             
             await scanner.disconnect()
             
-            mock_connection.close.assert_called_once()
-            assert scanner._connection is None
+            mock_pool.close.assert_called_once()
+            assert scanner._pool is None
 
     @pytest.mark.asyncio
     async def test_reconnect_closes_existing(self, scanner, valid_config):
         """Test that reconnecting closes existing connection first."""
-        mock_connection1 = MagicMock()
-        mock_connection1.is_closed.return_value = False
-        mock_connection1.close = AsyncMock()
+        mock_pool1 = MagicMock()
+        mock_pool1.is_closing.return_value = False
+        mock_pool1.close = AsyncMock()
         
-        mock_connection2 = MagicMock()
-        mock_connection2.is_closed.return_value = False
+        mock_pool2 = MagicMock()
+        mock_pool2.is_closing.return_value = False
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = [mock_connection1, mock_connection2]
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = [mock_pool1, mock_pool2]
             
             await scanner.connect(valid_config)
             await scanner.connect(valid_config)
             
-            mock_connection1.close.assert_called_once()
+            mock_pool1.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_schema_not_connected(self, scanner):
@@ -337,12 +348,12 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_get_schema_success(self, scanner, valid_config):
         """Test successful schema retrieval."""
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.close = AsyncMock()
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.close = AsyncMock()
         
         # Mock version query
-        mock_connection.fetchval = AsyncMock(return_value="PostgreSQL 15.0")
+        mock_pool.fetchval = AsyncMock(return_value="PostgreSQL 15.0")
         
         # Mock tables query
         tables_result = [
@@ -367,10 +378,10 @@ class TestDatabaseScannerService:
             }
         ]
         
-        mock_connection.fetch = AsyncMock(side_effect=[tables_result, columns_result])
+        mock_pool.fetch = AsyncMock(side_effect=[tables_result, columns_result])
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             await scanner.connect(valid_config)
             schema = await scanner.get_schema()
@@ -398,10 +409,10 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_get_schema_multiple_tables(self, scanner, valid_config):
         """Test schema retrieval with multiple tables."""
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.close = AsyncMock()
-        mock_connection.fetchval = AsyncMock(return_value="PostgreSQL 15.0")
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.close = AsyncMock()
+        mock_pool.fetchval = AsyncMock(return_value="PostgreSQL 15.0")
         
         tables_result = [
             {"table_schema": "public", "table_name": "users", "estimated_rows": 100},
@@ -419,12 +430,12 @@ class TestDatabaseScannerService:
              "column_default": None, "is_primary_key": False}
         ]
         
-        mock_connection.fetch = AsyncMock(
+        mock_pool.fetch = AsyncMock(
             side_effect=[tables_result, users_columns, orders_columns]
         )
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             await scanner.connect(valid_config)
             schema = await scanner.get_schema()
@@ -434,6 +445,47 @@ class TestDatabaseScannerService:
             assert schema.tables[1].name == "orders"
             assert len(schema.tables[1].columns) == 2
 
+    @pytest.mark.asyncio
+    async def test_iter_schema_not_connected(self, scanner):
+        """Test that iter_schema raises error when not connected."""
+        with pytest.raises(DatabaseConnectionError):
+            async for _ in scanner.iter_schema():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_iter_schema_yields_tables_as_read(self, scanner, valid_config):
+        """Test that each table is yielded before the next one's columns are read."""
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.close = AsyncMock()
+        
+        tables_result = [
+            {"table_schema": "public", "table_name": "users", "estimated_rows": None},
+            {"table_schema": "public", "table_name": "orders", "estimated_rows": 500}
+        ]
+        columns = [
+            {"column_name": "id", "data_type": "integer", "is_nullable": "NO",
+             "column_default": None, "is_primary_key": True}
+        ]
+        mock_pool.fetch = AsyncMock(side_effect=[tables_result, columns, columns])
+        
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
+            
+            await scanner.connect(valid_config)
+            tables = scanner.iter_schema()
+            
+            first = await anext(tables)
+            assert first.name == "users"
+            assert first.row_count is None
+            assert mock_pool.fetch.await_count == 2
+            
+            second = await anext(tables)
+            assert second.name == "orders"
+            assert second.row_count == 500
+            with pytest.raises(StopAsyncIteration):
+                await anext(tables)
+
     def test_schema_to_dict(self, scanner):
         """Test converting schema to dictionary format."""
         columns = [
@@ -457,19 +509,19 @@ class TestDatabaseScannerService:
     @pytest.mark.asyncio
     async def test_context_manager(self, valid_config):
         """Test using scanner as async context manager."""
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.close = AsyncMock()
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.close = AsyncMock()
         
-        with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_connection
+        with patch("asyncpg.create_pool", new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.return_value = mock_pool
             
             async with DatabaseScannerService() as scanner:
                 await scanner.connect(valid_config)
                 assert scanner.is_connected is True
             
             # Connection should be closed after exiting context
-            mock_connection.close.assert_called_once()
+            mock_pool.close.assert_called_once()
 
 
 class TestGetDatabaseScannerService:
@@ -1114,10 +1166,10 @@ class TestScanForViolations:
     async def test_filters_inactive_rules(self, scanner, mock_rule, mock_inactive_rule, sample_schema):
         """Test that inactive rules are filtered out."""
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(return_value=[])
-        scanner._connection = mock_connection
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[])
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
@@ -1129,86 +1181,120 @@ class TestScanForViolations:
                 await scanner.scan_for_violations([mock_rule, mock_inactive_rule], mock_session, mock_llm)
         
         # Only the active rule should have its query executed
-        assert mock_connection.fetch.call_count == 1
+        assert mock_pool.fetch.call_count == 1
 
     @pytest.mark.asyncio
     async def test_creates_violations_with_correct_fields(self, scanner, mock_rule, sample_schema):
         """Test that violations are created with all required fields."""
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(return_value=[
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[
             {"id": 1, "email": "test@example.com", "is_encrypted": False}
         ])
-        scanner._connection = mock_connection
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
         mock_session = AsyncMock()
         mock_llm = AsyncMock()
-        mock_llm.explain_violation = AsyncMock(return_value="Record is not encrypted")
-        mock_llm.suggest_remediation = AsyncMock(return_value="Enable encryption")
         
         with patch.object(scanner, "get_schema", return_value=sample_schema):
-            with patch("app.services.llm_client.get_llm_client", return_value=mock_llm):
-                with patch("app.models.violation.Violation") as MockViolation:
-                    violations = await scanner.scan_for_violations([mock_rule], mock_session, mock_llm)
-        
-        # Verify Violation was created with correct fields
-        MockViolation.assert_called_once()
-        call_kwargs = MockViolation.call_args[1]
-        assert call_kwargs["rule_id"] == mock_rule.id
-        assert call_kwargs["record_identifier"] == "1"
-        assert call_kwargs["severity"] == "high"  # Inherited from rule
-        assert call_kwargs["status"] == "pending"  # Initial status
-        assert call_kwargs["justification"] == "Record is not encrypted"
-        assert call_kwargs["remediation_suggestion"] == "Enable encryption"
+            with patch("app.services.violation_writer.bulk_insert_violations", new_callable=AsyncMock):
+                violations = await scanner.scan_for_violations([mock_rule], mock_session, mock_llm)
         
         # Verify Violation was created with correct fields
-        MockViolation.assert_called_once()
-        call_kwargs = MockViolation.call_args[1]
-        assert call_kwargs["rule_id"] == mock_rule.id
-        assert call_kwargs["record_identifier"] == "1"
-        assert call_kwargs["severity"] == "high"  # Inherited from rule
-        assert call_kwargs["status"] == "pending"  # Initial status
-        assert call_kwargs["justification"] == "Record is not encrypted"
-        assert call_kwargs["remediation_suggestion"] == "Enable encryption"
+        assert len(violations) == 1
+        violation = violations[0]
+        assert violation.id is None  # generated by the database
+        assert violation.detected_at is None
+        assert violation.rule_id == mock_rule.id
+        assert violation.record_identifier == "1"
+        assert violation.record_data == {"id": 1, "email": "test@example.com", "is_encrypted": False}
+        assert violation.severity == "high"  # Inherited from rule
+        assert violation.status == "pending"  # Initial status
+        assert mock_rule.rule_code in violation.justification
+        assert violation.remediation_suggestion
 
     @pytest.mark.asyncio
-    async def test_commits_violations_to_session(self, scanner, mock_rule, sample_schema):
-        """Test that violations are committed to the database session."""
+    async def test_bulk_inserts_violations(self, scanner, mock_rule, sample_schema):
+        """Test that violations are written in one bulk insert without committing."""
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(return_value=[
-            {"id": 1, "email": "test@example.com"}
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[
+            {"id": 1, "email": "a@example.com"},
+            {"id": 2, "email": "b@example.com"},
         ])
-        scanner._connection = mock_connection
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
         mock_session = AsyncMock()
         mock_llm = AsyncMock()
-        mock_llm.explain_violation = AsyncMock(return_value="Violation explanation")
-        mock_llm.suggest_remediation = AsyncMock(return_value="Fix it")
         
         with patch.object(scanner, "get_schema", return_value=sample_schema):
-            with patch("app.services.llm_client.get_llm_client", return_value=mock_llm):
-                with patch("app.models.violation.Violation"):
-                    await scanner.scan_for_violations([mock_rule], mock_session, mock_llm)
+            with patch(
+                "app.services.violation_writer.bulk_insert_violations", new_callable=AsyncMock
+            ) as mock_bulk_insert:
+                violations = await scanner.scan_for_violations([mock_rule], mock_session, mock_llm)
+        
+        # Verify all violations went through a single bulk insert on the session
+        mock_bulk_insert.assert_awaited_once_with(mock_session, violations)
+        assert len(violations) == 2
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copied_violations_invalidate_trends_on_commit(
+        self, scanner, mock_rule, sample_schema, monkeypatch
+    ):
+        """Test that a scan written with COPY drops the cached trends once committed."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+        
+        from app.routers.dashboard import _trends_cache, register_trends_cache_invalidation
+        from app.services import violation_writer
+        
+        monkeypatch.setattr(violation_writer, "COPY_MIN_ROWS", 1)
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[{"id": 1, "email": "a@example.com"}])
+        scanner._pool = mock_pool
+        scanner._config = MagicMock()
+        scanner._config.database = "testdb"
         
-        # Verify session.add and session.commit were called
-        assert mock_session.add.called
-        mock_session.commit.assert_called_once()
+        # A real session, so its commit fires the listeners; COPY runs on
+        # a stand-in driver connection
+        driver_conn = MagicMock()
+        driver_conn.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver_conn)
+        )
+        session = AsyncSession()
+        session.connection = AsyncMock(return_value=connection)
+        
+        register_trends_cache_invalidation()
+        _trends_cache["7d", "daily"] = b"{}"
+        try:
+            with patch.object(scanner, "get_schema", return_value=sample_schema):
+                await scanner.scan_for_violations([mock_rule], session, AsyncMock())
+            
+            driver_conn.copy_records_to_table.assert_awaited_once()
+            assert _trends_cache
+            await session.commit()
+            assert not _trends_cache
+        finally:
+            _trends_cache.clear()
 
     @pytest.mark.asyncio
     async def test_handles_query_execution_error(self, scanner, mock_rule, sample_schema):
         """Test that query execution errors are handled gracefully."""
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(side_effect=Exception("Query failed"))
-        scanner._connection = mock_connection
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(side_effect=Exception("Query failed"))
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
@@ -1237,10 +1323,10 @@ class TestScanForViolations:
         mock_rule.is_active = True
         
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(return_value=[])
-        scanner._connection = mock_connection
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[])
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
@@ -1259,10 +1345,10 @@ class TestScanForViolations:
     async def test_returns_empty_list_when_no_violations(self, scanner, mock_rule, sample_schema):
         """Test that empty list is returned when no violations found."""
         # Setup mock connection
-        mock_connection = MagicMock()
-        mock_connection.is_closed.return_value = False
-        mock_connection.fetch = AsyncMock(return_value=[])  # No violations
-        scanner._connection = mock_connection
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(return_value=[])  # No violations
+        scanner._pool = mock_pool
         scanner._config = MagicMock()
         scanner._config.database = "testdb"
         
@@ -1275,3 +1361,44 @@ class TestScanForViolations:
         
         assert violations == []
         mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rules_evaluated_concurrently_in_rule_order(self, scanner, mock_rule, sample_schema):
+        """Test that rule queries overlap and violations keep the rule order."""
+        second_rule = MagicMock()
+        second_rule.id = "223e4567-e89b-12d3-a456-426614174000"
+        second_rule.rule_code = "DATA-002"
+        second_rule.generated_sql = "SELECT id FROM orders"
+        second_rule.severity = "low"
+        second_rule.is_active = True
+        
+        # Each query waits until both are in flight, so a sequential scan
+        # would never get past the first one
+        in_flight = 0
+        both_started = asyncio.Event()
+        
+        async def fetch(sql):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            # The first rule's query finishes last
+            if sql == mock_rule.generated_sql:
+                await asyncio.sleep(0.01)
+            return [{"id": sql}]
+        
+        mock_pool = MagicMock()
+        mock_pool.is_closing.return_value = False
+        mock_pool.fetch = AsyncMock(side_effect=fetch)
+        scanner._pool = mock_pool
+        scanner._config = MagicMock()
+        scanner._config.database = "testdb"
+        
+        with patch.object(scanner, "get_schema", return_value=sample_schema):
+            with patch("app.services.violation_writer.bulk_insert_violations", new_callable=AsyncMock):
+                violations = await scanner.scan_for_violations(
+                    [mock_rule, second_rule], AsyncMock(), AsyncMock()
+                )
+        
+        assert [v.rule_id for v in violations] == [mock_rule.id, second_rule.id]
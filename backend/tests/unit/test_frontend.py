@@ -0,0 +1,75 @@
+"""Unit tests for serving the built frontend."""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+
+import app.main as main
+
+
+@pytest.fixture
+def frontend_app(tmp_path, monkeypatch):
+    """Create an app serving a fake built frontend from ``tmp_path``."""
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html><body>spa</body></html>")
+    monkeypatch.setattr(main, "FRONTEND_DIR", tmp_path)
+    return main.create_app()
+
+
+async def _get(app, path, headers=None):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers=headers or {})
+
+
+class TestServeFrontend:
+    """Tests for the SPA catch-all route."""
+
+    async def test_serves_index_with_etag(self, frontend_app):
+        """Test that client routes get index.html with an ETag."""
+        response = await _get(frontend_app, "/violations/123")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/html")
+        assert "spa" in response.text
+        assert response.headers["etag"]
+
+    async def test_not_modified_when_etag_matches(self, frontend_app):
+        """Test that a matching If-None-Match gets an empty 304."""
+        first = await _get(frontend_app, "/")
+        response = await _get(
+            frontend_app, "/", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    async def test_index_read_once(self, frontend_app, tmp_path):
+        """Test that index.html is served from memory after startup."""
+        (tmp_path / "index.html").write_text("changed")
+
+        response = await _get(frontend_app, "/")
+
+        assert "spa" in response.text
+
+    async def test_unknown_api_path_is_404(self, frontend_app):
+        """Test that unmatched API paths are not answered with the SPA."""
+        response = await _get(frontend_app, "/api/does-not-exist")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "Not Found"}
+
+    async def test_api_routes_take_precedence(self, frontend_app):
+        """Test that registered API routes are served, not the SPA."""
+        response = await _get(frontend_app, "/api")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "docs" in response.json()
+
+    async def test_non_get_is_404(self, frontend_app):
+        """Test that only GET/HEAD requests fall back to the SPA."""
+        transport = ASGITransport(app=frontend_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/violations")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,85 @@
+"""Unit tests for the ASGI middleware."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient, ASGITransport
+
+from app.database import record_query, request_queries
+from app.middleware import QUERY_BUDGETS, QueryAuditMiddleware, QueryBudgetExceeded
+
+BUDGETED_PATH = "/api/dashboard/summary"
+
+
+def _app(query_count: int, raise_on_exceeded: bool = False) -> FastAPI:
+    """Build an app whose budgeted route runs ``query_count`` queries."""
+    app = FastAPI()
+    app.add_middleware(QueryAuditMiddleware, raise_on_exceeded=raise_on_exceeded)
+
+    @app.get(BUDGETED_PATH)
+    async def budgeted() -> dict:
+        for i in range(query_count):
+            record_query(f"SELECT {i}")
+        return {"queries": len(request_queries.get())}
+
+    @app.get("/unbudgeted")
+    async def unbudgeted() -> dict:
+        for i in range(query_count):
+            record_query(f"SELECT {i}")
+        return {"queries": len(request_queries.get())}
+
+    return app
+
+
+async def _get(app: FastAPI, path: str):
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+class TestQueryAuditMiddleware:
+    """Tests for per-request query counting."""
+
+    async def test_counts_queries_per_request(self):
+        """Test that each request starts with an empty query list."""
+        app = _app(query_count=2)
+
+        first = await _get(app, BUDGETED_PATH)
+        second = await _get(app, BUDGETED_PATH)
+
+        assert first.json() == {"queries": 2}
+        assert second.json() == {"queries": 2}
+
+    async def test_not_recorded_outside_requests(self):
+        """Test that queries outside a request are ignored."""
+        record_query("SELECT 1")
+
+        assert request_queries.get() is None
+
+    async def test_over_budget_logs_warning(self, caplog):
+        """Test that exceeding a budget is logged."""
+        app = _app(query_count=QUERY_BUDGETS[BUDGETED_PATH] + 1)
+
+        with caplog.at_level(logging.WARNING, logger="app.middleware"):
+            response = await _get(app, BUDGETED_PATH)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "budget" in caplog.text
+
+    async def test_over_budget_raises_when_enabled(self):
+        """Test that exceeding a budget fails the request in debug mode."""
+        app = _app(query_count=QUERY_BUDGETS[BUDGETED_PATH] + 1, raise_on_exceeded=True)
+
+        with pytest.raises(QueryBudgetExceeded):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get(BUDGETED_PATH)
+
+    async def test_unbudgeted_path_is_not_checked(self):
+        """Test that paths without a budget never fail."""
+        app = _app(query_count=10, raise_on_exceeded=True)
+
+        response = await _get(app, "/unbudgeted")
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,86 @@
+"""Unit tests for the Migration Runner Service."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.migration_runner import (
+    STATE_COMPLETED,
+    STATE_FAILED,
+    STATE_SKIPPED,
+    MigrationRunner,
+)
+
+
+class TestMigrationRunner:
+    """Tests for running migrations in the configured mode."""
+
+    async def test_skip_mode_does_not_upgrade(self):
+        """Test that skip mode never invokes alembic."""
+        runner = MigrationRunner()
+        with patch("app.services.migration_runner.command.upgrade") as upgrade:
+            await runner.start("skip")
+
+        upgrade.assert_not_called()
+        assert runner.get_status().state == STATE_SKIPPED
+
+    async def test_sync_mode_waits_for_upgrade(self):
+        """Test that sync mode has finished migrating when start returns."""
+        runner = MigrationRunner()
+        with patch("app.services.migration_runner.command.upgrade") as upgrade:
+            await runner.start("sync")
+
+        upgrade.assert_called_once()
+        assert upgrade.call_args.args[1] == "head"
+        status = runner.get_status()
+        assert status.mode == "sync"
+        assert status.state == STATE_COMPLETED
+        assert status.completed_at is not None
+
+    async def test_async_mode_runs_in_background(self):
+        """Test that async mode returns before the upgrade completes."""
+        runner = MigrationRunner()
+        with patch("app.services.migration_runner.command.upgrade"):
+            await runner.start("async")
+            assert runner._task is not None
+            await asyncio.wait_for(runner._task, timeout=5)
+
+        assert runner.get_status().state == STATE_COMPLETED
+
+    async def test_wait_returns_after_background_run(self):
+        """Test that wait() blocks until the background upgrade has finished."""
+        runner = MigrationRunner()
+        with patch("app.services.migration_runner.command.upgrade"):
+            await runner.start("async")
+            await asyncio.wait_for(runner.wait(), timeout=5)
+
+        assert runner.get_status().state == STATE_COMPLETED
+
+    async def test_failure_is_recorded(self):
+        """Test that a failing background upgrade is reported rather than raised."""
+        runner = MigrationRunner()
+        with patch(
+            "app.services.migration_runner.command.upgrade",
+            side_effect=RuntimeError("lock timeout"),
+        ):
+            await runner.start("async")
+            await asyncio.wait_for(runner.wait(), timeout=5)
+
+        status = runner.get_status()
+        assert status.state == STATE_FAILED
+        assert "lock timeout" in status.error_message
+
+    async def test_sync_failure_fails_startup(self):
+        """Test that a failing blocking upgrade is raised after being recorded."""
+        runner = MigrationRunner()
+        with patch(
+            "app.services.migration_runner.command.upgrade",
+            side_effect=RuntimeError("lock timeout"),
+        ):
+            with pytest.raises(RuntimeError, match="lock timeout"):
+                await runner.start("sync")
+
+        status = runner.get_status()
+        assert status.state == STATE_FAILED
+        assert status.completed_at is not None
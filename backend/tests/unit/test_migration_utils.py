@@ -0,0 +1,66 @@
+"""Unit tests for data migration helpers."""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select, update
+
+from app.migration_utils import paginate
+
+
+@pytest.fixture
+def items():
+    """Create an in-memory table with 7 rows."""
+    engine = create_engine("sqlite://")
+    metadata = MetaData()
+    table = Table(
+        "items",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(20)),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), [{"id": i, "name": f"item{i}"} for i in range(1, 8)])
+    return engine, table
+
+
+class TestPaginate:
+    """Tests for keyset pagination."""
+
+    def test_pages_cover_all_rows_once(self, items):
+        """Test that pages are bounded and together return every row once."""
+        engine, table = items
+        with engine.connect() as conn:
+            pages = list(paginate(conn, select(table.c.id), table.c.id, page_size=3))
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [row.id for page in pages for row in page] == list(range(1, 8))
+
+    def test_filter_with_updates_between_pages(self, items):
+        """Test that rows updated out of the filter do not shift later pages."""
+        engine, table = items
+        seen = []
+        with engine.connect() as conn:
+            query = select(table.c.id).where(table.c.name.like("item%"))
+            for page in paginate(conn, query, table.c.id, page_size=2):
+                seen.extend(row.id for row in page)
+                conn.execute(
+                    update(table)
+                    .where(table.c.id.in_([row.id for row in page]))
+                    .values(name="done")
+                )
+
+        assert seen == list(range(1, 8))
+
+    def test_empty_query(self, items):
+        """Test that an empty result yields no pages."""
+        engine, table = items
+        with engine.connect() as conn:
+            query = select(table.c.id).where(table.c.id > 100)
+            assert list(paginate(conn, query, table.c.id)) == []
+
+    def test_invalid_page_size(self, items):
+        """Test that a non-positive page size is rejected."""
+        engine, table = items
+        with engine.connect() as conn:
+            with pytest.raises(ValueError):
+                next(paginate(conn, select(table.c.id), table.c.id, page_size=0))
@@ -22,7 +22,7 @@ from app.services.scheduler import (
 def create_test_app() -> FastAPI:
     """Create a FastAPI app for testing."""
     app = FastAPI()
-    app.include_router(router)
+    app.include_router(router, prefix="/api")
     return app
 
 
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -83,7 +84,7 @@ class TestListPolicies:
         """Test listing policies when none exist."""
         # Mock the database query to return empty list
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.mappings.return_value = []
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         with patch("app.routers.policies.get_db") as mock_get_db:
@@ -108,9 +109,18 @@ class TestListPolicies:
     @pytest.mark.asyncio
     async def test_list_policies_with_data(self, mock_db_session, sample_policy_with_rules):
         """Test listing policies with existing data."""
-        # Mock the database query to return policies
+        # Mock the database query to return policy rows with rule counts
+        policy = sample_policy_with_rules
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [sample_policy_with_rules]
+        mock_result.mappings.return_value = [
+            {
+                "id": policy.id,
+                "filename": policy.filename,
+                "status": policy.status,
+                "uploaded_at": policy.uploaded_at,
+                "rule_count": len(policy.rules),
+            }
+        ]
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -130,6 +140,47 @@ class TestListPolicies:
             assert data[0]["filename"] == "test_policy.pdf"
             assert data[0]["status"] == "completed"
             assert data[0]["rule_count"] == 2
+            
+            # Rules are counted in SQL instead of being loaded
+            sql = str(mock_db_session.execute.await_args.args[0]).lower()
+            assert "count(compliance_rules.id) as rule_count" in sql
+            assert "left outer join compliance_rules" in sql
+            assert "group by policies.id" in sql
+            assert "raw_text" not in sql
+        finally:
+            app.dependency_overrides.clear()
+
+
+    @pytest.mark.asyncio
+    async def test_list_policies_not_modified(self, mock_db_session, sample_policy):
+        """Test that an unchanged list answers 304 after the version query alone."""
+        version_result = MagicMock()
+        version_result.one.return_value = (sample_policy.uploaded_at, 1)
+        list_result = MagicMock()
+        list_result.mappings.return_value = []
+        mock_db_session.execute = AsyncMock(side_effect=[version_result, list_result, version_result])
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        from app.database import get_db
+        app.dependency_overrides[get_db] = override_get_db
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await client.get("/api/policies")
+                etag = first.headers["etag"]
+                second = await client.get("/api/policies", headers={"If-None-Match": etag})
+            
+            assert first.status_code == status.HTTP_200_OK
+            assert second.status_code == status.HTTP_304_NOT_MODIFIED
+            assert second.headers["etag"] == etag
+            assert second.content == b""
+            assert mock_db_session.execute.await_count == 3
+            sql = str(mock_db_session.execute.call_args[0][0]).lower()
+            assert "max(policies.uploaded_at)" in sql
+            assert "count(policies.id)" in sql
         finally:
             app.dependency_overrides.clear()
 
@@ -139,10 +190,32 @@ class TestGetPolicy:
 
     @pytest.mark.asyncio
     async def test_get_policy_success(self, mock_db_session, sample_policy_with_rules):
-        """Test getting a specific policy with rules."""
-        # Mock the database query to return the policy
+        """Test getting a specific policy with rules in a single query."""
+        policy = sample_policy_with_rules
+        # Mock the row: policy columns plus the rules decoded from json_agg
+        row = SimpleNamespace(
+            id=policy.id,
+            filename=policy.filename,
+            status=policy.status,
+            uploaded_at=policy.uploaded_at,
+            raw_text=policy.raw_text,
+            rules=[
+                {
+                    "id": str(rule.id),
+                    "policy_id": str(rule.policy_id),
+                    "rule_code": rule.rule_code,
+                    "description": rule.description,
+                    "evaluation_criteria": rule.evaluation_criteria,
+                    "target_table": rule.target_table,
+                    "severity": rule.severity,
+                    "is_active": rule.is_active,
+                    "created_at": rule.created_at.isoformat(),
+                }
+                for rule in policy.rules
+            ],
+        )
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_policy_with_rules
+        mock_result.one_or_none.return_value = row
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -164,15 +237,69 @@ class TestGetPolicy:
             assert len(data["rules"]) == 2
             assert data["rules"][0]["rule_code"] == "DATA-001"
             assert data["rules"][1]["rule_code"] == "DATA-002"
+            assert data["rules"][0]["id"] == str(policy.rules[0].id)
+            
+            mock_db_session.execute.assert_awaited_once()
+            sql = str(mock_db_session.execute.call_args[0][0]).lower()
+            assert "json_agg(json_build_object(" in sql
+            assert "join" not in sql
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_policy_not_modified(self, mock_db_session, sample_policy):
+        """Test that a matching If-None-Match skips resending the policy."""
+        row = SimpleNamespace(
+            id=sample_policy.id,
+            filename=sample_policy.filename,
+            status=sample_policy.status,
+            uploaded_at=sample_policy.uploaded_at,
+            raw_text=sample_policy.raw_text,
+            rules=[],
+        )
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = row
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        from app.database import get_db
+        app.dependency_overrides[get_db] = override_get_db
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                url = f"/api/policies/{sample_policy.id}"
+                first = await client.get(url)
+                second = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+                row.rules = [{
+                    "id": str(uuid.uuid4()),
+                    "policy_id": str(sample_policy.id),
+                    "rule_code": "DATA-003",
+                    "description": "Toggled rule",
+                    "evaluation_criteria": "n/a",
+                    "severity": "low",
+                    "is_active": False,
+                    "created_at": sample_policy.uploaded_at.isoformat(),
+                }]
+                changed = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+            
+            assert first.status_code == status.HTTP_200_OK
+            assert first.headers["cache-control"] == "no-cache"
+            assert second.status_code == status.HTTP_304_NOT_MODIFIED
+            assert second.content == b""
+            assert changed.status_code == status.HTTP_200_OK
+            assert changed.headers["etag"] != first.headers["etag"]
         finally:
             app.dependency_overrides.clear()
 
     @pytest.mark.asyncio
     async def test_get_policy_not_found(self, mock_db_session):
         """Test getting a non-existent policy."""
-        # Mock the database query to return None
+        # Mock the database query to return no row
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.one_or_none.return_value = None
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -198,10 +325,10 @@ class TestDeletePolicy:
 
     @pytest.mark.asyncio
     async def test_delete_policy_success(self, mock_db_session, sample_policy):
-        """Test deleting an existing policy."""
-        # Mock the database query to return the policy
+        """Test deleting an existing policy with a single DELETE ... RETURNING."""
+        # Mock the DELETE to return the deleted policy's filename
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_policy
+        mock_result.scalar_one_or_none.return_value = sample_policy.filename
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         mock_db_session.delete = AsyncMock()
         
@@ -217,7 +344,12 @@ class TestDeletePolicy:
                 response = await client.delete(f"/api/policies/{sample_policy.id}")
             
             assert response.status_code == status.HTTP_204_NO_CONTENT
-            mock_db_session.delete.assert_called_once_with(sample_policy)
+            mock_db_session.execute.assert_awaited_once()
+            stmt = mock_db_session.execute.call_args[0][0]
+            assert stmt.is_dml and stmt.is_delete
+            assert "RETURNING policies.filename" in str(stmt)
+            # Rules are removed by the database cascade, not by the ORM
+            mock_db_session.delete.assert_not_awaited()
         finally:
             app.dependency_overrides.clear()
 
@@ -306,6 +438,37 @@ class TestUploadPolicy:
         finally:
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_upload_policy_missing_magic_bytes(self, mock_db_session):
+        """Test that a non-PDF upload is rejected before the parser runs."""
+        mock_parser = MagicMock()
+        mock_parser.process_policy = AsyncMock()
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        def override_get_parser():
+            return mock_parser
+        
+        from app.database import get_db
+        from app.services.policy_parser import get_policy_parser_service
+        
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_policy_parser_service] = override_get_parser
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                # Accepted content type and filename, but not a PDF
+                files = {"file": ("renamed.pdf", b"PK\x03\x04 zip archive", "application/octet-stream")}
+                response = await client.post("/api/policies/upload", files=files)
+            
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "valid PDF" in response.json()["detail"]
+            mock_parser.process_policy.assert_not_awaited()
+        finally:
+            app.dependency_overrides.clear()
+
     @pytest.mark.asyncio
     async def test_upload_policy_file_too_large(self, mock_db_session):
         """Test upload with file exceeding size limit."""
@@ -409,6 +572,27 @@ class TestUploadPolicy:
             app.dependency_overrides.clear()
 
 
+class TestResponseDocumentation:
+    """Endpoints returning pre-serialized JSON still document their models."""
+
+    @pytest.mark.parametrize(
+        "path,schema",
+        [
+            (
+                "/api/policies",
+                {"type": "array", "items": {"$ref": "#/components/schemas/PolicyResponse"}},
+            ),
+            ("/api/policies/{policy_id}", {"$ref": "#/components/schemas/PolicyDetailResponse"}),
+        ],
+    )
+    def test_success_response_schema(self, path, schema):
+        """Test that the OpenAPI success response references the response model."""
+        responses = app.openapi()["paths"][path]["get"]["responses"]
+        
+        documented = responses["200"]["content"]["application/json"]["schema"]
+        assert documented.items() >= schema.items()
+
+
 class TestPydanticModels:
     """Tests for Pydantic response models."""
 
@@ -1,6 +1,7 @@
 """Unit tests for the Policy Parser Service."""
 
 import io
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -55,15 +56,29 @@ class MockUploadFile:
     """Mock FastAPI UploadFile for testing."""
     
     def __init__(self, content: bytes, filename: str = "test.pdf"):
-        self._content = content
+        self.file = io.BytesIO(content)
         self.filename = filename
-        self._position = 0
+        self.size = len(content)
     
-    async def read(self) -> bytes:
-        return self._content
+    async def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
     
     async def seek(self, position: int) -> None:
-        self._position = position
+        self.file.seek(position)
+
+
+def mock_pdf_document(*page_texts: str) -> MagicMock:
+    """Mock a PDFium document whose pages hold the given text."""
+    pages = []
+    for text in page_texts:
+        page = MagicMock()
+        page.get_textpage.return_value.get_text_range.return_value = text
+        pages.append(page)
+    
+    document = MagicMock()
+    document.__len__.return_value = len(pages)
+    document.__iter__.side_effect = lambda: iter(pages)
+    return document
 
 
 class TestPolicyParserService:
@@ -77,57 +92,36 @@ class TestPolicyParserService:
             return PolicyParserService()
 
     @pytest.fixture
-    def mock_pdfplumber_with_text(self):
-        """Create a mock pdfplumber that returns text."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Sample policy text content"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+    def mock_pdfium_with_text(self):
+        """Create a mock PDFium that returns text."""
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Sample policy text content")
             yield mock_pdf
 
     @pytest.fixture
-    def mock_pdfplumber_empty(self):
-        """Create a mock pdfplumber that returns no text."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = None
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+    def mock_pdfium_empty(self):
+        """Create a mock PDFium that returns no text."""
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("")
             yield mock_pdf
 
     @pytest.fixture
-    def mock_pdfplumber_no_pages(self):
-        """Create a mock pdfplumber with no pages."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = []
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+    def mock_pdfium_no_pages(self):
+        """Create a mock PDFium with no pages."""
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document()
             yield mock_pdf
 
     @pytest.fixture
-    def mock_pdfplumber_corrupted(self):
-        """Create a mock pdfplumber that raises an exception."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_pdf.open.side_effect = Exception("PDF parsing error")
+    def mock_pdfium_corrupted(self):
+        """Create a mock PDFium that raises an exception."""
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.side_effect = Exception("PDF parsing error")
             yield mock_pdf
 
     # Test successful text extraction
     @pytest.mark.asyncio
-    async def test_extract_text_success(self, parser, mock_pdfplumber_with_text):
+    async def test_extract_text_success(self, parser, mock_pdfium_with_text):
         """Test successful text extraction from a valid PDF."""
         pdf_content = b"%PDF-1.4\nSome PDF content"
         upload_file = MockUploadFile(pdf_content)
@@ -135,23 +129,13 @@ class TestPolicyParserService:
         result = await parser.extract_text(upload_file)
         
         assert result == "Sample policy text content"
-        mock_pdfplumber_with_text.open.assert_called_once()
+        mock_pdfium_with_text.PdfDocument.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_extract_text_multiple_pages(self, parser):
         """Test text extraction from a multi-page PDF."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page1 = MagicMock()
-            mock_page1.extract_text.return_value = "Page 1 content"
-            mock_page2 = MagicMock()
-            mock_page2.extract_text.return_value = "Page 2 content"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page1, mock_page2]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Page 1 content", "Page 2 content")
             
             pdf_content = b"%PDF-1.4\nMulti-page PDF"
             upload_file = MockUploadFile(pdf_content)
@@ -162,6 +146,43 @@ class TestPolicyParserService:
             assert "Page 2 content" in result
             assert "\n\n" in result  # Pages should be separated
 
+    @pytest.mark.asyncio
+    async def test_extract_text_parses_spooled_upload_in_place(
+        self, parser, mock_pdfium_with_text
+    ):
+        """Test that the upload's file is parsed without reading it into memory."""
+        upload_file = MockUploadFile(b"%PDF-1.4\nSome PDF content")
+        upload_file.read = AsyncMock(wraps=upload_file.read)
+        
+        await parser.extract_text(upload_file)
+        
+        mock_pdfium_with_text.PdfDocument.assert_called_once_with(upload_file.file)
+        upload_file.read.assert_awaited_once_with(1024)
+
+    @pytest.mark.asyncio
+    async def test_extract_text_runs_off_event_loop(self, parser, mock_pdfium_with_text):
+        """Test that PDFium runs in a worker thread, not on the event loop."""
+        opened_in = []
+        pdf_obj = mock_pdfium_with_text.PdfDocument.return_value
+        
+        def record_thread(stream):
+            opened_in.append(threading.get_ident())
+            return pdf_obj
+        mock_pdfium_with_text.PdfDocument.side_effect = record_thread
+        
+        await parser.extract_text(MockUploadFile(b"%PDF-1.4\nSome PDF content"))
+        
+        assert opened_in and opened_in[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_extract_text_size_unknown(self, parser):
+        """Test that the size limit applies when the upload size is not set."""
+        upload_file = MockUploadFile(b"%PDF-1.4\n" + b"x" * (11 * 1024 * 1024))
+        upload_file.size = None
+        
+        with pytest.raises(FileTooLargeError):
+            await parser.extract_text(upload_file)
+
     # Test file size validation
     @pytest.mark.asyncio
     async def test_extract_text_file_too_large(self, parser):
@@ -199,7 +220,7 @@ class TestPolicyParserService:
 
     # Test corrupted PDF handling
     @pytest.mark.asyncio
-    async def test_extract_text_corrupted_pdf(self, parser, mock_pdfplumber_corrupted):
+    async def test_extract_text_corrupted_pdf(self, parser, mock_pdfium_corrupted):
         """Test that CorruptedPDFError is raised for corrupted PDFs."""
         pdf_content = b"%PDF-1.4\nCorrupted content"
         upload_file = MockUploadFile(pdf_content)
@@ -212,7 +233,7 @@ class TestPolicyParserService:
 
     # Test empty PDF handling
     @pytest.mark.asyncio
-    async def test_extract_text_empty_pdf_no_text(self, parser, mock_pdfplumber_empty):
+    async def test_extract_text_empty_pdf_no_text(self, parser, mock_pdfium_empty):
         """Test that EmptyPDFError is raised when PDF has no extractable text."""
         pdf_content = b"%PDF-1.4\nPDF with no text"
         upload_file = MockUploadFile(pdf_content)
@@ -223,7 +244,7 @@ class TestPolicyParserService:
         assert "no extractable text" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_extract_text_empty_pdf_no_pages(self, parser, mock_pdfplumber_no_pages):
+    async def test_extract_text_empty_pdf_no_pages(self, parser, mock_pdfium_no_pages):
         """Test that EmptyPDFError is raised when PDF has no pages."""
         pdf_content = b"%PDF-1.4\nPDF with no pages"
         upload_file = MockUploadFile(pdf_content)
@@ -236,16 +257,8 @@ class TestPolicyParserService:
     @pytest.mark.asyncio
     async def test_extract_text_whitespace_only(self, parser):
         """Test that EmptyPDFError is raised when PDF contains only whitespace."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "   \n\t  \n  "
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("   \n\t  \n  ")
             
             pdf_content = b"%PDF-1.4\nPDF with whitespace only"
             upload_file = MockUploadFile(pdf_content)
@@ -266,18 +279,14 @@ class TestPolicyParserServiceSync:
             mock_settings.return_value.max_pdf_size_mb = 10
             return PolicyParserService()
 
+    def test_extract_text_sync_real_pdf(self, parser):
+        """Test extraction from a real PDF with PDFium, without mocks."""
+        assert parser.extract_text_sync(MINIMAL_PDF_BYTES) == "Test content"
+
     def test_extract_text_sync_with_bytes(self, parser):
         """Test synchronous extraction with bytes input."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Extracted text"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Extracted text")
             
             pdf_content = b"%PDF-1.4\nSome content"
             result = parser.extract_text_sync(pdf_content)
@@ -286,16 +295,8 @@ class TestPolicyParserServiceSync:
 
     def test_extract_text_sync_with_file_object(self, parser):
         """Test synchronous extraction with file-like object."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Extracted text"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Extracted text")
             
             pdf_content = b"%PDF-1.4\nSome content"
             file_obj = io.BytesIO(pdf_content)
@@ -561,16 +562,8 @@ class TestProcessPolicy:
     @pytest.mark.asyncio
     async def test_process_policy_success(self, parser, mock_llm_client, mock_db_session):
         """Test successful policy processing pipeline."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Sample policy text content"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Sample policy text content")
             
             pdf_content = b"%PDF-1.4\nSome PDF content"
             upload_file = MockUploadFile(pdf_content, filename="test_policy.pdf")
@@ -614,16 +607,8 @@ class TestProcessPolicy:
         """Test that LLM errors update policy status to failed."""
         mock_llm_client.extract_rules.side_effect = ValueError("LLM parsing error")
         
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Sample policy text"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Sample policy text")
             
             pdf_content = b"%PDF-1.4\nSome PDF content"
             upload_file = MockUploadFile(pdf_content, filename="test_policy.pdf")
@@ -640,16 +625,8 @@ class TestProcessPolicy:
     @pytest.mark.asyncio
     async def test_process_policy_default_filename(self, parser, mock_llm_client, mock_db_session):
         """Test that default filename is used when not provided."""
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Sample policy text"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Sample policy text")
             
             pdf_content = b"%PDF-1.4\nSome PDF content"
             upload_file = MockUploadFile(pdf_content)
@@ -695,16 +672,8 @@ class TestProcessPolicy:
             {"rule_code": "R3", "description": "d3", "evaluation_criteria": "c3", "severity": "critical"},
         ]
         
-        with patch("app.services.policy_parser.pdfplumber") as mock_pdf:
-            mock_page = MagicMock()
-            mock_page.extract_text.return_value = "Sample policy text"
-            
-            mock_pdf_obj = MagicMock()
-            mock_pdf_obj.pages = [mock_page]
-            mock_pdf_obj.__enter__ = MagicMock(return_value=mock_pdf_obj)
-            mock_pdf_obj.__exit__ = MagicMock(return_value=False)
-            
-            mock_pdf.open.return_value = mock_pdf_obj
+        with patch("app.services.policy_parser.pdfium") as mock_pdf:
+            mock_pdf.PdfDocument.return_value = mock_pdf_document("Sample policy text")
             
             pdf_content = b"%PDF-1.4\nSome PDF content"
             upload_file = MockUploadFile(pdf_content, filename="multi_rule_policy.pdf")
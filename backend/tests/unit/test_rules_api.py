@@ -66,6 +66,14 @@ def sample_rules(sample_rule):
     return [sample_rule, rule2, rule3]
 
 
+def rule_rows(rules):
+    """Build the column rows the rules list selects for the given rules."""
+    return [
+        {name: getattr(rule, name) for name in RuleResponse.model_fields}
+        for rule in rules
+    ]
+
+
 @pytest.fixture
 def mock_db_session():
     """Create a mock database session."""
@@ -80,7 +88,7 @@ class TestListRules:
     async def test_list_rules_empty(self, mock_db_session):
         """Test listing rules when none exist."""
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.mappings.return_value = rule_rows([])
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -103,7 +111,7 @@ class TestListRules:
     async def test_list_rules_with_data(self, mock_db_session, sample_rules):
         """Test listing rules with existing data."""
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = sample_rules
+        mock_result.mappings.return_value = rule_rows(sample_rules)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -123,6 +131,13 @@ class TestListRules:
             assert data[0]["rule_code"] == "DATA-001"
             assert data[1]["rule_code"] == "DATA-002"
             assert data[2]["rule_code"] == "DATA-003"
+            assert data[0]["id"] == str(sample_rules[0].id)
+            assert datetime.fromisoformat(data[0]["created_at"]) == sample_rules[0].created_at
+            
+            # Only the response columns are selected, not ORM entities
+            stmt = mock_db_session.execute.call_args[0][0]
+            assert [c["name"] for c in stmt.column_descriptions] == list(RuleResponse.model_fields)
+            assert all(c["entity"] is ComplianceRule for c in stmt.column_descriptions)
         finally:
             app.dependency_overrides.clear()
 
@@ -132,7 +147,7 @@ class TestListRules:
         # Return only active rules
         active_rules = [r for r in sample_rules if r.is_active]
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = active_rules
+        mock_result.mappings.return_value = rule_rows(active_rules)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -159,7 +174,7 @@ class TestListRules:
         # Return only critical rules
         critical_rules = [r for r in sample_rules if r.severity == Severity.CRITICAL.value]
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = critical_rules
+        mock_result.mappings.return_value = rule_rows(critical_rules)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -180,6 +195,28 @@ class TestListRules:
         finally:
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_list_rules_invalid_severity(self, mock_db_session):
+        """Test that an unknown severity is rejected before querying."""
+        mock_db_session.execute = AsyncMock()
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        from app.database import get_db
+        app.dependency_overrides[get_db] = override_get_db
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/rules?severity=HIGH")
+            
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "Invalid severity" in response.json()["detail"]
+            mock_db_session.execute.assert_not_awaited()
+        finally:
+            app.dependency_overrides.clear()
+
     @pytest.mark.asyncio
     async def test_list_rules_filter_by_policy_id(self, mock_db_session, sample_rules):
         """Test listing rules filtered by policy ID."""
@@ -187,7 +224,7 @@ class TestListRules:
         # Return only rules for the specific policy
         policy_rules = [r for r in sample_rules if r.policy_id == policy_id]
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = policy_rules
+        mock_result.mappings.return_value = rule_rows(policy_rules)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -208,6 +245,57 @@ class TestListRules:
         finally:
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_list_rules_pagination(self, mock_db_session, sample_rules):
+        """Test that skip and limit page the rules in a stable order."""
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = rule_rows(sample_rules[1:2])
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        from app.database import get_db
+        app.dependency_overrides[get_db] = override_get_db
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/rules?skip=1&limit=1")
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.json()) == 1
+            stmt = mock_db_session.execute.call_args[0][0]
+            assert stmt._offset == 1 and stmt._limit == 1
+            assert "ORDER BY compliance_rules.created_at DESC, compliance_rules.id DESC" in str(stmt)
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_list_rules_unbounded_by_default(self, mock_db_session):
+        """Test that an unpaged request returns every rule and oversized limits are rejected."""
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = rule_rows([])
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        
+        async def override_get_db():
+            yield mock_db_session
+        
+        from app.database import get_db
+        app.dependency_overrides[get_db] = override_get_db
+        
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/rules")
+                too_large = await client.get("/api/rules?limit=1001")
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert mock_db_session.execute.call_args[0][0]._limit is None
+            assert too_large.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        finally:
+            app.dependency_overrides.clear()
+
 
 class TestGetRule:
     """Tests for GET /api/rules/{rule_id} endpoint."""
@@ -272,8 +360,8 @@ class TestUpdateRule:
 
     @pytest.mark.asyncio
     async def test_update_rule_enable(self, mock_db_session, sample_rule):
-        """Test enabling a rule."""
-        sample_rule.is_active = False  # Start with disabled rule
+        """Test enabling a rule with a single UPDATE ... RETURNING."""
+        sample_rule.is_active = True  # Row as returned by the UPDATE
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = sample_rule
         mock_db_session.execute = AsyncMock(return_value=mock_result)
@@ -295,16 +383,22 @@ class TestUpdateRule:
                 )
             
             assert response.status_code == status.HTTP_200_OK
-            assert sample_rule.is_active is True
-            mock_db_session.flush.assert_called_once()
-            mock_db_session.refresh.assert_called_once_with(sample_rule)
+            assert response.json()["is_active"] is True
+            mock_db_session.execute.assert_awaited_once()
+            stmt = mock_db_session.execute.call_args[0][0]
+            assert stmt.is_dml and stmt.is_update
+            sql = str(stmt)
+            assert "SET is_active=:is_active" in sql
+            assert "RETURNING" in sql
+            mock_db_session.flush.assert_not_awaited()
+            mock_db_session.refresh.assert_not_awaited()
         finally:
             app.dependency_overrides.clear()
 
     @pytest.mark.asyncio
     async def test_update_rule_disable(self, mock_db_session, sample_rule):
         """Test disabling a rule."""
-        sample_rule.is_active = True  # Start with enabled rule
+        sample_rule.is_active = False  # Row as returned by the UPDATE
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = sample_rule
         mock_db_session.execute = AsyncMock(return_value=mock_result)
@@ -326,7 +420,7 @@ class TestUpdateRule:
                 )
             
             assert response.status_code == status.HTTP_200_OK
-            assert sample_rule.is_active is False
+            assert response.json()["is_active"] is False
         finally:
             app.dependency_overrides.clear()
 
@@ -382,8 +476,10 @@ class TestUpdateRule:
                 )
             
             assert response.status_code == status.HTTP_200_OK
-            # is_active should remain unchanged
+            # is_active should remain unchanged, with no UPDATE issued
             assert sample_rule.is_active == original_is_active
+            stmt = mock_db_session.execute.call_args[0][0]
+            assert stmt.is_select
         finally:
             app.dependency_overrides.clear()
 
@@ -443,3 +539,26 @@ class TestPydanticModels:
         
         request = RuleUpdateRequest()
         assert request.is_active is None
+
+
+class TestResponseDocumentation:
+    """Endpoints returning pre-serialized JSON still document their models."""
+
+    @pytest.mark.parametrize(
+        "path,method,schema",
+        [
+            (
+                "/api/rules",
+                "get",
+                {"type": "array", "items": {"$ref": "#/components/schemas/RuleResponse"}},
+            ),
+            ("/api/rules/{rule_id}", "get", {"$ref": "#/components/schemas/RuleResponse"}),
+            ("/api/rules/{rule_id}", "patch", {"$ref": "#/components/schemas/RuleResponse"}),
+        ],
+    )
+    def test_success_response_schema(self, path, method, schema):
+        """Test that the OpenAPI success response references the response model."""
+        responses = app.openapi()["paths"][path][method]["responses"]
+        
+        documented = responses["200"]["content"]["application/json"]["schema"]
+        assert documented.items() >= schema.items()
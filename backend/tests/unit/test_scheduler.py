@@ -13,9 +13,11 @@ from app.services.scheduler import (
     get_monitoring_scheduler,
     reset_monitoring_scheduler,
     SCAN_JOB_ID,
+    STATUS_CACHE_TTL_SECONDS,
     MIN_INTERVAL_MINUTES,
     MAX_INTERVAL_MINUTES,
 )
+from app.models.dashboard_summary import REFRESH_DASHBOARD_SUMMARY_MV_SQL
 from app.models.enums import ScanStatus
 
 
@@ -319,6 +321,62 @@ class TestMonitoringScheduler:
         finally:
             scheduler.shutdown()
 
+    def test_get_status_cached_within_ttl(self, scheduler):
+        """Test that polling within the TTL reuses the snapshot."""
+        with patch("app.services.scheduler.time.monotonic", return_value=100.0), \
+                patch.object(scheduler._scheduler, "get_job", return_value=None) as mock_get_job:
+            first = scheduler.get_status()
+            second = scheduler.get_status()
+        
+        assert second is first
+        mock_get_job.assert_called_once_with(SCAN_JOB_ID)
+
+    def test_get_status_refreshed_after_ttl(self, scheduler):
+        """Test that a snapshot older than the TTL is taken again."""
+        with patch("app.services.scheduler.time.monotonic") as mock_monotonic, \
+                patch.object(scheduler._scheduler, "get_job", return_value=None) as mock_get_job:
+            mock_monotonic.return_value = 100.0
+            scheduler.get_status()
+            mock_monotonic.return_value = 100.0 + STATUS_CACHE_TTL_SECONDS
+            scheduler.get_status()
+        
+        assert mock_get_job.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_status_reflects_schedule_changes_immediately(self, scheduler):
+        """Test that scheduling and cancelling drop the cached snapshot."""
+        assert scheduler.get_status().is_enabled is False
+        
+        with patch.object(scheduler, '_save_config', new_callable=AsyncMock):
+            await scheduler.schedule_scan(120)
+        assert scheduler.get_status().is_enabled is True
+        
+        with patch.object(scheduler, '_disable_config', new_callable=AsyncMock):
+            scheduler.cancel_schedule()
+        assert scheduler.get_status().is_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_save_config_uses_job_next_run_time(self):
+        """Test that the saved next_run_at is the scheduled job's next run time."""
+        scheduler = MonitoringScheduler()
+        try:
+            with patch.object(scheduler, '_save_config', new_callable=AsyncMock):
+                await scheduler.schedule_scan(120)
+            
+            session = AsyncMock()
+            session.add = MagicMock()
+            result = MagicMock()
+            result.scalar_one_or_none.return_value = None
+            session.execute.return_value = result
+            
+            await scheduler._save_config(session, 120, is_enabled=True)
+            
+            config = session.add.call_args[0][0]
+            job = scheduler._scheduler.get_job(SCAN_JOB_ID)
+            assert config.next_run_at == job.next_run_time
+        finally:
+            scheduler.shutdown()
+
 
 class TestRunScheduledScan:
     """Tests for the run_scheduled_scan method."""
@@ -439,7 +497,7 @@ class TestRunScheduledScan:
         config_result.scalar_one_or_none.return_value = mock_config
         
         mock_session.execute = AsyncMock(
-            side_effect=[db_result, rules_result, violations_result, config_result]
+            side_effect=[db_result, rules_result, violations_result, config_result, MagicMock()]
         )
         mock_session.add = MagicMock()
         mock_session.flush = AsyncMock()
@@ -464,6 +522,20 @@ class TestRunScheduledScan:
         mock_scanner.connect.assert_called_once()
         mock_scanner.scan_for_violations.assert_called_once()
         mock_scanner.disconnect.assert_called_once()
+        
+        # The dashboard's materialized view is refreshed after the scan
+        refresh_statement = mock_session.execute.await_args_list[-1].args[0]
+        assert str(refresh_statement) == REFRESH_DASHBOARD_SUMMARY_MV_SQL
+
+    @pytest.mark.asyncio
+    async def test_refresh_summary_view_failure_is_ignored(self, scheduler):
+        """Test that a failed view refresh is rolled back rather than raised."""
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=Exception("view does not exist"))
+        
+        await scheduler._refresh_summary_view(mock_session)
+        
+        mock_session.rollback.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_run_scan_with_violations(self, scheduler, mock_db_connection, mock_rule):
@@ -0,0 +1,118 @@
+"""Unit tests for the transactions bulk loader."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.transactions_loader import (
+    TRANSACTION_COLUMNS,
+    TransactionsLoadError,
+    iter_records,
+    load_transactions,
+    parse_row,
+    refresh_summary_view,
+)
+
+HEADER = (
+    "Timestamp,From Bank,Account,To Bank,Account,Amount Received,"
+    "Receiving Currency,Amount Paid,Payment Currency,Payment Format,Is Laundering\n"
+)
+ROW = "2022/09/01 00:20,010,8000EBD30,010,8000EBD30,3697.34,US Dollar,3697.34,US Dollar,Reinvestment,0\n"
+
+
+def _mock_conn(view_exists=True):
+    """Build an asyncpg connection mock with a working transaction()."""
+    conn = MagicMock()
+    conn.transaction.return_value.__aenter__ = AsyncMock()
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    conn.fetchval = AsyncMock(return_value=view_exists)
+    conn.execute = AsyncMock()
+    return conn
+
+
+class TestParseRow:
+    """Tests for converting CSV rows into native records."""
+
+    def test_parses_native_types(self):
+        """Test that fields are converted to datetime, Decimal and int."""
+        record = parse_row(ROW.strip().split(","))
+
+        assert len(record) == len(TRANSACTION_COLUMNS)
+        assert record[0] == datetime(2022, 9, 1, 0, 20, tzinfo=timezone.utc)
+        assert record[2] == "8000EBD30"
+        assert record[5] == Decimal("3697.34")
+        assert record[10] == 0
+
+    def test_wrong_field_count_raises(self):
+        """Test that a short row is rejected."""
+        with pytest.raises(TransactionsLoadError):
+            parse_row(["2022/09/01 00:20", "010"])
+
+    def test_invalid_amount_raises(self):
+        """Test that a non-numeric amount is rejected."""
+        fields = ROW.strip().split(",")
+        fields[5] = "abc"
+        with pytest.raises(TransactionsLoadError):
+            parse_row(fields)
+
+
+class TestIterRecords:
+    """Tests for streaming records from CSV lines."""
+
+    def test_skips_header(self):
+        """Test that the header row is not parsed as data."""
+        records = list(iter_records([HEADER, ROW, ROW]))
+
+        assert len(records) == 2
+
+
+class TestLoadTransactions:
+    """Tests for the binary COPY loader."""
+
+    async def test_copies_records_in_transaction(self, tmp_path):
+        """Test that the file is streamed through copy_records_to_table."""
+        csv_file = tmp_path / "trans.csv"
+        csv_file.write_text(HEADER + ROW + ROW)
+
+        copied = []
+
+        async def fake_copy(table, records, columns):
+            copied.extend(records)
+            return f"COPY {len(copied)}"
+
+        conn = _mock_conn()
+        conn.copy_records_to_table = AsyncMock(side_effect=fake_copy)
+
+        rows = await load_transactions(conn, csv_file)
+
+        assert rows == 2
+        assert len(copied) == 2
+        conn.transaction.assert_called_once()
+        args, kwargs = conn.copy_records_to_table.call_args
+        assert args[0] == "transactions"
+        assert kwargs["columns"] == TRANSACTION_COLUMNS
+
+    async def test_refreshes_summary_view_after_load(self, tmp_path):
+        """Test that the dashboard transaction total is refreshed after the copy."""
+        csv_file = tmp_path / "trans.csv"
+        csv_file.write_text(HEADER + ROW)
+
+        conn = _mock_conn()
+        conn.copy_records_to_table = AsyncMock(return_value="COPY 1")
+
+        await load_transactions(conn, csv_file)
+
+        conn.execute.assert_awaited_once_with(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_summary_mv"
+        )
+
+    async def test_refresh_skipped_before_view_exists(self):
+        """Test that loading before the view's migration does not refresh it."""
+        conn = _mock_conn(view_exists=False)
+
+        await refresh_summary_view(conn)
+
+        conn.fetchval.assert_awaited_once()
+        conn.execute.assert_not_awaited()
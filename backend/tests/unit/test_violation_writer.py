@@ -0,0 +1,137 @@
+"""Unit tests for the violation bulk writer."""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.violation import Violation
+from app.services import violation_writer
+from app.services.violation_writer import (
+    VIOLATION_COLUMNS,
+    bulk_insert_violations,
+    copy_violations,
+    violation_to_params,
+    violation_to_record,
+)
+
+
+def _violation(**overrides):
+    """Build a fully populated violation."""
+    fields = dict(
+        rule_id=uuid.uuid4(),
+        record_identifier="42",
+        record_data={"id": 42, "email": "a@example.com"},
+        justification="Record violates rule",
+        remediation_suggestion="Fix it",
+        severity="high",
+        status="pending",
+    )
+    fields.update(overrides)
+    return Violation(**fields)
+
+
+class TestViolationToRecord:
+    """Tests for converting violations into COPY records."""
+
+    def test_record_matches_columns(self):
+        """Test that records follow VIOLATION_COLUMNS order."""
+        violation = _violation()
+        record = violation_to_record(violation)
+
+        assert len(record) == len(VIOLATION_COLUMNS)
+        assert record[VIOLATION_COLUMNS.index("rule_id")] == violation.rule_id
+        assert record[VIOLATION_COLUMNS.index("severity")] == "high"
+
+    def test_server_generated_columns_are_omitted(self):
+        """Test that id and detected_at are left to the database defaults."""
+        assert "id" not in VIOLATION_COLUMNS
+        assert "detected_at" not in VIOLATION_COLUMNS
+
+    def test_record_data_is_json_text(self):
+        """Test that JSONB data is sent as JSON text."""
+        record = violation_to_record(_violation())
+
+        record_data = record[VIOLATION_COLUMNS.index("record_data")]
+        assert json.loads(record_data) == {"id": 42, "email": "a@example.com"}
+
+
+class TestViolationToParams:
+    """Tests for converting violations into INSERT parameters."""
+
+    def test_params_match_columns(self):
+        """Test that params hold every COPY column with native values."""
+        violation = _violation()
+        params = violation_to_params(violation)
+
+        assert list(params) == VIOLATION_COLUMNS
+        assert params["rule_id"] == violation.rule_id
+        assert params["record_data"] == {"id": 42, "email": "a@example.com"}
+
+
+class TestCopyViolations:
+    """Tests for the COPY path."""
+
+    async def test_copies_all_records(self):
+        """Test that all violations are sent in one COPY."""
+        conn = MagicMock()
+        conn.copy_records_to_table = AsyncMock()
+
+        rows = await copy_violations(conn, [_violation(), _violation()])
+
+        assert rows == 2
+        conn.copy_records_to_table.assert_awaited_once()
+        args, kwargs = conn.copy_records_to_table.call_args
+        assert args[0] == "violations"
+        assert kwargs["columns"] == VIOLATION_COLUMNS
+        assert len(kwargs["records"]) == 2
+
+    async def test_empty_is_noop(self):
+        """Test that nothing is sent when there are no violations."""
+        conn = MagicMock()
+        conn.copy_records_to_table = AsyncMock()
+
+        assert await copy_violations(conn, []) == 0
+        conn.copy_records_to_table.assert_not_called()
+
+
+class TestBulkInsertViolations:
+    """Tests for writing through a SQLAlchemy session."""
+
+    async def test_small_batch_uses_bulk_insert(self):
+        """Test that batches below the COPY threshold use one bulk INSERT."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.connection = AsyncMock()
+
+        rows = await bulk_insert_violations(session, [_violation(), _violation()])
+
+        assert rows == 2
+        session.execute.assert_awaited_once()
+        statement, params = session.execute.call_args.args
+        assert statement.table.name == "violations"
+        assert len(params) == 2
+        session.connection.assert_not_called()
+
+    async def test_empty_is_noop(self):
+        """Test that nothing is written when there are no violations."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        assert await bulk_insert_violations(session, []) == 0
+        session.execute.assert_not_called()
+
+    async def test_uses_session_driver_connection(self, monkeypatch):
+        """Test that COPY runs on the session's own asyncpg connection."""
+        monkeypatch.setattr(violation_writer, "COPY_MIN_ROWS", 1)
+        driver_conn = MagicMock()
+        driver_conn.copy_records_to_table = AsyncMock()
+        raw_connection = MagicMock(driver_connection=driver_conn)
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+        session = MagicMock()
+        session.connection = AsyncMock(return_value=connection)
+
+        rows = await bulk_insert_violations(session, [_violation()])
+
+        assert rows == 1
+        driver_conn.copy_records_to_table.assert_awaited_once()
@@ -188,6 +188,7 @@ class TestListViolations:
         """Test listing violations when none exist."""
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
+        mock_result.scalar_one.return_value = len([])
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -216,6 +217,7 @@ class TestListViolations:
         # First call for count, second for paginated results
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = sample_violations
+        mock_result.scalar_one.return_value = len(sample_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -233,6 +235,9 @@ class TestListViolations:
             data = response.json()
             assert len(data["items"]) == 3
             assert data["total"] == 3
+            
+            count_query = mock_db_session.execute.await_args_list[0].args[0]
+            assert "count(*)" in str(count_query)
         finally:
             app.dependency_overrides.clear()
 
@@ -242,6 +247,7 @@ class TestListViolations:
         pending_violations = [v for v in sample_violations if v.status == ViolationStatus.PENDING.value]
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = pending_violations
+        mock_result.scalar_one.return_value = len(pending_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -268,6 +274,7 @@ class TestListViolations:
         critical_violations = [v for v in sample_violations if v.severity == Severity.CRITICAL.value]
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = critical_violations
+        mock_result.scalar_one.return_value = len(critical_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -295,6 +302,7 @@ class TestListViolations:
         rule_violations = [v for v in sample_violations if v.rule_id == rule_id]
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = rule_violations
+        mock_result.scalar_one.return_value = len(rule_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -359,6 +367,7 @@ class TestListViolations:
         # Return only first 2 violations for pagination test
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = sample_violations[:2]
+        mock_result.scalar_one.return_value = len(sample_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
@@ -375,6 +384,7 @@ class TestListViolations:
             assert response.status_code == status.HTTP_200_OK
             data = response.json()
             assert len(data["items"]) == 2
+            assert data["total"] == 3
             assert data["skip"] == 0
             assert data["limit"] == 2
         finally:
@@ -387,6 +397,7 @@ class TestListViolations:
         recent_violations = [v for v in sample_violations if v.detected_at > datetime.now(timezone.utc) - timedelta(hours=3)]
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = recent_violations
+        mock_result.scalar_one.return_value = len(recent_violations)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
         
         async def override_get_db():
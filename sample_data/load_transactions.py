@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Bulk-load an IBM AML transactions CSV into the ``transactions`` table.
+
+Rows are parsed into native types and streamed with binary
+``COPY transactions FROM STDIN`` in a single transaction. Run this between
+the table-creation and index-creation migrations so the load does not pay
+per-row index maintenance:
+
+    cd backend
+    alembic upgrade add_users_table
+    python ../sample_data/load_transactions.py /path/to/HI-Small_Trans.csv
+    alembic upgrade head
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import asyncpg
+
+# Add backend to path for imports
+backend_path = Path(__file__).parent.parent / "backend"
+if backend_path.exists():
+    sys.path.insert(0, str(backend_path))
+
+from app.config import get_settings
+from app.services.transactions_loader import load_transactions
+
+
+async def load(csv_path: Path) -> int:
+    """Copy every row of ``csv_path`` into the transactions table.
+
+    Returns:
+        Number of rows loaded.
+    """
+    dsn = get_settings().database_url.replace("+asyncpg", "")
+    conn = await asyncpg.connect(dsn)
+    try:
+        return await load_transactions(conn, csv_path)
+    finally:
+        await conn.close()
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <transactions.csv>")
+        sys.exit(1)
+
+    csv_path = Path(sys.argv[1])
+    started = time.perf_counter()
+    rows = asyncio.run(load(csv_path))
+    elapsed = time.perf_counter() - started
+    print(f"Loaded {rows} transactions from {csv_path.name} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()